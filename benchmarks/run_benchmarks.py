@@ -0,0 +1,318 @@
+"""Performance benchmarks of the country converter.
+
+The benchmarks run offline on synthetic workloads derived from the bundled
+country data. For each benchmark the wall time (best and median of several
+repeats) and the peak memory allocated by Python (tracemalloc) are measured.
+Additionally, the import time of coco and the instantiation of the
+CountryConverter are recorded.
+
+Usage:
+
+    python benchmarks/run_benchmarks.py -o results.json
+    python benchmarks/run_benchmarks.py -o new.json --compare results.json
+
+Results are written as JSON (including the git commit and package versions),
+thus runs of different commits can be compared with --compare.
+"""
+
+import argparse
+import gc
+import inspect
+import json
+import logging
+import os
+import pickle
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+REPO_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPO_PATH)
+
+import country_converter as coco  # noqa: E402
+
+RESULT_FORMAT = 1
+
+# Fixed seed, all runs use the same workloads
+SEED = 42
+
+# Variations applied to names for the noisy name workloads
+_PREFIXES = ["", "", "the ", "Rep. ", "  "]
+_SUFFIXES = ["", "", " (country)", " ", ", total"]
+
+# Errors of workloads using features the benchmarked code does not have (e.g. older commits)
+_UNSUPPORTED = (AttributeError, ImportError, KeyError, TypeError, ValueError, pickle.PicklingError)
+
+
+def _noisy(name, rng):
+    """Return a variant of name with changed case, prefix and suffix."""
+    case = rng.choice([str.lower, str.upper, str.title, str])
+    return rng.choice(_PREFIXES) + case(name) + rng.choice(_SUFFIXES)
+
+
+def _country_names(cc, column):
+    return [str(name) for name in cc.data[column].dropna()]
+
+
+def _sized(size, scale):
+    return max(1, int(size * scale))
+
+
+def _workloads(scale):
+    """Get the benchmark workloads.
+
+    Returns
+    -------
+    list of tuple (name, setup)
+        setup() prepares the input (not timed) and returns the parameters
+        of the workload (dict) and the function to benchmark. It raises if
+        the workload is not supported by the benchmarked code (e.g. an older
+        commit), the workload is then skipped.
+    """
+    import pandas as pd
+
+    rng = random.Random(SEED)
+    cc = coco.CountryConverter()
+    iso3 = _country_names(cc, "ISO3")
+    names = _country_names(cc, "name_short") + _country_names(cc, "name_official")
+
+    n_codes = _sized(100000, scale)
+    codes = [rng.choice(iso3) for _ in range(n_codes)]
+    n_noisy = _sized(5000, scale)
+    noisy = [_noisy(rng.choice(names), rng) for _ in range(n_noisy)]
+    n_series = _sized(1000000, scale)
+    low_unique = pd.Series([rng.choice(names) for _ in range(n_series)])
+    high_unique = pd.Series([_noisy(rng.choice(names), rng) + f" {i}" for i in range(_sized(20000, scale))])
+    n_match = _sized(10000, scale)
+    list_a = [_noisy(rng.choice(names), rng) for _ in range(n_match)]
+    list_b = [_noisy(rng.choice(names), rng) for _ in range(n_match)]
+
+    def match():
+        # the converter to use can only be passed to match in newer versions
+        kwargs = {"coco": cc} if "coco" in inspect.signature(coco.match).parameters else {}
+        return {"list_a": n_match, "list_b": n_match}, lambda: coco.match(list_a, list_b, **kwargs)
+
+    return [
+        ("init", lambda: ({}, coco.CountryConverter)),
+        (
+            "init_un_members",
+            lambda: ({"only_UNmember": True}, lambda: coco.CountryConverter(only_UNmember=True)),
+        ),
+        ("init_data_frame", lambda: ({}, lambda: coco.CountryConverter().data)),
+        (
+            "convert_codes",
+            lambda: (
+                {"names": n_codes, "src": "ISO3", "to": "name_short"},
+                lambda: cc.convert(codes, src="ISO3", to="name_short"),
+            ),
+        ),
+        (
+            "convert_noisy_names",
+            lambda: (
+                {"names": n_noisy, "src": "regex", "to": "ISO3"},
+                lambda: cc.convert(noisy, src="regex", to="ISO3"),
+            ),
+        ),
+        (
+            "pandas_convert_low_uniqueness",
+            lambda: (
+                {"rows": n_series, "unique": int(low_unique.nunique()), "to": "ISO3"},
+                lambda: cc.pandas_convert(low_unique, to="ISO3"),
+            ),
+        ),
+        (
+            "pandas_convert_high_uniqueness",
+            lambda: (
+                {"rows": len(high_unique), "unique": int(high_unique.nunique()), "to": "ISO3"},
+                lambda: cc.pandas_convert(high_unique, to="ISO3"),
+            ),
+        ),
+        ("match", match),
+        (
+            "agg_conc_full",
+            lambda: (
+                {"original": "name_short", "aggregates": ["EU", "OECD", "continent"]},
+                lambda: coco.agg_conc("name_short", ["EU", "OECD", "continent"], coco=cc, as_dataframe="full"),
+            ),
+        ),
+        (
+            "pickle_roundtrip",
+            lambda: ({"bytes": len(pickle.dumps(cc))}, lambda: pickle.loads(pickle.dumps(cc))),
+        ),
+        (
+            "agg_conc_dict",
+            lambda: (
+                {"original": "EXIO3", "aggregates": ["EU", "OECD", "continent"]},
+                lambda: coco.agg_conc("EXIO3", ["EU", "OECD", "continent"], coco=cc, as_dataframe=False),
+            ),
+        ),
+    ]
+
+
+def measure(func, repeat):
+    """Measure wall time and peak memory of func.
+
+    The wall time is taken without tracing, the peak memory in an additional
+    run with tracemalloc.
+
+    Returns
+    -------
+    dict with 'wall_time' (best, median and all runs in seconds) and
+    'peak_memory' (bytes)
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_time": {"best": min(times), "median": statistics.median(times), "runs": times},
+        "peak_memory": peak,
+    }
+
+
+def import_time(repeat):
+    """Measure the time to import coco in a new interpreter.
+
+    Returns
+    -------
+    dict with the wall times (best/median) of the bare interpreter start and
+    of the start including 'import country_converter'
+    """
+
+    def run(code):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], check=True, cwd=REPO_PATH)
+            times.append(time.perf_counter() - start)
+        return {"best": min(times), "median": statistics.median(times)}
+
+    return {
+        "interpreter": run("pass"),
+        "import": run("import country_converter"),
+        "import_and_convert": run("import country_converter as coco; coco.convert('Austria', to='ISO3')"),
+    }
+
+
+def _metadata(scale, repeat):
+    versions = {"python": platform.python_version(), "country_converter": coco.__version__}
+    for package in ["pandas", "numpy"]:
+        try:
+            versions[package] = __import__(package).__version__
+        except ImportError:
+            pass
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_PATH, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "format": RESULT_FORMAT,
+        "commit": commit,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "versions": versions,
+        "scale": scale,
+        "repeat": repeat,
+    }
+
+
+def run_benchmarks(scale=1.0, repeat=5, select=None):
+    """Run the benchmarks.
+
+    Parameters
+    ----------
+    scale: float, optional
+        Factor for the size of the workloads (default 1.0)
+
+    repeat: int, optional
+        Number of timed runs per benchmark (default 5)
+
+    select: str, optional
+        Only run benchmarks whose name contains this string (the import
+        time counts as benchmark 'import').
+
+    Returns
+    -------
+    dict with 'metadata' and 'benchmarks' (name -> parameters and results,
+    or 'skipped'/'error' with the reason if the benchmark could not run)
+    """
+    results = {}
+    if not select or select in "import":
+        results["import"] = {"parameters": {}, **import_time(repeat)}
+    for name, setup in _workloads(scale):
+        if select and select not in name:
+            continue
+        # a failing benchmark must not abort the others (e.g. on older commits)
+        try:
+            parameters, func = setup()
+        except _UNSUPPORTED as err:
+            results[name] = {"skipped": f"{type(err).__name__}: {err}"}
+            print(f"Benchmark {name} not supported: {results[name]['skipped']}", file=sys.stderr)
+            continue
+        try:
+            results[name] = {"parameters": parameters, **measure(func, repeat)}
+        except _UNSUPPORTED as err:
+            results[name] = {"parameters": parameters, "error": f"{type(err).__name__}: {err}"}
+            print(f"Benchmark {name} failed: {results[name]['error']}", file=sys.stderr)
+    return {"metadata": _metadata(scale, repeat), "benchmarks": results}
+
+
+def compare(new, old):
+    """Return the report of the wall time ratios new/old (median)."""
+    lines = [f"{'benchmark':<34} {'old [s]':>10} {'new [s]':>10} {'ratio':>7}"]
+    for name, result in new["benchmarks"].items():
+        base = old["benchmarks"].get(name)
+        key = "import" if name == "import" else "wall_time"
+        if base is None or base.get("parameters") != result.get("parameters") or key not in base or key not in result:
+            continue
+        old_time, new_time = base[key]["median"], result[key]["median"]
+        lines.append(f"{name:<34} {old_time:>10.4f} {new_time:>10.4f} {new_time / old_time:>7.2f}")
+    return "\n".join(lines)
+
+
+def main():
+    """Command line interface of the benchmarks."""
+    parser = argparse.ArgumentParser(description="Run the country converter benchmarks.")
+    parser.add_argument("-o", "--output", help="JSON file for the results (default: print to stdout)")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare with")
+    parser.add_argument("--scale", type=float, default=1.0, help="Factor for the workload sizes (default 1.0)")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs (default 5)")
+    parser.add_argument("-k", "--select", help="Only run benchmarks containing this string")
+    args = parser.parse_args()
+
+    # names not found in the noisy workloads would flood the output
+    logging.getLogger("country_converter").setLevel(logging.ERROR)
+
+    results = run_benchmarks(scale=args.scale, repeat=args.repeat, select=args.select)
+
+    if args.output:
+        with open(args.output, "w") as result_file:
+            json.dump(results, result_file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as old_file:
+            print(compare(results, json.load(old_file)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,26 @@ Standard abbreviation for that module: coco
 from country_converter.country_converter import (
     CountryConverter,
     agg_conc,
+    apply_concordance,
+    clear_shared_converters,
     cli_output,
     convert,
     main,
     match,
+    shared_converter,
 )
 from country_converter.version import __version__
 
 __author__ = "Konstantin Stadler"
-__all__ = ["CountryConverter", "__version__", "agg_conc", "cli_output", "convert", "main", "match"]
+__all__ = [
+    "CountryConverter",
+    "__version__",
+    "agg_conc",
+    "apply_concordance",
+    "clear_shared_converters",
+    "cli_output",
+    "convert",
+    "main",
+    "match",
+    "shared_converter",
+]
@@ -0,0 +1,87 @@
+"""Generate the module with the prebuilt state of the bundled country data.
+
+The module country_converter/_bundled_data.py contains the country table and
+the lookup indexes of CountryConverter() with default arguments as plain
+Python literals. It must be regenerated after changing country_data.tsv:
+
+    python -m country_converter._bundle
+
+A module which does not match the data file (by hash) is ignored, the data
+file is then read as usual.
+"""
+
+import os
+
+from country_converter.country_converter import (
+    _SNAPSHOT_FORMAT,
+    COUNTRY_DATA_FILE,
+    CountryConverter,
+    _file_hash,
+    _load_country_table,
+)
+
+BUNDLED_MODULE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_bundled_data.py")
+
+
+def _literal(value):
+    """Python literal of value, with sorted sets for a reproducible module."""
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_literal(key)}: {_literal(item)}" for key, item in value.items()) + "}"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(_literal(item) for item in sorted(value)) + "}" if value else "set()"
+    if isinstance(value, list):
+        return "[" + ", ".join(_literal(item) for item in value) + "]"
+    if isinstance(value, tuple):
+        return "(" + ", ".join(_literal(item) for item in value) + ("," if len(value) == 1 else "") + ")"
+    return repr(value)
+
+
+def bundled_state():
+    """Build the state of CountryConverter() with default arguments from the data file."""
+    reports = []
+    columns = _load_country_table(COUNTRY_DATA_FILE, [], False, False, reports, strict=True)
+    coco = CountryConverter.__new__(CountryConverter)
+    coco._init_caches(0, False, False)
+    coco._data = None
+    coco._data_sources = None
+    coco._set_columns(columns)
+    state = coco._index_state()
+    # the trigrams are collected from sets, their order depends on the string hashes
+    trigram_index, unindexed = state["regex_index"]
+    state["regex_index"] = (dict(sorted(trigram_index.items())), unindexed)
+    return {**state, "reports": reports}
+
+
+def module_source():
+    """Source code of the module with the bundled state."""
+    state = bundled_state()
+    lines = [
+        '"""Prebuilt state of the bundled country data (see country_converter._bundle).',
+        "",
+        "Generated by 'python -m country_converter._bundle', do not edit.",
+        '"""',
+        "",
+        "from math import nan",
+        "",
+        f"FORMAT = {_SNAPSHOT_FORMAT!r}",
+        f"DATA_HASH = {_file_hash(COUNTRY_DATA_FILE)!r}",
+        "",
+        "STATE = {",
+        '    "columns": {',
+        *(f"        {col!r}: {_literal(values)}," for col, values in state["columns"].items()),
+        "    },",
+        *(f"    {key!r}: {_literal(value)}," for key, value in state.items() if key != "columns"),
+        "}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def main():
+    """Write the module with the bundled state."""
+    with open(BUNDLED_MODULE_FILE, "w", encoding="utf-8") as module_file:
+        module_file.write(module_source())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Prebuilt state of the bundled country data (see country_converter._bundle).
+
+Generated by 'python -m country_converter._bundle', do not edit.
+"""
+
+from math import nan
+
+FORMAT = 3
+DATA_HASH = 'dbd5956112655584eb9339a4da6a7ecfff719b1f9d74822a7766b01d402ec8ca'
+
+STATE = {
+    "columns": {
+        'APEC': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, 'APEC', 'APEC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, 'APEC', 'APEC', nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan, nan, nan, 'APEC', nan, nan, nan, nan, nan],
+        'BASIC': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'BASIC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'BASIC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'BASIC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'BASIC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'BRIC': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'BRIC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'BRIC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'BRIC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'BRIC', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'CC41': ['Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Australia', 'Austria', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Belgium', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Brazil', 'Rest of World', 'Rest of World', 'Rest of World', 'Bulgaria', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Canada', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'China', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Cyprus', 'Czech Republic', 'Denmark', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Estonia', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Finland', 'France', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Germany', 'Rest of World', 'Rest of World', 'Greece', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Hungary', 'Rest of World', 'India', 'Indonesia', 'Rest of World', 'Rest of World', 'Ireland', 'Rest of World', 'Rest of World', 'Italy', 'Rest of World', 'Japan', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Latvia', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Lithuania', 'Luxembourg', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Malta', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Mexico', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Netherlands', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Poland', 'Portugal', 'Rest of World', 'Rest of World', 'Rest of World', 'Romania', 'Russia', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Slovakia', 'Slovenia', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Korea', 'Rest of World', 'Spain', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Sweden', 'Rest of World', 'Rest of World', 'Taiwan', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Turkey', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Great Britain and N.I.', 'USA', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World', 'Rest of World'],
+        'CIS': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CIS', nan, nan, nan, 'CIS', nan, nan, nan, nan, 'CIS', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CIS', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CIS', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CIS', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CIS', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CIS', nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'Cecilia2050': ['RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'HI', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'BX', 'RoW', 'RoW', 'RoW', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'HI', 'RoW', 'RoW', 'RoW', 'RoW', 'BX', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'EU', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'RoW', 'RoW', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'RoW', 'BX', 'BX', 'RoW', 'RoW', 'EU', 'RoW', 'RoW', 'EU', 'RoW', 'HI', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'BX', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'HI', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'EU', 'RoW', 'RoW', 'RoW', 'EU', 'BX', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'EU', 'RoW', 'RoW', 'BX', 'RoW', 'HI', 'RoW', 'EU', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'HI', 'RoW', 'HI', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'BX', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EU', 'HI', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW'],
+        'CoE': [nan, nan, 'CoE', nan, nan, 'CoE', nan, nan, nan, nan, nan, 'CoE', nan, nan, 'CoE', 'CoE', nan, nan, nan, nan, nan, 'CoE', nan, nan, nan, nan, nan, nan, 'CoE', nan, nan, nan, nan, nan, nan, 'CoE', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CoE', nan, nan, 'CoE', 'CoE', 'CoE', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CoE', nan, nan, nan, nan, nan, 'CoE', 'CoE', nan, nan, nan, nan, nan, 'CoE', 'CoE', nan, nan, 'CoE', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CoE', 'CoE', nan, nan, nan, nan, 'CoE', nan, nan, 'CoE', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CoE', nan, nan, nan, nan, 'CoE', 'CoE', 'CoE', nan, 'CoE', nan, nan, nan, nan, nan, 'CoE', nan, nan, nan, nan, nan, nan, nan, 'CoE', 'CoE', nan, 'CoE', nan, nan, nan, nan, nan, nan, nan, 'CoE', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CoE', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CoE', 'CoE', nan, nan, nan, 'CoE', nan, nan, nan, nan, 'CoE', nan, nan, nan, 'CoE', nan, nan, nan, nan, 'CoE', 'CoE', nan, nan, nan, nan, nan, nan, 'CoE', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CoE', 'CoE', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'CoE', nan, nan, nan, nan, 'CoE', nan, 'CoE', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'Continent_7': ['Asia', 'Europe', 'Europe', 'Africa', 'Oceania', 'Europe', 'Africa', 'North America', 'Antarctica', 'North America', 'South America', 'Asia', 'North America', 'Oceania', 'Europe', 'Asia', 'North America', 'Asia', 'Asia', 'North America', 'Europe', 'Europe', 'North America', 'Africa', 'North America', 'Asia', 'South America', 'North America', 'Europe', 'Africa', 'Antarctica', 'South America', 'Asia', 'North America', 'Asia', 'Europe', 'Africa', 'Africa', 'Africa', 'Asia', 'Africa', 'North America', 'North America', 'Africa', 'Africa', 'South America', 'Asia', 'Asia', 'Asia', 'South America', 'Africa', 'Africa', 'Oceania', 'North America', 'Africa', 'Europe', 'North America', 'North America', 'Europe', 'Europe', 'Europe', 'Africa', 'North America', 'North America', 'Africa', 'South America', 'Africa', 'North America', 'Africa', 'Africa', 'Europe', 'Africa', 'Africa', 'Europe', 'South America', 'Oceania', 'Europe', 'Europe', 'South America', 'Oceania', 'Antarctica', 'Africa', 'Africa', 'Asia', 'Europe', 'Africa', 'Europe', 'Europe', 'North America', 'North America', 'North America', 'Oceania', 'North America', 'Europe', 'Africa', 'Africa', 'South America', 'North America', 'Antarctica', 'North America', 'Asia', 'Europe', 'Europe', 'Asia', 'Asia', 'Asia', 'Asia', 'Europe', 'Europe', 'Asia', 'Europe', 'North America', 'Asia', 'Europe', 'Asia', 'Asia', 'Africa', 'Oceania', 'Europe', 'Asia', 'Asia', 'Asia', 'Europe', 'Asia', 'Africa', 'Africa', 'Africa', 'Europe', 'Europe', 'Europe', 'Asia', 'Europe', 'Africa', 'Africa', 'Asia', 'Asia', 'Africa', 'Europe', 'Oceania', 'North America', 'Africa', 'Africa', 'Africa', 'North America', 'Oceania', 'Europe', 'Europe', 'Asia', 'Europe', 'North America', 'Africa', 'Africa', 'Asia', 'Africa', 'Oceania', 'Asia', 'Europe', 'Oceania', 'Oceania', 'North America', 'Africa', 'Africa', 'Oceania', 'Oceania', 'Asia', 'Oceania', 'Europe', 'Asia', 'Asia', 'Oceania', 'Asia', 'North America', 'Oceania', 'South America', 'South America', 'Asia', 'Oceania', 'Europe', 'Europe', 'North America', 'Asia', 'Africa', 'Europe', 'Europe', 'Africa', 'North America', 'Oceania', 'Europe', 'Africa', 'Asia', 'Africa', 'Europe', 'Africa', 'Africa', 'Asia', 'North America', 'Europe', 'Europe', 'Oceania', 'Africa', 'Africa', 'South America', 'Asia', 'Africa', 'Europe', 'Asia', 'North America', 'Africa', 'North America', 'North America', 'North America', 'North America', 'Africa', 'South America', 'Europe', 'Europe', 'Europe', 'Asia', 'Asia', 'Asia', 'Africa', 'Asia', 'Asia', 'Africa', 'Oceania', 'Oceania', 'North America', 'Africa', 'Asia', 'Asia', 'North America', 'Oceania', 'Africa', 'Europe', 'Asia', 'Europe', 'North America', 'Oceania', 'North America', 'South America', 'Asia', 'Oceania', 'Europe', 'South America', 'Asia', 'Oceania', 'Africa', 'Asia', 'Africa', 'Africa'],
+        'DACcode': [625, nan, 71, 130, 880, nan, 225, nan, nan, 377, 425, 610, nan, 801, 1, 611, nan, nan, 666, nan, 86, 2, 352, 236, nan, 630, 428, nan, 64, 227, nan, 431, nan, nan, nan, 72, 287, 228, 230, 728, 229, 301, nan, 231, 232, nan, 730, nan, nan, 437, 233, 234, nan, 336, 247, 62, 338, nan, 30, 68, 3, 274, 378, 340, 235, 440, 142, 342, 245, 271, 82, 280, 238, nan, nan, 832, 18, 4, nan, nan, nan, 239, 240, 612, 5, 241, nan, 40, nan, 381, nan, nan, 347, nan, 243, 244, 446, 349, nan, 351, nan, 75, 20, 645, 738, 540, 543, 21, nan, 546, 6, 354, 701, nan, 549, 613, 248, 836, 57, 552, 614, 745, 83, 555, 249, 251, 133, 70, 84, 22, nan, 66, 252, 253, 751, 655, 255, 45, 859, nan, 256, 257, nan, 358, 860, 93, nan, 753, 65, 385, 136, 259, 635, 275, 845, 660, 7, nan, 820, 364, 260, 261, 856, nan, 740, nan, 8, nan, 665, 861, 550, 366, 862, 451, 454, 755, nan, 76, 9, nan, 561, nan, 77, 87, 266, nan, nan, nan, 268, 566, 269, 63, nan, 272, nan, nan, 69, 61, 866, 273, 218, nan, 742, 279, 50, 640, nan, 276, nan, 383, nan, 384, 278, 457, nan, 10, 11, 573, 732, 615, 282, 764, 765, 283, 868, 870, nan, 139, 55, 616, nan, 872, 285, 85, 576, 12, 302, nan, nan, nan, 617, 854, nan, 463, 769, 876, nan, 580, 288, 265],
+        'EEA': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, 'EEA', 'EEA', 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, nan, nan, nan, 'EEA', 'EEA', nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', 'EEA', nan, nan, nan, nan, 'EEA', nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, nan, nan, 'EEA', 'EEA', 'EEA', nan, nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', 'EEA', nan, nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', 'EEA', nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EEA', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'EU': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU', nan, nan, nan, nan, nan, nan, 'EU', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU', nan, nan, 'EU', 'EU', 'EU', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU', nan, nan, nan, nan, nan, 'EU', 'EU', nan, nan, nan, nan, nan, nan, 'EU', nan, nan, 'EU', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU', nan, nan, nan, nan, nan, 'EU', nan, nan, 'EU', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU', nan, nan, nan, nan, nan, 'EU', 'EU', nan, nan, nan, nan, nan, nan, nan, 'EU', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU', 'EU', nan, nan, nan, 'EU', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU', 'EU', nan, nan, nan, nan, nan, nan, 'EU', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'EU12': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU12', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU12', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU12', nan, nan, nan, nan, nan, nan, 'EU12', nan, nan, 'EU12', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU12', nan, nan, 'EU12', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU12', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU12', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU12', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU12', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU12', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'EU15': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU15', 'EU15', nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU15', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'EU25': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU25', 'EU25', 'EU25', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, nan, nan, nan, 'EU25', 'EU25', nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, 'EU25', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, nan, nan, nan, 'EU25', nan, nan, 'EU25', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, nan, nan, nan, 'EU25', 'EU25', nan, nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU25', 'EU25', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU25', 'EU25', nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU25', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'EU27': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, 'EU27', 'EU27', 'EU27', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, 'EU27', 'EU27', nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, 'EU27', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, 'EU27', nan, nan, 'EU27', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, 'EU27', 'EU27', nan, nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27', 'EU27', nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27', 'EU27', nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'EU27_2007': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', 'EU27_2007', 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, 'EU27_2007', 'EU27_2007', nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, 'EU27_2007', 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', 'EU27_2007', nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', 'EU27_2007', nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU27_2007', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'EU28': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, 'EU28', 'EU28', 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, 'EU28', 'EU28', nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, 'EU28', nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, 'EU28', 'EU28', nan, nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', 'EU28', nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', 'EU28', nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'EU28', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'EURO': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1999, nan, nan, nan, nan, nan, nan, 1999, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 2023, nan, nan, 2008, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 2011, nan, nan, nan, nan, nan, 1999, 1999, nan, nan, nan, nan, nan, nan, 1999, nan, nan, 2001, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1999, nan, nan, 1999, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 2014, nan, nan, nan, nan, nan, 2015, 1999, nan, nan, nan, nan, nan, nan, nan, 2008, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1999, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1999, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 2009, 2007, nan, nan, nan, nan, nan, nan, 1999, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'EXIO1': ['WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'AU', 'AT', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'BE', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'BR', 'WW', 'WW', 'WW', 'BG', 'WW', 'WW', 'WW', 'WW', 'WW', 'CA', 'WW', 'WW', 'WW', 'WW', 'CN', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'CY', 'CZ', 'DK', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'EE', 'WW', 'WW', 'WW', 'WW', 'WW', 'FI', 'FR', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'DE', 'WW', 'WW', 'GR', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'HU', 'WW', 'IN', 'ID', 'WW', 'WW', 'IE', 'WW', 'WW', 'IT', 'WW', 'JP', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'LV', 'WW', 'WW', 'WW', 'WW', 'WW', 'LT', 'LU', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'MT', 'WW', 'WW', 'WW', 'WW', 'WW', 'MX', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'NL', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'NO', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'PL', 'PT', 'WW', 'WW', 'WW', 'RO', 'RU', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'SK', 'SI', 'WW', 'WW', 'ZA', 'WW', 'KR', 'WW', 'ES', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'SE', 'CH', 'WW', 'TW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'TR', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'GB', 'US', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW', 'WW'],
+        'EXIO1_3L': ['WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'AUS', 'AUT', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'BEL', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'BRA', 'WWW', 'WWW', 'WWW', 'BGR', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'CAN', 'WWW', 'WWW', 'WWW', 'WWW', 'CHN', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'CYP', 'CZE', 'DNK', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'EST', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'FIN', 'FRA', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'DEU', 'WWW', 'WWW', 'GRC', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'HUN', 'WWW', 'IND', 'IDN', 'WWW', 'WWW', 'IRL', 'WWW', 'WWW', 'ITA', 'WWW', 'JPN', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'LVA', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'LTU', 'LUX', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'MLT', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'MEX', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'NLD', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'NOR', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'POL', 'PRT', 'WWW', 'WWW', 'WWW', 'ROM', 'RUS', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'SVK', 'SVN', 'WWW', 'WWW', 'ZAF', 'WWW', 'KOR', 'WWW', 'ESP', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'SWE', 'CHE', 'WWW', 'TWN', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'TUR', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'GBR', 'USA', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW', 'WWW'],
+        'EXIO2': ['WA', 'WE', 'WE', 'WF', 'WA', 'WE', 'WF', 'WL', 'WA', 'WL', 'WL', 'WA', 'WL', 'AU', 'AT', 'WA', 'WL', 'WM', 'WA', 'WL', 'WE', 'BE', 'WL', 'WF', 'WL', 'WA', 'WL', 'WL', 'WE', 'WF', 'WA', 'BR', 'WA', 'WL', 'WA', 'BG', 'WF', 'WF', 'WF', 'WA', 'WF', 'CA', 'WL', 'WF', 'WF', 'WL', 'CN', 'WA', 'WA', 'WL', 'WF', 'WF', 'WA', 'WL', 'WF', 'WE', 'WL', 'WL', 'CY', 'CZ', 'DK', 'WF', 'WL', 'WL', 'WF', 'WL', 'WM', 'WL', 'WF', 'WF', 'EE', 'WF', 'WF', 'WE', 'WL', 'WA', 'FI', 'FR', 'WL', 'WA', 'WF', 'WF', 'WF', 'WA', 'DE', 'WF', 'WE', 'GR', 'WL', 'WL', 'WL', 'WA', 'WL', 'WE', 'WF', 'WF', 'WL', 'WL', 'WA', 'WL', 'WA', 'HU', 'WE', 'IN', 'ID', 'WM', 'WM', 'IE', 'WE', 'WM', 'IT', 'WL', 'JP', 'WE', 'WM', 'WA', 'WF', 'WA', 'WE', 'WM', 'WA', 'WA', 'LV', 'WM', 'WF', 'WF', 'WF', 'WE', 'LT', 'LU', 'WA', 'WE', 'WF', 'WF', 'WA', 'WA', 'WF', 'MT', 'WA', 'WL', 'WF', 'WF', 'WF', 'MX', 'WA', 'WE', 'WE', 'WA', 'WE', 'WL', 'WF', 'WF', 'WA', 'WF', 'WA', 'WA', 'NL', 'WA', 'WA', 'WL', 'WF', 'WF', 'WA', 'WA', 'WA', 'WA', 'NO', 'WM', 'WA', 'WA', 'WM', 'WL', 'WA', 'WL', 'WL', 'WA', 'WA', 'PL', 'PT', 'WL', 'WM', 'WF', 'RO', 'RU', 'WF', 'WL', 'WA', 'WE', 'WF', 'WM', 'WF', 'WE', 'WF', 'WF', 'WA', 'WL', 'SK', 'SI', 'WA', 'WF', 'ZA', 'WA', 'KR', 'WF', 'ES', 'WA', 'WL', 'WF', 'WL', 'WL', 'WL', 'WL', 'WF', 'WL', 'WE', 'SE', 'CH', 'WM', 'TW', 'WA', 'WF', 'WA', 'WA', 'WF', 'WA', 'WA', 'WL', 'WF', 'TR', 'WA', 'WL', 'WA', 'WF', 'WE', 'WM', 'GB', 'US', 'WA', 'WL', 'WL', 'WA', 'WA', 'WE', 'WL', 'WA', 'WA', 'WF', 'WM', 'WF', 'WF'],
+        'EXIO2_3L': ['WWA', 'WWE', 'WWE', 'WWF', 'WWA', 'WWE', 'WWF', 'WWL', 'WWA', 'WWL', 'WWL', 'WWA', 'WWL', 'AUS', 'AUT', 'WWA', 'WWL', 'WWM', 'WWA', 'WWL', 'WWE', 'BEL', 'WWL', 'WWF', 'WWL', 'WWA', 'WWL', 'WWL', 'WWE', 'WWF', 'WWA', 'BRA', 'WWA', 'WWL', 'WWA', 'BGR', 'WWF', 'WWF', 'WWF', 'WWA', 'WWF', 'CAN', 'WWL', 'WWF', 'WWF', 'WWL', 'CHN', 'WWA', 'WWA', 'WWL', 'WWF', 'WWF', 'WWA', 'WWL', 'WWF', 'WWE', 'WWL', 'WWL', 'CYP', 'CZE', 'DNK', 'WWF', 'WWL', 'WWL', 'WWF', 'WWL', 'WWM', 'WWL', 'WWF', 'WWF', 'EST', 'WWF', 'WWF', 'WWE', 'WWL', 'WWA', 'FIN', 'FRA', 'WWL', 'WWA', 'WWF', 'WWF', 'WWF', 'WWA', 'DEU', 'WWF', 'WWE', 'GRC', 'WWL', 'WWL', 'WWL', 'WWA', 'WWL', 'WWE', 'WWF', 'WWF', 'WWL', 'WWL', 'WWA', 'WWL', 'WWA', 'HUN', 'WWE', 'IND', 'IDN', 'WWM', 'WWM', 'IRL', 'WWE', 'WWM', 'ITA', 'WWL', 'JPN', 'WWE', 'WWM', 'WWA', 'WWF', 'WWA', 'WWE', 'WWM', 'WWA', 'WWA', 'LVA', 'WWM', 'WWF', 'WWF', 'WWF', 'WWE', 'LTU', 'LUX', 'WWA', 'WWE', 'WWF', 'WWF', 'WWA', 'WWA', 'WWF', 'MLT', 'WWA', 'WWL', 'WWF', 'WWF', 'WWF', 'MEX', 'WWA', 'WWE', 'WWE', 'WWA', 'WWE', 'WWL', 'WWF', 'WWF', 'WWA', 'WWF', 'WWA', 'WWA', 'NLD', 'WWA', 'WWA', 'WWL', 'WWF', 'WWF', 'WWA', 'WWA', 'WWA', 'WWA', 'NOR', 'WWM', 'WWA', 'WWA', 'WWM', 'WWL', 'WWA', 'WWL', 'WWL', 'WWA', 'WWA', 'POL', 'PRT', 'WWL', 'WWM', 'WWF', 'ROM', 'RUS', 'WWF', 'WWL', 'WWA', 'WWE', 'WWF', 'WWM', 'WWF', 'WWE', 'WWF', 'WWF', 'WWA', 'WWL', 'SVK', 'SVN', 'WWA', 'WWF', 'ZAF', 'WWA', 'KOR', 'WWF', 'ESP', 'WWA', 'WWL', 'WWF', 'WWL', 'WWL', 'WWL', 'WWL', 'WWF', 'WWL', 'WWE', 'SWE', 'CHE', 'WWM', 'TWN', 'WWA', 'WWF', 'WWA', 'WWA', 'WWF', 'WWA', 'WWA', 'WWL', 'WWF', 'TUR', 'WWA', 'WWL', 'WWA', 'WWF', 'WWE', 'WWM', 'GBR', 'USA', 'WWA', 'WWL', 'WWL', 'WWA', 'WWA', 'WWE', 'WWL', 'WWA', 'WWA', 'WWF', 'WWM', 'WWF', 'WWF'],
+        'EXIO3': ['WA', 'WE', 'WE', 'WF', 'WA', 'WE', 'WF', 'WL', 'WA', 'WL', 'WL', 'WA', 'WL', 'AU', 'AT', 'WA', 'WL', 'WM', 'WA', 'WL', 'WE', 'BE', 'WL', 'WF', 'WL', 'WA', 'WL', 'WL', 'WE', 'WF', 'WA', 'BR', 'WA', 'WL', 'WA', 'BG', 'WF', 'WF', 'WF', 'WA', 'WF', 'CA', 'WL', 'WF', 'WF', 'WL', 'CN', 'WA', 'WA', 'WL', 'WF', 'WF', 'WA', 'WL', 'WF', 'HR', 'WL', 'WL', 'CY', 'CZ', 'DK', 'WF', 'WL', 'WL', 'WF', 'WL', 'WM', 'WL', 'WF', 'WF', 'EE', 'WF', 'WF', 'WE', 'WL', 'WA', 'FI', 'FR', 'WL', 'WA', 'WF', 'WF', 'WF', 'WA', 'DE', 'WF', 'WE', 'GR', 'WL', 'WL', 'WL', 'WA', 'WL', 'WE', 'WF', 'WF', 'WL', 'WL', 'WA', 'WL', 'WA', 'HU', 'WE', 'IN', 'ID', 'WM', 'WM', 'IE', 'WE', 'WM', 'IT', 'WL', 'JP', 'WE', 'WM', 'WA', 'WF', 'WA', 'WE', 'WM', 'WA', 'WA', 'LV', 'WM', 'WF', 'WF', 'WF', 'WE', 'LT', 'LU', 'WA', 'WE', 'WF', 'WF', 'WA', 'WA', 'WF', 'MT', 'WA', 'WL', 'WF', 'WF', 'WF', 'MX', 'WA', 'WE', 'WE', 'WA', 'WE', 'WL', 'WF', 'WF', 'WA', 'WF', 'WA', 'WA', 'NL', 'WA', 'WA', 'WL', 'WF', 'WF', 'WA', 'WA', 'WA', 'WA', 'NO', 'WM', 'WA', 'WA', 'WM', 'WL', 'WA', 'WL', 'WL', 'WA', 'WA', 'PL', 'PT', 'WL', 'WM', 'WF', 'RO', 'RU', 'WF', 'WL', 'WA', 'WE', 'WF', 'WM', 'WF', 'WE', 'WF', 'WF', 'WA', 'WL', 'SK', 'SI', 'WA', 'WF', 'ZA', 'WA', 'KR', 'WF', 'ES', 'WA', 'WL', 'WF', 'WL', 'WL', 'WL', 'WL', 'WF', 'WL', 'WE', 'SE', 'CH', 'WM', 'TW', 'WA', 'WF', 'WA', 'WA', 'WF', 'WA', 'WA', 'WL', 'WF', 'TR', 'WA', 'WL', 'WA', 'WF', 'WE', 'WM', 'GB', 'US', 'WA', 'WL', 'WL', 'WA', 'WA', 'WE', 'WL', 'WA', 'WA', 'WF', 'WM', 'WF', 'WF'],
+        'EXIO3_3L': ['WWA', 'WWE', 'WWE', 'WWF', 'WWA', 'WWE', 'WWF', 'WWL', 'WWA', 'WWL', 'WWL', 'WWA', 'WWL', 'AUS', 'AUT', 'WWA', 'WWL', 'WWM', 'WWA', 'WWL', 'WWE', 'BEL', 'WWL', 'WWF', 'WWL', 'WWA', 'WWL', 'WWL', 'WWE', 'WWF', 'WWA', 'BRA', 'WWA', 'WWL', 'WWA', 'BGR', 'WWF', 'WWF', 'WWF', 'WWA', 'WWF', 'CAN', 'WWL', 'WWF', 'WWF', 'WWL', 'CHN', 'WWA', 'WWA', 'WWL', 'WWF', 'WWF', 'WWA', 'WWL', 'WWF', 'HRV', 'WWL', 'WWL', 'CYP', 'CZE', 'DNK', 'WWF', 'WWL', 'WWL', 'WWF', 'WWL', 'WWM', 'WWL', 'WWF', 'WWF', 'EST', 'WWF', 'WWF', 'WWE', 'WWL', 'WWA', 'FIN', 'FRA', 'WWL', 'WWA', 'WWF', 'WWF', 'WWF', 'WWA', 'DEU', 'WWF', 'WWE', 'GRC', 'WWL', 'WWL', 'WWL', 'WWA', 'WWL', 'WWE', 'WWF', 'WWF', 'WWL', 'WWL', 'WWA', 'WWL', 'WWA', 'HUN', 'WWE', 'IND', 'IDN', 'WWM', 'WWM', 'IRL', 'WWE', 'WWM', 'ITA', 'WWL', 'JPN', 'WWE', 'WWM', 'WWA', 'WWF', 'WWA', 'WWE', 'WWM', 'WWA', 'WWA', 'LVA', 'WWM', 'WWF', 'WWF', 'WWF', 'WWE', 'LTU', 'LUX', 'WWA', 'WWE', 'WWF', 'WWF', 'WWA', 'WWA', 'WWF', 'MLT', 'WWA', 'WWL', 'WWF', 'WWF', 'WWF', 'MEX', 'WWA', 'WWE', 'WWE', 'WWA', 'WWE', 'WWL', 'WWF', 'WWF', 'WWA', 'WWF', 'WWA', 'WWA', 'NLD', 'WWA', 'WWA', 'WWL', 'WWF', 'WWF', 'WWA', 'WWA', 'WWA', 'WWA', 'NOR', 'WWM', 'WWA', 'WWA', 'WWM', 'WWL', 'WWA', 'WWL', 'WWL', 'WWA', 'WWA', 'POL', 'PRT', 'WWL', 'WWM', 'WWF', 'ROM', 'RUS', 'WWF', 'WWL', 'WWA', 'WWE', 'WWF', 'WWM', 'WWF', 'WWE', 'WWF', 'WWF', 'WWA', 'WWL', 'SVK', 'SVN', 'WWA', 'WWF', 'ZAF', 'WWA', 'KOR', 'WWF', 'ESP', 'WWA', 'WWL', 'WWF', 'WWL', 'WWL', 'WWL', 'WWL', 'WWF', 'WWL', 'WWE', 'SWE', 'CHE', 'WWM', 'TWN', 'WWA', 'WWF', 'WWA', 'WWA', 'WWF', 'WWA', 'WWA', 'WWL', 'WWF', 'TUR', 'WWA', 'WWL', 'WWA', 'WWF', 'WWE', 'WWM', 'GBR', 'USA', 'WWA', 'WWL', 'WWL', 'WWA', 'WWA', 'WWE', 'WWL', 'WWA', 'WWA', 'WWF', 'WWM', 'WWF', 'WWF'],
+        'Eora': ['AFG', 'ALA', 'ALB', 'DZA', 'ASM', 'AND', 'AGO', 'AIA', nan, 'ATG', 'ARG', 'ARM', 'ABW', 'AUS', 'AUT', 'AZE', 'BHS', 'BHR', 'BGD', 'BRB', 'BLR', 'BEL', 'BLZ', 'BEN', 'BMU', 'BTN', 'BOL', nan, 'BIH', 'BWA', nan, 'BRA', nan, 'VGB', 'BRN', 'BGR', 'BFA', 'BDI', 'CPV', 'KHM', 'CMR', 'CAN', 'CYM', 'CAF', 'TCD', 'CHL', 'CHN', nan, nan, 'COL', 'COM', 'COG', 'COK', 'CRI', 'CIV', 'HRV', 'CUB', nan, 'CYP', 'CZE', 'DNK', 'DJI', 'DMA', 'DOM', 'COD', 'ECU', 'EGY', 'SLV', 'GNQ', 'ERI', 'EST', 'SWZ', 'ETH', 'FRO', 'FLK', 'FJI', 'FIN', 'FRA', 'GUF', 'PYF', nan, 'GAB', 'GMB', 'GEO', 'DEU', 'GHA', 'GIB', 'GRC', 'GRL', 'GRD', 'GLP', 'GUM', 'GTM', 'GGY', 'GIN', 'GNB', 'GUY', 'HTI', nan, 'HND', 'HKG', 'HUN', 'ISL', 'IND', 'IDN', 'IRN', 'IRQ', 'IRL', 'IMN', 'ISR', 'ITA', 'JAM', 'JPN', 'JEY', 'JOR', 'KAZ', 'KEN', 'KIR', 'KSV', 'KWT', 'KGZ', 'LAO', 'LVA', 'LBN', 'LSO', 'LBR', 'LBY', 'LIE', 'LTU', 'LUX', 'MAC', 'MKD', 'MDG', 'MWI', 'MYS', 'MDV', 'MLI', 'MLT', 'MHL', 'MTQ', 'MRT', 'MUS', 'MYT', 'MEX', 'FSM', 'MDA', 'MCO', 'MNG', 'MNE', 'MSR', 'MAR', 'MOZ', 'MMR', 'NAM', 'NRU', 'NPL', 'NLD', 'NCL', 'NZL', 'NIC', 'NER', 'NGA', 'NIU', 'NFK', 'PRK', 'MNP', 'NOR', 'OMN', 'PAK', 'PLW', 'PSE', 'PAN', 'PNG', 'PRY', 'PER', 'PHL', 'PCN', 'POL', 'PRT', nan, 'QAT', 'REU', 'ROU', 'RUS', 'RWA', 'MAF', 'WSM', 'SMR', 'STP', 'SAU', 'SEN', 'SRB', 'SYC', 'SLE', 'SGP', nan, 'SVK', 'SVN', 'SLB', 'SOM', 'ZAF', nan, 'KOR', 'SDS', 'ESP', 'LKA', 'BLM', 'SHN', 'KNA', 'LCA', 'SPM', 'VCT', 'SUD', 'SUR', 'SJM', 'SWE', 'CHE', 'SYR', 'TWN', 'TJK', 'TZA', 'THA', 'TLS', 'TGO', 'TKL', 'TON', 'TTO', 'TUN', 'TUR', 'TKM', 'TCA', 'TUV', 'UGA', 'UKR', 'ARE', 'GBR', 'USA', nan, 'VIR', 'URY', 'UZB', 'VUT', 'VAT', 'VEN', 'VNM', 'WLF', 'ESH', 'YEM', 'ZMB', 'ZWE'],
+        'FAOcode': [2, 284, 3, 4, 5, 6, 7, 258, 30, 8, 9, 1, 22, 10, 11, 52, 12, 13, 16, 14, 57, 255, 23, 53, 17, 18, 19, 278, 80, 20, 31, 21, 24, 239, 26, 27, 233, 29, 35, 115, 32, 33, 36, 37, 39, 40, 351, 42, 43, 44, 45, 46, 47, 48, 107, 98, 49, 279, 50, 167, 54, 72, 55, 56, 250, 58, 59, 60, 61, 178, 63, 209, 238, 64, 65, 66, 67, 68, 69, 70, 71, 74, 75, 73, 79, 81, 82, 84, 85, 86, 87, 88, 89, nan, 90, 175, 91, 93, 92, 95, 96, 97, 99, 100, 101, 102, 103, 104, 264, 105, 106, 109, 110, 283, 112, 108, 114, 83, nan, 118, 113, 120, 119, 121, 122, 123, 124, 125, 126, 256, 128, 154, 129, 130, 131, 132, 133, 134, 127, 135, 136, 137, 270, 138, 145, 146, 140, 141, 273, 142, 143, 144, 28, 147, 148, 149, 150, 153, 156, 157, 158, 159, 160, 161, 116, 163, 162, 221, 165, 180, 299, 166, 168, 169, 170, 171, 172, 173, 174, 177, 179, 182, 183, 185, 184, 281, 244, 192, 193, 194, 195, 272, 196, 197, 200, 280, 199, 198, 25, 201, 202, 271, 117, 277, 203, 38, 282, 187, 188, 189, 190, 191, nan, 207, 260, 210, 211, 212, 214, 208, 215, 216, 176, 217, 218, 219, 220, 222, 223, 213, 224, 227, 226, 230, 225, 229, 231, 232, 240, 234, 235, 155, 94, 236, 237, 243, 205, 249, 251, 181],
+        'FIFA': ['AFG', nan, 'ALB', 'ALG', 'ASA', 'AND', 'ANG', 'AIA', nan, 'ATG', 'ARG', 'ARM', 'ARU', 'AUS', 'AUT', 'AZE', 'BAH', 'BHR', 'BAN', 'BAR', 'BLR', 'BEL', 'BLZ', 'BEN', 'BER', 'BHU', 'BOL', nan, 'BIH', 'BOT', nan, 'BRA', nan, 'VGB', 'BRU', 'BUL', 'BFA', 'BDI', 'CPV', 'CAM', 'CMR', 'CAN', 'CAY', 'CTA', 'CHA', 'CHI', 'CHN', nan, nan, 'COL', 'COM', 'CGO', 'COK', 'CRC', 'CIV', 'CRO', 'CUB', 'CUW', 'CYP', 'CZE', 'DEN', 'DJI', 'DMA', 'DOM', 'COD', 'ECU', 'EGY', 'SLV', 'EDQ', 'ERI', 'EST', 'SWZ', 'ETH', 'FRO', nan, 'FIJ', 'FIN', 'FRA', nan, nan, nan, 'GAB', 'GAM', 'GEO', 'GER', 'GHA', 'GIB', 'GRE', nan, 'GRN', nan, 'GUM', 'GUA', nan, 'GUI', 'GNB', 'GUY', 'HAI', nan, 'HON', 'HKG', 'HUN', 'ISL', 'IND', 'IDN', 'IRN', 'IRQ', 'IRL', nan, 'ISR', 'ITA', 'JAM', 'JPN', nan, 'JOR', 'KAZ', 'KEN', 'KIR', 'KOS', 'KUW', 'KGZ', 'LAO', 'LVA', 'LBN', 'LES', 'LBR', 'LBY', 'LIE', 'LTU', 'LUX', 'MAC', 'MKD', 'MAD', 'MWI', 'MAS', 'MDV', 'MLI', 'MLT', 'MHL', nan, 'MTN', 'MRI', nan, 'MEX', 'FSM', 'MDA', 'MON', 'MNG', 'MNE', 'MSR', 'MAR', 'MOZ', 'MYA', 'NAM', 'NRU', 'NEP', 'NED', 'NCL', 'NZL', 'NCA', 'NIG', 'NGA', nan, nan, 'PRK', nan, 'NOR', 'OMA', 'PAK', 'PLW', 'PLE', 'PAN', 'PNG', 'PAR', 'PER', 'PHI', nan, 'POL', 'POR', 'PUR', 'QAT', nan, 'ROU', 'RUS', 'RWA', nan, 'SAM', 'SMR', 'STP', 'KSA', 'SEN', 'SRB', 'SEY', 'SLE', 'SGP', nan, 'SVK', 'SVN', 'SOL', 'SOM', 'RSA', nan, 'KOR', 'SSD', 'ESP', 'SRI', nan, nan, 'SKN', 'LCA', nan, 'VIN', 'SUD', 'SUR', nan, 'SWE', 'SUI', 'SYR', 'TPE', 'TJK', 'TAN', 'THA', 'TLS', 'TOG', nan, 'TGA', 'TRI', 'TUN', 'TUR', 'TKM', 'TCA', 'TUV', 'UGA', 'UKR', 'UAE', 'ENG', 'USA', nan, 'VIR', 'URU', 'UZB', 'VAN', nan, 'VEN', 'VIE', nan, nan, 'YEM', 'ZAM', 'ZIM'],
+        'G20': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G20', nan, nan, 'G20', 'G20', nan, nan, nan, nan, nan, nan, 'G20', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G20', nan, nan, nan, 'G20', nan, nan, nan, nan, nan, 'G20', nan, nan, nan, nan, 'G20', nan, nan, nan, nan, nan, nan, nan, nan, 'G20', nan, nan, 'G20', 'G20', 'G20', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G20', nan, nan, nan, nan, nan, 'G20', 'G20', nan, nan, nan, nan, nan, nan, 'G20', nan, nan, 'G20', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G20', nan, 'G20', 'G20', nan, nan, 'G20', nan, nan, 'G20', nan, 'G20', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G20', nan, nan, nan, nan, nan, 'G20', 'G20', nan, nan, nan, nan, nan, nan, nan, 'G20', nan, nan, nan, nan, nan, 'G20', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G20', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G20', 'G20', nan, nan, nan, 'G20', 'G20', nan, nan, nan, nan, nan, 'G20', nan, nan, nan, nan, nan, nan, 'G20', 'G20', nan, nan, 'G20', nan, 'G20', nan, 'G20', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G20', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G20', nan, nan, nan, nan, nan, nan, 'G20', 'G20', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'G7': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G7', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G7', nan, nan, nan, nan, nan, nan, 'G7', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G7', nan, 'G7', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'G7', 'G7', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'GBDcode': [160, nan, 43, 139, 298, 74, 168, nan, nan, 105, 97, 33, nan, 71, 75, 34, 106, 140, 161, 107, 57, 76, 108, 200, 305, 162, 121, nan, 44, 193, nan, 135, nan, nan, 66, 45, 201, 175, 203, 10, 202, 101, nan, 169, 204, 98, 6, nan, nan, 125, 176, 170, 320, 126, 205, 46, 109, nan, 77, 47, 78, 177, 110, 111, 171, 122, 141, 127, 172, 178, 58, 197, 179, nan, nan, 22, 79, 80, nan, nan, nan, 173, 206, 35, 81, 207, nan, 82, 349, 112, nan, 351, 128, nan, 208, 209, 113, 114, nan, 129, nan, 48, 83, 163, 11, 142, 143, 84, nan, 85, 86, 115, 67, nan, 144, 36, 180, 23, nan, 145, 37, 12, 59, 146, 194, 210, 147, nan, 60, 87, nan, 49, 181, 182, 13, 14, 211, 88, 24, nan, 212, 183, nan, 130, 25, 61, 367, 38, 50, nan, 148, 184, 15, 195, 369, 164, 89, nan, 72, 131, 213, 214, 374, nan, 7, 376, 90, 150, 165, 380, 149, 132, 26, 136, 123, 16, nan, 51, 91, 385, 151, nan, 52, 62, 185, nan, 27, 396, 215, 152, 216, 53, 186, 217, 69, nan, 54, 55, 28, 187, 196, nan, 68, 435, 92, 17, nan, nan, 393, 116, nan, 117, 522, 118, nan, 93, 94, 153, 8, 39, 189, 18, 19, 218, 413, 29, 119, 154, 155, 40, nan, 416, 190, 63, 156, 95, 102, nan, 422, 99, 41, 30, nan, 133, 20, nan, 199, 157, 191, 198],
+        'GEOnumeric': [660, nan, 70, 208, 830, 43, 330, 446, 891, 459, 528, 77, 474, 800, 38, 78, 453, 640, 666, 469, 73, 17, 421, 284, 413, 675, 516, 477, 93, 391, 892, 508, 357, 468, 703, 68, 236, 328, 247, 696, 302, 404, 463, 306, 244, 512, 720, 834, 833, 480, 375, 318, 837, 436, 272, 92, 448, 475, 600, 61, 8, 338, 460, 456, 322, 500, 220, 428, 310, 336, 53, 393, 334, 41, 529, 815, 31, 1, 496, 822, 894, 314, 252, 76, 4, 276, 44, 9, 406, 473, 458, 831, 416, nan, 260, 257, 488, 452, 835, 424, 740, 64, 24, 664, 700, 616, 612, 7, nan, 624, 5, 464, 732, nan, 628, 79, 346, 812, 95, 636, 83, 684, 54, 604, 395, 268, 216, 37, 55, 18, 743, 96, 370, 386, 701, 667, 232, 46, 824, 462, 228, 373, 377, 412, 823, 74, nan, 716, 97, 470, 204, 366, 676, 389, 803, 672, 3, 809, 804, 432, 240, 288, 838, 836, 724, 820, 28, 649, 662, 825, 625, 442, 801, 520, 504, 708, 813, 60, 10, nan, 644, 371, 66, 75, 324, nan, 819, 47, 311, 632, 248, 98, 355, 264, 706, 479, 63, 91, 806, 342, 388, 893, 728, 225, 11, 669, 466, 329, 449, 465, 408, 467, 224, 492, 27, 30, 39, 608, 736, 82, 352, 680, 626, 280, 839, 817, 472, 212, 52, 80, 454, 807, 350, 72, 647, 6, 400, 832, 457, 524, 81, 816, 45, 484, 690, 811, 229, 653, 378, 382],
+        'GWcode': [700, nan, 339, 615, nan, 232, 540, nan, nan, 58, 160, 371, nan, 900, 305, 373, 31, 692, 771, 53, 370, 211, 80, 434, nan, 760, 145, nan, 346, 571, nan, 140, nan, nan, 835, 355, 439, 516, 402, 811, 471, 20, nan, 482, 483, 155, 710, nan, nan, 100, 581, 484, nan, 94, 437, 344, 40, nan, 352, 315, 390, 522, 54, 42, 490, 130, 651, 92, 411, 531, 366, 572, 530, nan, nan, 950, 375, 220, nan, nan, nan, 481, 420, 372, 260, 452, nan, 350, nan, 55, nan, nan, 90, nan, 438, 404, 110, 41, nan, 91, nan, 310, 395, 750, 850, 630, 645, 205, nan, 666, 325, 51, 740, nan, 663, 705, 501, 970, 347, 690, 703, 812, 367, 660, 570, 450, 620, 223, 368, 212, nan, 343, 580, 553, 820, 781, 432, 338, 983, nan, 435, 590, nan, 70, 987, 359, 221, 712, 341, nan, 600, 541, 775, 565, 971, 790, 210, nan, 920, 93, 436, 475, nan, nan, 731, nan, 385, 698, 770, 986, nan, 95, 910, 150, 135, 840, nan, 290, 235, nan, 694, nan, 360, 365, 517, nan, 990, 331, 403, 670, 433, 340, 591, 451, 830, nan, 317, 349, 940, 520, 560, nan, 732, 626, 230, 780, nan, nan, 60, 56, nan, 57, 625, 115, nan, 380, 225, 652, 713, 702, 510, 800, 860, 461, nan, 972, 52, 616, 640, 701, nan, 973, 500, 369, 696, 200, 2, nan, nan, 165, 704, 935, nan, 101, 817, nan, nan, 680, 551, 552],
+        'IEA': ['Other non-OECD Asia', nan, 'Albania', 'Algeria', 'Other non-OECD Asia', nan, 'Angola', 'Other non-OECD Americas', 'Other non-OECD Asia', 'Other non-OECD Americas', 'Argentina', 'Armenia', 'Other non-OECD Americas', 'Australia', 'Austria', 'Azerbaijan', 'Other non-OECD Americas', 'Bahrain', 'Bangladesh', 'Other non-OECD Americas', 'Belarus', 'Belgium', 'Other non-OECD Americas', 'Benin', 'Other non-OECD Americas', 'Other non-OECD Asia', 'Plurinational State of Bolivia', 'Other non-OECD Americas', 'Bosnia and Herzegovina', 'Botswana', 'Other non-OECD Asia', 'Brazil', 'Other non-OECD Asia', 'Other non-OECD Americas', 'Brunei Darussalam', 'Bulgaria', 'Other Africa', 'Other Africa', 'Other Africa', 'Cambodia', 'Cameroon', 'Canada', 'Other non-OECD Americas', 'Other Africa', 'Other Africa', 'Chile', "People's Republic of China", 'Other non-OECD Asia', 'Other non-OECD Asia', 'Colombia', 'Other Africa', 'Republic of the Congo', 'Other non-OECD Asia', 'Costa Rica', "Côte d'Ivoire", 'Croatia', 'Cuba', 'Curaçao/Netherlands Antilles', 'Cyprus', 'Czech Republic', 'Denmark', 'Other Africa', 'Other non-OECD Americas', 'Dominican Republic', 'Democratic Republic of the Congo', 'Ecuador', 'Egypt', 'El Salvador', 'Equatorial Guinea', 'Eritrea', 'Estonia', 'Other Africa', 'Ethiopia', nan, 'Other non-OECD Americas', 'Other non-OECD Asia', 'Finland', 'France', 'Other non-OECD Americas', 'Other non-OECD Asia', 'Other Africa', 'Gabon', 'Other Africa', 'Georgia', 'Germany', 'Ghana', 'Gibraltar', 'Greece', 'Other non-OECD Americas', 'Other non-OECD Americas', 'Other non-OECD Americas', 'Other non-OECD Asia', 'Guatemala', nan, 'Other Africa', 'Other Africa', 'Guyana', 'Haiti', 'Other non-OECD Asia', 'Honduras', 'Hong Kong (China)', 'Hungary', 'Iceland', 'India', 'Indonesia', 'Islamic Republic of Iran', 'Iraq', 'Ireland', nan, 'Israel', 'Italy', 'Jamaica', 'Japan', nan, 'Jordan', 'Kazakhstan', 'Kenya', 'Other non-OECD Asia', 'Kosovo', 'Kuwait', 'Kyrgyzstan', "Lao People's Democratic Republic", 'Latvia', 'Lebanon', 'Other Africa', 'Other Africa', 'Libya', nan, 'Lithuania', 'Luxembourg', 'Other non-OECD Asia', 'Republic of North Macedonia', 'Other Africa', 'Other Africa', 'Malaysia', 'Other non-OECD Asia', 'Other Africa', 'Malta', 'Other non-OECD Asia', 'Other non-OECD Americas', 'Other Africa', 'Mauritius', 'Other Africa', 'Mexico', 'Other non-OECD Asia', 'Republic of Moldova', nan, 'Mongolia', 'Montenegro', 'Other non-OECD Americas', 'Morocco', 'Mozambique', 'Myanmar', 'Namibia', 'Other non-OECD Asia', 'Nepal', 'Netherlands', 'Other non-OECD Asia', 'New Zealand', 'Nicaragua', 'Niger', 'Nigeria', 'Other non-OECD Asia', 'Other non-OECD Asia', "Democratic People's Republic of Korea", 'Other non-OECD Asia', 'Norway', 'Oman', 'Pakistan', 'Other non-OECD Asia', 'Other non-OECD Asia', 'Panama', 'Other non-OECD Asia', 'Paraguay', 'Peru', 'Philippines', 'Other non-OECD Asia', 'Poland', 'Portugal', 'Other non-OECD Americas', 'Qatar', 'Other Africa', 'Romania', 'Russian Federation', 'Other Africa', 'Other non-OECD Americas', 'Other non-OECD Asia', nan, 'Other Africa', 'Saudi Arabia', 'Senegal', 'Serbia', 'Other Africa', 'Other Africa', 'Singapore', 'Other non-OECD Americas', 'Slovak Republic', 'Slovenia', 'Other non-OECD Asia', 'Other Africa', 'South Africa', 'Other non-OECD Asia', 'Korea', 'South Sudan', 'Spain', 'Sri Lanka', 'Other non-OECD Americas', 'Other Africa', 'Other non-OECD Americas', 'Other non-OECD Americas', 'Other non-OECD Americas', 'Other non-OECD Americas', 'Sudan', 'Suriname', nan, 'Sweden', 'Switzerland', 'Syrian Arab Republic', 'Chinese Taipei', 'Tajikistan', 'United Republic of Tanzania', 'Thailand', 'Other non-OECD Asia', 'Togo', 'Other non-OECD Asia', 'Other non-OECD Asia', 'Trinidad and Tobago', 'Tunisia', 'Türkiye', 'Turkmenistan', 'Other non-OECD Americas', 'Other non-OECD Asia', 'Other Africa', 'Ukraine', 'United Arab Emirates', 'United Kingdom', 'United States', 'Other non-OECD Asia', 'Other non-OECD Americas', 'Uruguay', 'Uzbekistan', 'Other non-OECD Asia', nan, 'Bolivarian Republic of Venezuela', 'Viet Nam', 'Other non-OECD Asia', 'Other Africa', 'Yemen', 'Zambia', 'Zimbabwe'],
+        'IEA_v2025': ['OTH_NON_OECDAO', nan, 'ALBANIA', 'ALGERIA', 'OTH_NON_OECDAO', nan, 'ANGOLA', 'OTH_NON_OECDAM', 'OTH_NON_OECDAO', 'OTH_NON_OECDAM', 'ARGENTINA', 'ARMENIA', 'OTH_NON_OECDAM', 'AUSTRALIA', 'AUSTRIA', 'AZERBAIJAN', 'OTH_NON_OECDAM', 'BAHRAIN', 'BANGLADESH', 'OTH_NON_OECDAM', 'BELARUS', 'BELGIUM', 'OTH_NON_OECDAM', 'BENIN', 'OTH_NON_OECDAM', 'OTH_NON_OECDAO', 'BOLIVIA', 'OTH_NON_OECDAM', 'BOSNIAHERZ', 'BOTSWANA', 'OTH_NON_OECDAO', 'BRAZIL', 'OTH_NON_OECDAO', 'OTH_NON_OECDAM', 'BRUNEI', 'BULGARIA', 'BURKINAFASO', 'OTH_NON_OECDAFR', 'OTH_NON_OECDAFR', 'CAMBODIA', 'CAMEROON', 'CANADA', 'OTH_NON_OECDAM', 'OTH_NON_OECDAFR', 'CHAD', 'CHILE', 'CHINA', 'OTH_NON_OECDAO', 'OTH_NON_OECDAO', 'COLOMBIA', 'OTH_NON_OECDAFR', 'CONGO_REPUB', 'OTH_NON_OECDAO', 'COSTARICA', 'COTEIVOIRE', 'CROATIA', 'CUBA', 'CURACAO', 'CYPRUS', 'CZECH', 'DENMARK', 'OTH_NON_OECDAFR', 'OTH_NON_OECDAM', 'DOMINICANREP', 'CONGO_DRC', 'ECUADOR', 'EGYPT', 'ELSALVADOR', 'EQGUINEA', 'ERITREA', 'ESTONIA', 'ESWATINI', 'ETHIOPIA', nan, 'OTH_NON_OECDAM', 'OTH_NON_OECDAO', 'FINLAND', 'FRANCE', 'OTH_NON_OECDAM', 'OTH_NON_OECDAO', 'OTH_NON_OECDAFR', 'GABON', 'OTH_NON_OECDAFR', 'GEORGIA', 'GERMANY', 'GHANA', 'GIBRALTAR', 'GREECE', 'GREENLAND', 'OTH_NON_OECDAM', 'OTH_NON_OECDAM', 'OTH_NON_OECDAO', 'GUATEMALA', nan, 'OTH_NON_OECDAFR', 'OTH_NON_OECDAFR', 'GUYANA', 'HAITI', 'OTH_NON_OECDAO', 'HONDURAS', 'HONGKONG', 'HUNGARY', 'ICELAND', 'INDIA', 'INDONESIA', 'IRAN', 'IRAQ', 'IRELAND', nan, 'ISRAEL', 'ITALY', 'JAMAICA', 'JAPAN', nan, 'JORDAN', 'KAZAKHSTAN', 'KENYA', 'OTH_NON_OECDAO', 'KOSOVO', 'KUWAIT', 'KYRGYZSTAN', 'LAO', 'LATVIA', 'LEBANON', 'OTH_NON_OECDAFR', 'OTH_NON_OECDAFR', 'LIBYA', nan, 'LITHUANIA', 'LUXEMBOURG', 'OTH_NON_OECDAO', 'NORTHMACED', 'MADAGASCAR', 'OTH_NON_OECDAFR', 'MALAYSIA', 'OTH_NON_OECDAO', 'MALI', 'MALTA', 'OTH_NON_OECDAO', 'OTH_NON_OECDAM', 'MAURITANIA', 'MAURITIUS', 'OTH_NON_OECDAFR', 'MEXICO', 'OTH_NON_OECDAO', 'MOLDOVA', nan, 'MONGOLIA', 'MONTENEGRO', 'OTH_NON_OECDAM', 'MOROCCO', 'MOZAMBIQUE', 'MYANMAR', 'NAMIBIA', 'OTH_NON_OECDAO', 'NEPAL', 'NETHERLANDS', 'OTH_NON_OECDAO', 'NEWZEALAND', 'NICARAGUA', 'NIGER', 'NIGERIA', 'OTH_NON_OECDAO', 'OTH_NON_OECDAO', 'KOREADPR', 'OTH_NON_OECDAO', 'NORWAY', 'OMAN', 'PAKISTAN', 'OTH_NON_OECDAO', 'PALESTINE', 'PANAMA', 'OTH_NON_OECDAO', 'PARAGUAY', 'PERU', 'PHILIPPINES', 'OTH_NON_OECDAO', 'POLAND', 'PORTUGAL', 'OTH_NON_OECDAM', 'QATAR', 'OTH_NON_OECDAFR', 'ROMANIA', 'RUSSIA', 'RWANDA', 'OTH_NON_OECDAM', 'OTH_NON_OECDAO', nan, 'OTH_NON_OECDAFR', 'SAUDIARABIA', 'SENEGAL', 'SERBIA', 'OTH_NON_OECDAFR', 'OTH_NON_OECDAFR', 'SINGAPORE', 'OTH_NON_OECDAM', 'SLOVAKIA', 'SLOVENIA', 'OTH_NON_OECDAO', 'OTH_NON_OECDAFR', 'SOUTHAFRICA', 'OTH_NON_OECDAO', 'KOREA', 'SSUDAN', 'SPAIN', 'SRILANKA', 'OTH_NON_OECDAM', 'OTH_NON_OECDAFR', 'OTH_NON_OECDAM', 'OTH_NON_OECDAM', 'OTH_NON_OECDAM', 'OTH_NON_OECDAM', 'SUDAN', 'SURINAME', nan, 'SWEDEN', 'SWITZERLAND', 'SYRIA', 'TAIPEI', 'TAJIKISTAN', 'TANZANIA', 'THAILAND', 'OTH_NON_OECDAO', 'TOGO', 'OTH_NON_OECDAO', 'OTH_NON_OECDAO', 'TRINIDAD', 'TUNISIA', 'TURKIYE', 'TURKMENISTAN', 'OTH_NON_OECDAM', 'OTH_NON_OECDAO', 'UGANDA', 'UKRAINE', 'UAE', 'UK', 'USA', 'OTH_NON_OECDAO', 'OTH_NON_OECDAM', 'URUGUAY', 'UZBEKISTAN', 'OTH_NON_OECDAO', nan, 'VENEZUELA', 'VIETNAM', 'OTH_NON_OECDAO', 'OTH_NON_OECDAFR', 'YEMEN', 'ZAMBIA', 'ZIMBABWE'],
+        'IMAGE': ['Rest of South Asia', nan, 'Central Europe', 'Northern Africa', 'Oceania', 'Western Europe', 'Rest of Southern Africa', 'Central America', nan, nan, 'Rest of South America', 'Russia region', 'Central America', 'Oceania', 'Western Europe', 'Russia region', 'Central America', 'Middle East', 'Rest of South Asia', 'Central America', 'Ukraine region', 'Western Europe', 'Central America', 'Western Africa', 'Central America', 'Rest of South Asia', 'Rest of South America', nan, 'Central Europe', 'Rest of Southern Africa', nan, 'Brazil', nan, 'Central America', 'Southeastern Asia', 'Central Europe', 'Western Africa', 'Eastern Africa', 'Western Africa', 'Southeastern Asia', 'Western Africa', 'Canada', 'Central America', 'Western Africa', 'Western Africa', 'Rest of South America', 'China region', nan, nan, 'Rest of South America', 'Eastern Africa', 'Western Africa', 'Oceania', 'Central America', 'Western Africa', 'Central Europe', nan, nan, 'Central Europe', 'Central Europe', 'Western Europe', 'Eastern Africa', 'Central America', 'Central America', 'Western Africa', 'Rest of South America', 'Northern Africa', 'Central America', 'Western Africa', 'Eastern Africa', 'Central Europe', 'Rest of Southern Africa', 'Eastern Africa', 'Western Europe', 'Rest of South America', 'Oceania', 'Western Europe', 'Western Europe', 'Rest of South America', 'Oceania', nan, 'Western Africa', 'Western Africa', 'Russia region', 'Western Europe', 'Western Africa', 'Western Europe', 'Western Europe', nan, 'Central America', 'Central America', nan, 'Central America', nan, 'Western Africa', 'Western Africa', 'Rest of South America', 'Central America', nan, 'Central America', 'China region', 'Central Europe', 'Western Europe', 'India', 'Indonesia region', 'Middle East', 'Middle East', 'Western Europe', nan, 'Middle East', 'Western Europe', 'Central America', 'Japan', nan, 'Middle East', 'Central Asia', 'Eastern Africa', 'Oceania', nan, 'Middle East', 'Central Asia', 'Southeastern Asia', 'Central Europe', 'Middle East', 'Rest of Southern Africa', 'Western Africa', 'Northern Africa', 'Western Europe', 'Central Europe', 'Western Europe', 'China region', 'Central Europe', 'Eastern Africa', 'Rest of Southern Africa', 'Southeastern Asia', 'Rest of South Asia', 'Western Africa', 'Western Europe', 'Oceania', 'Central America', 'Western Africa', 'Eastern Africa', nan, 'Mexico', 'Oceania', 'Ukraine region', 'Western Europe', 'China region', 'Central Europe', 'Central America', 'Northern Africa', 'Rest of Southern Africa', 'Southeastern Asia', 'Rest of Southern Africa', 'Oceania', 'Rest of South Asia', 'Western Europe', 'Oceania', 'Oceania', 'Central America', 'Western Africa', 'Western Africa', 'Oceania', nan, 'Korea region', 'Oceania', 'Western Europe', 'Middle East', 'Rest of South Asia', 'Oceania', nan, 'Central America', 'Indonesia region', 'Rest of South America', 'Rest of South America', 'Southeastern Asia', 'Oceania', 'Central Europe', 'Western Europe', 'Central America', 'Middle East', 'Eastern Africa', 'Central Europe', 'Russia region', 'Eastern Africa', nan, 'Oceania', 'Western Europe', 'Western Africa', 'Middle East', 'Western Africa', 'Central Europe', 'Eastern Africa', 'Western Africa', 'Southeastern Asia', nan, 'Central Europe', 'Central Europe', 'Oceania', 'Eastern Africa', 'South Africa', nan, 'Korea region', nan, 'Western Europe', 'Rest of South Asia', nan, 'Western Africa', 'Central America', 'Central America', 'USA', 'Central America', 'Eastern Africa', 'Rest of South America', nan, 'Western Europe', 'Western Europe', 'Middle East', 'China region', 'Central Asia', 'Rest of Southern Africa', 'Southeastern Asia', 'Indonesia region', 'Western Africa', 'Oceania', 'Oceania', 'Central America', 'Northern Africa', 'Turkey', 'Central Asia', 'Central America', 'Oceania', 'Eastern Africa', 'Ukraine region', 'Middle East', 'Western Europe', 'USA', nan, 'Central America', 'Rest of South America', 'Central Asia', 'Oceania', 'Western Europe', 'Rest of South America', 'Southeastern Asia', 'Oceania', 'Northern Africa', 'Middle East', 'Rest of Southern Africa', 'Rest of Southern Africa'],
+        'IOC': ['AFG', nan, 'ALB', 'ALG', 'ASA', 'AND', 'ANG', nan, nan, 'ANT', 'ARG', 'ARM', 'ARU', 'AUS', 'AUT', 'AZE', 'BAH', 'BRN', 'BAN', 'BAR', 'BLR', 'BEL', 'BIZ', 'BEN', 'BER', 'BHU', 'BOL', nan, 'BIH', 'BOT', nan, 'BRA', nan, 'IVB', 'BRU', 'BUL', 'BUR', 'BDI', 'CPV', 'CAM', 'CMR', 'CAN', 'CAY', 'CAF', 'CHA', 'CHI', 'CHN', nan, nan, 'COL', 'COM', 'CGO', 'COK', 'CRC', 'CIV', 'CRO', 'CUB', nan, 'CYP', 'CZE', 'DEN', 'DJI', 'DMA', 'DOM', 'COD', 'ECU', 'EGY', 'ESA', 'GEQ', 'ERI', 'EST', 'SWZ', 'ETH', nan, nan, 'FIJ', 'FIN', 'FRA', nan, nan, nan, 'GAB', 'GAM', 'GEO', 'GER', 'GHA', nan, 'GRE', nan, 'GRN', nan, 'GUM', 'GUA', nan, 'GUI', 'GBS', 'GUY', 'HAI', nan, 'HON', 'HKG', 'HUN', 'ISL', 'IND', 'INA', 'IRI', 'IRQ', 'IRL', nan, 'ISR', 'ITA', 'JAM', 'JPN', nan, 'JOR', 'KAZ', 'KEN', 'KIR', 'KOS', 'KUW', 'KGZ', 'LAO', 'LAT', 'LBN', 'LES', 'LBR', 'LBA', 'LIE', 'LTU', 'LUX', nan, 'MKD', 'MAD', 'MAW', 'MAS', 'MDV', 'MLI', 'MLT', 'MHL', nan, 'MTN', 'MRI', nan, 'MEX', 'FSM', 'MDA', 'MON', 'MGL', 'MNE', nan, 'MAR', 'MOZ', 'MYA', 'NAM', 'NRU', 'NEP', 'NED', nan, 'NZL', 'NCA', 'NIG', 'NGR', nan, nan, 'PRK', nan, 'NOR', 'OMA', 'PAK', 'PLW', 'PLE', 'PAN', 'PNG', 'PAR', 'PER', 'PHI', nan, 'POL', 'POR', 'PUR', 'QAT', nan, 'ROU', 'RUS', 'RWA', nan, 'SAM', 'SMR', 'STP', 'KSA', 'SEN', 'SRB', 'SEY', 'SLE', 'SGP', nan, 'SVK', 'SLO', 'SOL', 'SOM', 'RSA', nan, 'KOR', 'SSD', 'ESP', 'SRI', nan, nan, 'SKN', 'LCA', nan, 'VIN', 'SUD', 'SUR', nan, 'SWE', 'SUI', 'SYR', 'TPE', 'TJK', 'TAN', 'THA', 'TLS', 'TOG', nan, 'TGA', 'TTO', 'TUN', 'TUR', 'TKM', nan, 'TUV', 'UGA', 'UKR', 'UAE', 'GBR', 'USA', nan, 'ISV', 'URU', 'UZB', 'VAN', nan, 'VEN', 'VIE', nan, nan, 'YEM', 'ZAM', 'ZIM'],
+        'ISO2': ['AF', 'AX', 'AL', 'DZ', 'AS', 'AD', 'AO', 'AI', 'AQ', 'AG', 'AR', 'AM', 'AW', 'AU', 'AT', 'AZ', 'BS', 'BH', 'BD', 'BB', 'BY', 'BE', 'BZ', 'BJ', 'BM', 'BT', 'BO', 'BQ', 'BA', 'BW', 'BV', 'BR', 'IO', 'VG', 'BN', 'BG', 'BF', 'BI', 'CV', 'KH', 'CM', 'CA', 'KY', 'CF', 'TD', 'CL', 'CN', 'CX', 'CC', 'CO', 'KM', 'CG', 'CK', 'CR', 'CI', 'HR', 'CU', 'CW', 'CY', 'CZ', 'DK', 'DJ', 'DM', 'DO', 'CD', 'EC', 'EG', 'SV', 'GQ', 'ER', 'EE', 'SZ', 'ET', 'FO', 'FK', 'FJ', 'FI', 'FR', 'GF', 'PF', 'TF', 'GA', 'GM', 'GE', 'DE', 'GH', 'GI', '^GR$|^EL$', 'GL', 'GD', 'GP', 'GU', 'GT', 'GG', 'GN', 'GW', 'GY', 'HT', 'HM', 'HN', 'HK', 'HU', 'IS', 'IN', 'ID', 'IR', 'IQ', 'IE', 'IM', 'IL', 'IT', 'JM', 'JP', 'JE', 'JO', 'KZ', 'KE', 'KI', 'XK', 'KW', 'KG', 'LA', 'LV', 'LB', 'LS', 'LR', 'LY', 'LI', 'LT', 'LU', 'MO', 'MK', 'MG', 'MW', 'MY', 'MV', 'ML', 'MT', 'MH', 'MQ', 'MR', 'MU', 'YT', 'MX', 'FM', 'MD', 'MC', 'MN', 'ME', 'MS', 'MA', 'MZ', 'MM', 'NA', 'NR', 'NP', 'NL', 'NC', 'NZ', 'NI', 'NE', 'NG', 'NU', 'NF', 'KP', 'MP', 'NO', 'OM', 'PK', 'PW', 'PS', 'PA', 'PG', 'PY', 'PE', 'PH', 'PN', 'PL', 'PT', 'PR', 'QA', 'RE', 'RO', 'RU', 'RW', 'MF', 'WS', 'SM', 'ST', 'SA', 'SN', 'RS', 'SC', 'SL', 'SG', 'SX', 'SK', 'SI', 'SB', 'SO', 'ZA', 'GS', 'KR', 'SS', 'ES', 'LK', 'BL', 'SH', 'KN', 'LC', 'PM', 'VC', 'SD', 'SR', 'SJ', 'SE', 'CH', 'SY', 'TW', 'TJ', 'TZ', 'TH', 'TL', 'TG', 'TK', 'TO', 'TT', 'TN', 'TR', 'TM', 'TC', 'TV', 'UG', 'UA', 'AE', '^GB$|^UK$', 'US', 'UM', 'VI', 'UY', 'UZ', 'VU', 'VA', 'VE', 'VN', 'WF', 'EH', 'YE', 'ZM', 'ZW'],
+        'ISO3': ['AFG', 'ALA', 'ALB', 'DZA', 'ASM', 'AND', 'AGO', 'AIA', 'ATA', 'ATG', 'ARG', 'ARM', 'ABW', 'AUS', 'AUT', 'AZE', 'BHS', 'BHR', 'BGD', 'BRB', 'BLR', 'BEL', 'BLZ', 'BEN', 'BMU', 'BTN', 'BOL', 'BES', 'BIH', 'BWA', 'BVT', 'BRA', 'IOT', 'VGB', 'BRN', 'BGR', 'BFA', 'BDI', 'CPV', 'KHM', 'CMR', 'CAN', 'CYM', 'CAF', 'TCD', 'CHL', 'CHN', 'CXR', 'CCK', 'COL', 'COM', 'COG', 'COK', 'CRI', 'CIV', 'HRV', 'CUB', 'CUW', 'CYP', 'CZE', 'DNK', 'DJI', 'DMA', 'DOM', 'COD', 'ECU', 'EGY', 'SLV', 'GNQ', 'ERI', 'EST', 'SWZ', 'ETH', 'FRO', 'FLK', 'FJI', 'FIN', 'FRA', 'GUF', 'PYF', 'ATF', 'GAB', 'GMB', 'GEO', 'DEU', 'GHA', 'GIB', 'GRC', 'GRL', 'GRD', 'GLP', 'GUM', 'GTM', 'GGY', 'GIN', 'GNB', 'GUY', 'HTI', 'HMD', 'HND', 'HKG', 'HUN', 'ISL', 'IND', 'IDN', 'IRN', 'IRQ', 'IRL', 'IMN', 'ISR', 'ITA', 'JAM', 'JPN', 'JEY', 'JOR', 'KAZ', 'KEN', 'KIR', 'XKX', 'KWT', 'KGZ', 'LAO', 'LVA', 'LBN', 'LSO', 'LBR', 'LBY', 'LIE', 'LTU', 'LUX', 'MAC', 'MKD', 'MDG', 'MWI', 'MYS', 'MDV', 'MLI', 'MLT', 'MHL', 'MTQ', 'MRT', 'MUS', 'MYT', 'MEX', 'FSM', 'MDA', 'MCO', 'MNG', 'MNE', 'MSR', 'MAR', 'MOZ', 'MMR', 'NAM', 'NRU', 'NPL', 'NLD', 'NCL', 'NZL', 'NIC', 'NER', 'NGA', 'NIU', 'NFK', 'PRK', 'MNP', 'NOR', 'OMN', 'PAK', 'PLW', 'PSE', 'PAN', 'PNG', 'PRY', 'PER', 'PHL', 'PCN', 'POL', 'PRT', 'PRI', 'QAT', 'REU', 'ROU', 'RUS', 'RWA', 'MAF', 'WSM', 'SMR', 'STP', 'SAU', 'SEN', 'SRB', 'SYC', 'SLE', 'SGP', 'SXM', 'SVK', 'SVN', 'SLB', 'SOM', 'ZAF', 'SGS', 'KOR', 'SSD', 'ESP', 'LKA', 'BLM', 'SHN', 'KNA', 'LCA', 'SPM', 'VCT', 'SDN', 'SUR', 'SJM', 'SWE', 'CHE', 'SYR', 'TWN', 'TJK', 'TZA', 'THA', 'TLS', 'TGO', 'TKL', 'TON', 'TTO', 'TUN', 'TUR', 'TKM', 'TCA', 'TUV', 'UGA', 'UKR', 'ARE', 'GBR', 'USA', 'UMI', 'VIR', 'URY', 'UZB', 'VUT', 'VAT', 'VEN', 'VNM', 'WLF', 'ESH', 'YEM', 'ZMB', 'ZWE'],
+        'ISOnumeric': [4, 248, 8, 12, 16, 20, 24, 660, 10, 28, 32, 51, 533, 36, 40, 31, 44, 48, 50, 52, 112, 56, 84, 204, 60, 64, 68, 535, 70, 72, 74, 76, 86, 92, 96, 100, 854, 108, 132, 116, 120, 124, 136, 140, 148, 152, 156, 162, 166, 170, 174, 178, 184, 188, 384, 191, 192, 531, 196, 203, 208, 262, 212, 214, 180, 218, 818, 222, 226, 232, 233, 748, 231, 234, 238, 242, 246, 250, 254, 258, 260, 266, 270, 268, 276, 288, 292, 300, 304, 308, 312, 316, 320, 831, 324, 624, 328, 332, 334, 340, 344, 348, 352, 356, 360, 364, 368, 372, 833, 376, 380, 388, 392, 832, 400, 398, 404, 296, 412, 414, 417, 418, 428, 422, 426, 430, 434, 438, 440, 442, 446, 807, 450, 454, 458, 462, 466, 470, 584, 474, 478, 480, 175, 484, 583, 498, 492, 496, 499, 500, 504, 508, 104, 516, 520, 524, 528, 540, 554, 558, 562, 566, 570, 574, 408, 580, 578, 512, 586, 585, 275, 591, 598, 600, 604, 608, 612, 616, 620, 630, 634, 638, 642, 643, 646, 663, 882, 674, 678, 682, 686, 688, 690, 694, 702, 534, 703, 705, 90, 706, 710, 239, 410, 728, 724, 144, 652, 654, 659, 662, 666, 670, 729, 740, 744, 752, 756, 760, 158, 762, 834, 764, 626, 768, 772, 776, 780, 788, 792, 795, 796, 798, 800, 804, 784, 826, 840, 581, 850, 858, 860, 548, 336, 862, 704, 876, 732, 887, 894, 716],
+        'MESSAGE': ['SAS', nan, 'EEU', 'MEA', 'PAS', 'WEU', 'AFR', 'LAC', nan, 'LAC', 'LAC', 'FSU', 'LAC', 'PAO', 'WEU', 'FSU', 'LAC', 'MEA', 'SAS', 'LAC', 'FSU', 'WEU', 'LAC', 'AFR', 'LAC', 'SAS', 'LAC', 'LAC', 'EEU', 'AFR', nan, 'LAC', 'AFR', 'LAC', 'PAS', 'EEU', 'AFR', 'AFR', 'AFR', 'CPA', 'AFR', 'NAM', 'LAC', 'AFR', 'AFR', 'LAC', 'CPA', 'PAS', 'PAS', 'LAC', 'AFR', 'AFR', 'PAS', 'LAC', 'AFR', 'EEU', 'LAC', 'LAC', 'WEU', 'EEU', 'WEU', 'AFR', 'LAC', 'LAC', 'AFR', 'LAC', 'MEA', 'LAC', 'AFR', 'AFR', 'EEU', 'AFR', 'AFR', 'WEU', 'LAC', 'PAS', 'WEU', 'WEU', 'LAC', 'PAS', nan, 'AFR', 'AFR', 'FSU', 'WEU', 'AFR', 'WEU', 'WEU', 'WEU', 'LAC', 'LAC', 'NAM', 'LAC', nan, 'AFR', 'AFR', 'LAC', 'LAC', nan, 'LAC', 'CPA', 'EEU', 'WEU', 'SAS', 'PAS', 'MEA', 'MEA', 'WEU', 'WEU', 'MEA', 'WEU', 'LAC', 'PAO', nan, 'MEA', 'FSU', 'AFR', 'PAS', nan, 'MEA', 'FSU', 'CPA', 'EEU', 'MEA', 'AFR', 'AFR', 'MEA', 'WEU', 'EEU', 'WEU', 'PAS', 'EEU', 'AFR', 'AFR', 'PAS', 'SAS', 'AFR', 'WEU', 'PAS', 'LAC', 'AFR', 'AFR', 'AFR', 'LAC', 'PAS', 'FSU', 'WEU', 'CPA', 'EEU', 'LAC', 'MEA', 'AFR', 'PAS', 'AFR', 'PAS', 'SAS', 'WEU', 'PAS', 'PAO', 'LAC', 'AFR', 'AFR', 'PAS', 'PAS', 'CPA', 'PAS', 'WEU', 'MEA', 'SAS', 'PAS', 'MEA', 'LAC', 'PAS', 'LAC', 'LAC', 'PAS', 'PAS', 'EEU', 'WEU', 'NAM', 'MEA', 'AFR', 'EEU', 'FSU', 'AFR', nan, 'PAS', 'WEU', 'AFR', 'MEA', 'AFR', 'EEU', 'AFR', 'AFR', 'PAS', 'LAC', 'EEU', 'EEU', 'PAS', 'AFR', 'AFR', nan, 'PAS', 'MEA', 'WEU', 'SAS', nan, 'AFR', 'LAC', 'LAC', 'NAM', 'LAC', 'MEA', 'LAC', 'WEU', 'WEU', 'WEU', 'MEA', 'PAS', 'FSU', 'AFR', 'PAS', 'PAS', 'AFR', 'PAS', 'PAS', 'LAC', 'MEA', 'WEU', 'FSU', 'LAC', 'PAS', 'AFR', 'FSU', 'MEA', 'WEU', 'NAM', nan, 'NAM', 'LAC', 'FSU', 'PAS', 'WEU', 'LAC', 'CPA', 'PAS', 'MEA', 'MEA', 'AFR', 'AFR'],
+        'OECD': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1971, 1961, nan, nan, nan, nan, nan, nan, 1961, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1961, nan, nan, nan, 2010, nan, nan, nan, 2020, nan, nan, nan, 2021, nan, nan, nan, nan, nan, 1995, 1961, nan, nan, nan, nan, nan, nan, nan, nan, nan, 2010, nan, nan, nan, nan, nan, 1969, 1961, nan, nan, nan, nan, nan, nan, 1961, nan, nan, 1961, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1996, 1961, nan, nan, nan, nan, 1961, nan, 2010, 1962, nan, 1964, nan, nan, nan, nan, nan, nan, nan, nan, nan, 2016, nan, nan, nan, nan, nan, 2018, 1961, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1994, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1961, nan, 1973, nan, nan, nan, nan, nan, nan, nan, 1961, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1996, 1961, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 2000, 2010, nan, nan, nan, nan, 1996, nan, 1961, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1961, 1961, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 1961, nan, nan, nan, nan, nan, nan, 1961, 1961, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'REMIND': ['OAS', 'EUR', 'NEU', 'MEA', 'OAS', 'NEU', 'SSA', 'LAM', 'LAM', 'LAM', 'LAM', 'REF', 'LAM', 'CAZ', 'EUR', 'REF', 'LAM', 'MEA', 'OAS', 'LAM', 'REF', 'EUR', 'LAM', 'SSA', 'LAM', 'OAS', 'LAM', 'LAM', 'NEU', 'SSA', 'LAM', 'LAM', 'OAS', 'LAM', 'OAS', 'EUR', 'SSA', 'SSA', 'SSA', 'OAS', 'SSA', 'CAZ', 'LAM', 'SSA', 'SSA', 'LAM', 'CHA', 'OAS', 'OAS', 'LAM', 'SSA', 'SSA', 'OAS', 'LAM', 'SSA', 'EUR', 'LAM', 'LAM', 'EUR', 'EUR', 'EUR', 'SSA', 'LAM', 'LAM', 'SSA', 'LAM', 'MEA', 'LAM', 'SSA', 'SSA', 'EUR', 'SSA', 'SSA', 'EUR', 'LAM', 'OAS', 'EUR', 'EUR', 'LAM', 'OAS', 'OAS', 'SSA', 'SSA', 'REF', 'EUR', 'SSA', 'EUR', 'EUR', 'NEU', 'LAM', 'LAM', 'OAS', 'LAM', 'EUR', 'SSA', 'SSA', 'LAM', 'LAM', 'CAZ', 'LAM', 'CHA', 'EUR', 'NEU', 'IND', 'OAS', 'MEA', 'MEA', 'EUR', 'EUR', 'MEA', 'EUR', 'LAM', 'JPN', 'EUR', 'MEA', 'REF', 'SSA', 'OAS', nan, 'MEA', 'REF', 'OAS', 'EUR', 'MEA', 'SSA', 'SSA', 'MEA', 'NEU', 'EUR', 'EUR', 'CHA', 'NEU', 'SSA', 'SSA', 'OAS', 'OAS', 'SSA', 'EUR', 'OAS', 'LAM', 'SSA', 'SSA', 'SSA', 'LAM', 'OAS', 'REF', 'NEU', 'OAS', 'NEU', 'LAM', 'MEA', 'SSA', 'OAS', 'SSA', 'OAS', 'OAS', 'EUR', 'OAS', 'CAZ', 'LAM', 'SSA', 'SSA', 'OAS', 'OAS', 'OAS', 'OAS', 'NEU', 'MEA', 'OAS', 'OAS', 'MEA', 'LAM', 'OAS', 'LAM', 'LAM', 'OAS', 'OAS', 'EUR', 'EUR', 'LAM', 'MEA', 'SSA', 'EUR', 'REF', 'SSA', 'LAM', 'OAS', 'NEU', 'SSA', 'MEA', 'SSA', 'NEU', 'SSA', 'SSA', 'OAS', 'LAM', 'EUR', 'EUR', 'OAS', 'SSA', 'SSA', 'LAM', 'OAS', 'SSA', 'EUR', 'OAS', 'LAM', 'SSA', 'LAM', 'LAM', 'CAZ', 'LAM', 'MEA', 'LAM', 'NEU', 'EUR', 'NEU', 'MEA', 'CHA', 'REF', 'SSA', 'OAS', 'OAS', 'SSA', 'OAS', 'OAS', 'LAM', 'MEA', 'NEU', 'REF', 'LAM', 'OAS', 'SSA', 'REF', 'MEA', 'EUR', 'USA', 'OAS', 'LAM', 'LAM', 'REF', 'OAS', 'NEU', 'LAM', 'OAS', 'OAS', 'MEA', 'MEA', 'SSA', 'SSA'],
+        'Schengen': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'Schengen', nan, nan, nan, nan, nan, nan, 'Schengen', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'Schengen', 'Schengen', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'Schengen', nan, nan, 'Schengen', nan, nan, 'Schengen', 'Schengen', nan, nan, nan, nan, nan, nan, 'Schengen', nan, nan, 'Schengen', 'Schengen', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'Schengen', 'Schengen', nan, nan, nan, nan, nan, nan, nan, 'Schengen', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'Schengen', nan, nan, nan, nan, 'Schengen', 'Schengen', 'Schengen', nan, nan, nan, nan, nan, nan, nan, 'Schengen', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'Schengen', nan, nan, nan, nan, nan, nan, nan, nan, nan, 'Schengen', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'Schengen', 'Schengen', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'Schengen', 'Schengen', nan, nan, nan, nan, nan, nan, 'Schengen', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, 'Schengen', 'Schengen', nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'UN': [1946, nan, 1955, 1962, nan, 1993, 1976, nan, nan, 1981, 1945, 1992, nan, 1945, 1955, 1992, 1973, 1971, 1974, 1966, 1945, 1945, 1981, 1960, nan, 1971, 1945, nan, 1992, 1966, nan, 1945, nan, nan, 1984, 1955, 1960, 1962, 1975, 1955, 1960, 1945, nan, 1960, 1960, 1945, 1945, nan, nan, 1945, 1975, 1960, nan, 1945, 1960, 1992, 1945, nan, 1960, 1993, 1945, 1977, 1978, 1945, 1960, 1945, 1945, 1945, 1968, 1993, 1991, 1968, 1945, nan, nan, 1970, 1955, 1945, nan, nan, nan, 1960, 1965, 1992, 1973, 1957, nan, 1945, nan, 1974, nan, nan, 1945, nan, 1958, 1974, 1966, 1945, nan, 1945, nan, 1955, 1946, 1945, 1950, 1945, 1945, 1955, nan, 1949, 1955, 1962, 1956, nan, 1955, 1992, 1963, 1999, nan, 1963, 1992, 1955, 1991, 1945, 1966, 1945, 1955, 1990, 1991, 1945, nan, 1993, 1960, 1964, 1957, 1965, 1960, 1964, 1991, nan, 1961, 1968, nan, 1945, 1991, 1992, 1993, 1961, 2006, nan, 1956, 1975, 1948, 1990, 1999, 1955, 1945, nan, 1945, 1945, 1960, 1960, nan, nan, 1991, nan, 1945, 1971, 1947, 1994, nan, 1945, 1975, 1945, 1945, 1945, nan, 1945, 1955, nan, 1971, nan, 1955, 1945, 1962, nan, 1976, 1992, 1975, 1945, 1960, 2000, 1976, 1961, 1965, nan, 1993, 1992, 1978, 1960, 1945, nan, 1991, 2011, 1955, 1955, nan, nan, 1983, 1979, nan, 1980, 1956, 1975, nan, 1946, 2002, 1945, nan, 1992, 1961, 1946, 2002, 1960, nan, 1999, 1962, 1956, 1945, 1992, nan, 2000, 1962, 1945, 1971, 1945, 1945, nan, nan, 1945, 1992, 1981, nan, 1945, 1977, nan, nan, 1947, 1964, 1980],
+        'UNcode': [4, 248, 8, 12, 16, 20, 24, 660, 10, 28, 32, 51, 533, 36, 40, 31, 44, 48, 50, 52, 112, 56, 84, 204, 60, 64, 68, 535, 70, 72, 74, 76, 86, 92, 96, 100, 854, 108, 132, 116, 120, 124, 136, 140, 148, 152, 156, 162, 166, 170, 174, 178, 184, 188, 384, 191, 192, 531, 196, 203, 208, 262, 212, 214, 180, 218, 818, 222, 226, 232, 233, 748, 231, 234, 238, 242, 246, 250, 254, 258, 260, 266, 270, 268, 276, 288, 292, 300, 304, 308, 312, 316, 320, 831, 324, 624, 328, 332, 334, 340, 344, 348, 352, 356, 360, 364, 368, 372, 833, 376, 380, 388, 392, 832, 400, 398, 404, 296, nan, 414, 417, 418, 428, 422, 426, 430, 434, 438, 440, 442, 446, 807, 450, 454, 458, 462, 466, 470, 584, 474, 478, 480, 175, 484, 583, 498, 492, 496, 499, 500, 504, 508, 104, 516, 520, 524, 528, 540, 554, 558, 562, 566, 570, 574, 408, 580, 578, 512, 586, 585, 275, 591, 598, 600, 604, 608, 612, 616, 620, 630, 634, 638, 642, 643, 646, 663, 882, 674, 678, 682, 686, 688, 690, 694, 702, 534, 703, 705, 90, 706, 710, 239, 410, 728, 724, 144, 652, 654, 659, 662, 666, 670, 729, 740, 744, 752, 756, 760, nan, 762, 834, 764, 626, 768, 772, 776, 780, 788, 792, 795, 796, 798, 800, 804, 784, 826, 840, 581, 850, 858, 860, 548, 336, 862, 704, 876, 732, 887, 894, 716],
+        'UNmember': [1946, nan, 1955, 1962, nan, 1993, 1976, nan, nan, 1981, 1945, 1992, nan, 1945, 1955, 1992, 1973, 1971, 1974, 1966, 1945, 1945, 1981, 1960, nan, 1971, 1945, nan, 1992, 1966, nan, 1945, nan, nan, 1984, 1955, 1960, 1962, 1975, 1955, 1960, 1945, nan, 1960, 1960, 1945, 1945, nan, nan, 1945, 1975, 1960, nan, 1945, 1960, 1992, 1945, nan, 1960, 1993, 1945, 1977, 1978, 1945, 1960, 1945, 1945, 1945, 1968, 1993, 1991, 1968, 1945, nan, nan, 1970, 1955, 1945, nan, nan, nan, 1960, 1965, 1992, 1973, 1957, nan, 1945, nan, 1974, nan, nan, 1945, nan, 1958, 1974, 1966, 1945, nan, 1945, nan, 1955, 1946, 1945, 1950, 1945, 1945, 1955, nan, 1949, 1955, 1962, 1956, nan, 1955, 1992, 1963, 1999, nan, 1963, 1992, 1955, 1991, 1945, 1966, 1945, 1955, 1990, 1991, 1945, nan, 1993, 1960, 1964, 1957, 1965, 1960, 1964, 1991, nan, 1961, 1968, nan, 1945, 1991, 1992, 1993, 1961, 2006, nan, 1956, 1975, 1948, 1990, 1999, 1955, 1945, nan, 1945, 1945, 1960, 1960, nan, nan, 1991, nan, 1945, 1971, 1947, 1994, nan, 1945, 1975, 1945, 1945, 1945, nan, 1945, 1955, nan, 1971, nan, 1955, 1945, 1962, nan, 1976, 1992, 1975, 1945, 1960, 2000, 1976, 1961, 1965, nan, 1993, 1992, 1978, 1960, 1945, nan, 1991, 2011, 1955, 1955, nan, nan, 1983, 1979, nan, 1980, 1956, 1975, nan, 1946, 2002, 1945, nan, 1992, 1961, 1946, 2002, 1960, nan, 1999, 1962, 1956, 1945, 1992, nan, 2000, 1962, 1945, 1971, 1945, 1945, nan, nan, 1945, 1992, 1981, nan, 1945, 1977, nan, nan, 1947, 1964, 1980],
+        'UNregion': ['Southern Asia', 'Northern Europe', 'Southern Europe', 'Northern Africa', 'Polynesia', 'Southern Europe', 'Middle Africa', 'Caribbean', 'Antarctica', 'Caribbean', 'South America', 'Western Asia', 'Caribbean', 'Australia and New Zealand', 'Western Europe', 'Western Asia', 'Caribbean', 'Western Asia', 'Southern Asia', 'Caribbean', 'Eastern Europe', 'Western Europe', 'Central America', 'Western Africa', 'Northern America', 'Southern Asia', 'South America', 'Caribbean', 'Southern Europe', 'Southern Africa', 'South America', 'South America', 'Eastern Africa', 'Caribbean', 'South-eastern Asia', 'Eastern Europe', 'Western Africa', 'Eastern Africa', 'Western Africa', 'South-eastern Asia', 'Middle Africa', 'Northern America', 'Caribbean', 'Middle Africa', 'Middle Africa', 'South America', 'Eastern Asia', 'Australia and New Zealand', 'Australia and New Zealand', 'South America', 'Eastern Africa', 'Middle Africa', 'Polynesia', 'Central America', 'Western Africa', 'Southern Europe', 'Caribbean', 'Caribbean', 'Western Asia', 'Eastern Europe', 'Northern Europe', 'Eastern Africa', 'Caribbean', 'Caribbean', 'Middle Africa', 'South America', 'Northern Africa', 'Central America', 'Middle Africa', 'Eastern Africa', 'Northern Europe', 'Southern Africa', 'Eastern Africa', 'Northern Europe', 'South America', 'Melanesia', 'Northern Europe', 'Western Europe', 'South America', 'Polynesia', 'Eastern Africa', 'Middle Africa', 'Western Africa', 'Western Asia', 'Western Europe', 'Western Africa', 'Southern Europe', 'Southern Europe', 'Northern America', 'Caribbean', 'Caribbean', 'Micronesia', 'Central America', 'Northern Europe', 'Western Africa', 'Western Africa', 'South America', 'Caribbean', 'Australia and New Zealand', 'Central America', 'Eastern Asia', 'Eastern Europe', 'Northern Europe', 'Southern Asia', 'South-eastern Asia', 'Southern Asia', 'Western Asia', 'Northern Europe', 'Northern Europe', 'Western Asia', 'Southern Europe', 'Caribbean', 'Eastern Asia', 'Northern Europe', 'Western Asia', 'Central Asia', 'Eastern Africa', 'Micronesia', 'Southern Europe', 'Western Asia', 'Central Asia', 'South-eastern Asia', 'Northern Europe', 'Western Asia', 'Southern Africa', 'Western Africa', 'Northern Africa', 'Western Europe', 'Northern Europe', 'Western Europe', 'Eastern Asia', 'Southern Europe', 'Eastern Africa', 'Eastern Africa', 'South-eastern Asia', 'Southern Asia', 'Western Africa', 'Southern Europe', 'Micronesia', 'Caribbean', 'Western Africa', 'Eastern Africa', 'Eastern Africa', 'Central America', 'Micronesia', 'Eastern Europe', 'Western Europe', 'Eastern Asia', 'Southern Europe', 'Caribbean', 'Northern Africa', 'Eastern Africa', 'South-eastern Asia', 'Southern Africa', 'Polynesia', 'Southern Asia', 'Western Europe', 'Melanesia', 'Australia and New Zealand', 'Central America', 'Western Africa', 'Western Africa', 'Polynesia', 'Australia and New Zealand', 'Eastern Asia', 'Micronesia', 'Northern Europe', 'Western Asia', 'Southern Asia', 'Micronesia', 'Western Asia', 'Central America', 'Melanesia', 'South America', 'South America', 'South-eastern Asia', 'Polynesia', 'Eastern Europe', 'Southern Europe', 'Caribbean', 'Western Asia', 'Eastern Africa', 'Eastern Europe', 'Eastern Europe', 'Eastern Africa', 'Caribbean', 'Polynesia', 'Southern Europe', 'Middle Africa', 'Western Asia', 'Western Africa', 'Southern Europe', 'Eastern Africa', 'Western Africa', 'South-eastern Asia', 'Caribbean', 'Eastern Europe', 'Southern Europe', 'Melanesia', 'Eastern Africa', 'Southern Africa', 'South America', 'Eastern Asia', 'Eastern Africa', 'Southern Europe', 'Southern Asia', 'Caribbean', 'Western Africa', 'Caribbean', 'Caribbean', 'Northern America', 'Caribbean', 'Northern Africa', 'South America', 'Northern Europe', 'Northern Europe', 'Western Europe', 'Western Asia', 'Eastern Asia', 'Central Asia', 'Eastern Africa', 'South-eastern Asia', 'South-eastern Asia', 'Western Africa', 'Polynesia', 'Polynesia', 'Caribbean', 'Northern Africa', 'Western Asia', 'Central Asia', 'Caribbean', 'Polynesia', 'Eastern Africa', 'Eastern Europe', 'Western Asia', 'Northern Europe', 'Northern America', 'Micronesia', 'Caribbean', 'South America', 'Central Asia', 'Melanesia', 'Southern Europe', 'South America', 'South-eastern Asia', 'Polynesia', 'Northern Africa', 'Western Asia', 'Eastern Africa', 'Eastern Africa'],
+        'WIOD': ['RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'AUS', 'AUT', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'BEL', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'BRA', 'RoW', 'RoW', 'RoW', 'BGR', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'CAN', 'RoW', 'RoW', 'RoW', 'RoW', 'CHN', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'CYP', 'CZE', 'DNK', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'EST', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'FIN', 'FRA', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'DEU', 'RoW', 'RoW', 'GRC', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'HUN', 'RoW', 'IND', 'IDN', 'RoW', 'RoW', 'IRL', 'RoW', 'RoW', 'ITA', 'RoW', 'JPN', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'LVA', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'LTU', 'LUX', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'MLT', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'MEX', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'NLD', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'POL', 'PRT', 'RoW', 'RoW', 'RoW', 'ROU', 'RUS', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'SVK', 'SVN', 'RoW', 'RoW', 'RoW', 'RoW', 'KOR', 'RoW', 'ESP', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'SWE', 'RoW', 'RoW', 'TWN', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'TUR', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'GBR', 'USA', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW', 'RoW'],
+        'ccTLD': ['af', 'ax', 'al', 'dz', 'as', 'ad', 'ao', 'ai', 'aq', 'ag', 'ar', 'am', 'aw', 'au', 'at', 'az', 'bs', 'bh', 'bd', 'bb', 'by', 'be', 'bz', 'bj', 'bm', 'bt', 'bo', 'bq', 'ba', 'bw', nan, 'br', 'io', 'vg', 'bn', 'bg', 'bf', 'bi', 'cv', 'kh', 'cm', 'ca', 'ky', 'cf', 'td', 'cl', 'cn', 'cx', 'cc', 'co', 'km', 'cg', 'ck', 'cr', 'ci', 'hr', 'cu', 'cw', 'cy', 'cz', 'dk', 'dj', 'dm', 'do', 'cd', 'ec', 'eg', 'sv', 'gq', 'er', 'ee', 'sz', 'et', 'fo', 'fk', 'fj', 'fi', 'fr', 'gf', 'pf', 'tf', 'ga', 'gm', 'ge', 'de', 'gh', 'gi', 'gr', 'gl', 'gd', 'gp', 'gu', 'gt', 'gg', 'gn', 'gw', 'gy', 'ht', 'hm', 'hn', 'hk', 'hu', 'is', 'in', 'id', 'ir', 'iq', 'ie', 'im', 'il', 'it', 'jm', 'jp', 'je', 'jo', 'kz', 'ke', 'ki', nan, 'kw', 'kg', 'la', 'lv', 'lb', 'ls', 'lr', 'ly', 'li', 'lt', 'lu', 'mo', 'mk', 'mg', 'mw', 'my', 'mv', 'ml', 'mt', 'mh', 'mq', 'mr', 'mu', 'yt', 'mx', 'fm', 'md', 'mc', 'mn', 'me', 'ms', 'ma', 'mz', 'mm', 'na', 'nr', 'np', 'nl', 'nc', 'nz', 'ni', 'ne', 'ng', 'nu', 'nf', 'kp', 'mp', 'no', 'om', 'pk', 'pw', 'ps', 'pa', 'pg', 'py', 'pe', 'ph', 'pn', 'pl', 'pt', 'pr', 'qa', 're', 'ro', 'ru', 'rw', nan, 'ws', 'sm', 'st', 'sa', 'sn', 'rs', 'sc', 'sl', 'sg', 'sx', 'sk', 'si', 'sb', 'so', 'za', 'gs', 'kr', 'ss', 'es', 'lk', nan, 'sh', 'kn', 'lc', 'pm', 'vc', 'sd', 'sr', nan, 'se', 'ch', 'sy', 'tw', 'tj', 'tz', 'th', 'tl', 'tg', 'tk', 'to', 'tt', 'tn', 'tr', 'tm', 'tc', 'tv', 'ug', 'ua', 'ae', 'uk', 'us', nan, 'vi', 'uy', 'uz', 'vu', 'va', 've', 'vn', 'wf', 'eh', 'ye', 'zm', 'zw'],
+        'continent': ['Asia', 'Europe', 'Europe', 'Africa', 'Oceania', 'Europe', 'Africa', 'America', 'Antarctica', 'America', 'America', 'Asia', 'America', 'Oceania', 'Europe', 'Asia', 'America', 'Asia', 'Asia', 'America', 'Europe', 'Europe', 'America', 'Africa', 'America', 'Asia', 'America', 'America', 'Europe', 'Africa', 'Antarctica', 'America', 'Africa', 'America', 'Asia', 'Europe', 'Africa', 'Africa', 'Africa', 'Asia', 'Africa', 'America', 'America', 'Africa', 'Africa', 'America', 'Asia', 'Asia', 'Asia', 'America', 'Africa', 'Africa', 'Oceania', 'America', 'Africa', 'Europe', 'America', 'America', 'Asia', 'Europe', 'Europe', 'Africa', 'America', 'America', 'Africa', 'America', 'Africa', 'America', 'Africa', 'Africa', 'Europe', 'Africa', 'Africa', 'Europe', 'America', 'Oceania', 'Europe', 'Europe', 'America', 'Oceania', 'Africa', 'Africa', 'Africa', 'Asia', 'Europe', 'Africa', 'Europe', 'Europe', 'America', 'America', 'America', 'Oceania', 'America', 'Europe', 'Africa', 'Africa', 'America', 'America', 'Antarctica', 'America', 'Asia', 'Europe', 'Europe', 'Asia', 'Asia', 'Asia', 'Asia', 'Europe', 'Europe', 'Asia', 'Europe', 'America', 'Asia', 'Europe', 'Asia', 'Asia', 'Africa', 'Oceania', 'Europe', 'Asia', 'Asia', 'Asia', 'Europe', 'Asia', 'Africa', 'Africa', 'Africa', 'Europe', 'Europe', 'Europe', 'Asia', 'Europe', 'Africa', 'Africa', 'Asia', 'Asia', 'Africa', 'Europe', 'Oceania', 'America', 'Africa', 'Africa', 'Africa', 'America', 'Oceania', 'Europe', 'Europe', 'Asia', 'Europe', 'America', 'Africa', 'Africa', 'Asia', 'Africa', 'Oceania', 'Asia', 'Europe', 'Oceania', 'Oceania', 'America', 'Africa', 'Africa', 'Oceania', 'Oceania', 'Asia', 'Oceania', 'Europe', 'Asia', 'Asia', 'Oceania', 'Asia', 'America', 'Oceania', 'America', 'America', 'Asia', 'Oceania', 'Europe', 'Europe', 'America', 'Asia', 'Africa', 'Europe', 'Europe', 'Africa', 'America', 'Oceania', 'Europe', 'Africa', 'Asia', 'Africa', 'Europe', 'Africa', 'Africa', 'Asia', 'America', 'Europe', 'Europe', 'Oceania', 'Africa', 'Africa', 'Antarctica', 'Asia', 'Africa', 'Europe', 'Asia', 'America', 'Africa', 'America', 'America', 'America', 'America', 'Africa', 'America', 'Europe', 'Europe', 'Europe', 'Asia', 'Asia', 'Asia', 'Africa', 'Asia', 'Asia', 'Africa', 'Oceania', 'Oceania', 'America', 'Africa', 'Asia', 'Asia', 'America', 'Oceania', 'Africa', 'Europe', 'Asia', 'Europe', 'America', 'Oceania', 'America', 'America', 'Asia', 'Oceania', 'Europe', 'America', 'Asia', 'Oceania', 'Africa', 'Asia', 'Africa', 'Africa'],
+        'name_official': ['Islamic Republic of Afghanistan', 'Åland Islands', 'Republic of Albania', "People's Democratic Republic of Algeria", 'American Samoa', 'Principality of Andorra', 'Republic of Angola', 'Anguilla', 'Antarctica', 'Antigua and Barbuda', 'Argentine Republic', 'Republic of Armenia', 'Aruba', 'Commonwealth of Australia', 'Republic of Austria', 'Republic of Azerbaijan', 'Commonwealth of the Bahamas', 'Kingdom of Bahrain', "People's Republic of Bangladesh", 'Barbados', 'Republic of Belarus', 'Kingdom of Belgium', 'Belize', 'Republic of Benin', 'Bermuda', 'Kingdom of Bhutan', 'Plurinational State of Bolivia', 'Bonaire, Saint Eustatius and Saba', 'Bosnia and Herzegovina', 'Republic of Botswana', 'Bouvet Island', 'Federative Republic of Brazil', 'British Indian Ocean Territory', 'British Virgin Islands', 'Nation of Brunei, Abode of Peace', 'Republic of Bulgaria', 'Burkina Faso', 'Republic of Burundi', 'Republic of Cabo Verde', 'Kingdom of Cambodia', 'Republic of Cameroon', 'Canada', 'Cayman Islands', 'Central African Republic', 'Republic of Chad', 'Republic of Chile', "People's Republic of China", 'Christmas Island', 'Territory of the Cocos (Keeling) Islands', 'Republic of Colombia', 'Union of the Comoros', 'Republic of the Congo', 'Cook Islands', 'Republic of Costa Rica', "Republic of Côte d'Ivoire", 'Republic of Croatia', 'Republic of Cuba', 'Country of Curaçao', 'Republic of Cyprus', 'Czech Republic', 'Kingdom of Denmark', 'Republic of Djibouti', 'Commonwealth of Dominica', 'Dominican Republic', 'Democratic Republic of the Congo', 'Republic of Ecuador', 'Arab Republic of Egypt', 'Republic of El Salvador', 'Republic of Equatorial Guinea', 'State of Eritrea', 'Republic of Estonia', 'Kingdom of Eswatini', 'Federal Democratic Republic of Ethiopia', 'Faroe Islands', 'Falkland Islands (Malvinas)', 'Republic of Fiji', 'Republic of Finland', 'French Republic', 'Guiana', 'French Polynesia', 'Territory of the French Southern and Antarctic Lands', 'Gabonese Republic', 'Republic of the Gambia', 'Georgia', 'Federal Republic of Germany', 'Republic of Ghana', 'Gibraltar', 'Hellenic Republic', 'Greenland', 'Grenada', 'Guadeloupe', 'Guam', 'Republic of Guatemala', 'Guernsey', 'Republic of Guinea', 'Republic of Guinea-Bissau', 'Co-operative Republic of Guyana', 'Republic of Haiti', 'Territory of Heard Island and McDonald Islands', 'Republic of Honduras', 'Hong Kong SAR', 'Republic of Hungary', 'Republic of Iceland', 'Republic of India', 'Republic of Indonesia', 'Islamic Republic of Iran', 'Republic of Iraq', 'Ireland', 'Isle of Man', 'State of Israel', 'Italian Republic', 'Jamaica', 'Japan', 'Jersey', 'Hashemite Kingdom of Jordan', 'Republic of Kazakhstan', 'Republic of Kenya', 'Republic of Kiribati', 'Republic of Kosovo', 'State of Kuwait', 'Kyrgyz Republic', "Lao People's Democratic Republic", 'Republic of Latvia', 'Lebanese Republic', 'Kingdom of Lesotho', 'Republic of Liberia', 'State of Libya', 'Principality of Liechtenstein', 'Republic of Lithuania', 'Grand Duchy of Luxembourg', 'Macau SAR', 'Republic of North Macedonia', 'Republic of Madagascar', 'Republic of Malawi', 'Malaysia', 'Republic of Maldives', 'Republic of Mali', 'Republic of Malta', 'Republic of the Marshall Islands', 'Martinique', 'Islamic Republic of Mauritania', 'Republic of Mauritius', 'Mayotte', 'United Mexican States', 'Federated States of Micronesia', 'Republic of Moldova', 'Principality of Monaco', 'Mongolia', 'Montenegro', 'Montserrat', 'Kingdom of Morocco', 'Republic of Mozambique', 'Republic of the Union of Myanmar', 'Republic of Namibia', 'Republic of Nauru', 'Federal Democratic Republic of Nepal', 'Kingdom of the Netherlands', 'New Caledonia', 'New Zealand', 'Republic of Nicaragua', 'Republic of Niger', 'Federal Republic of Nigeria', 'Niue', 'Norfolk Island', "Democratic People's Republic of Korea", 'Northern Mariana Islands', 'Kingdom of Norway', 'Sultanate of Oman', 'Islamic Republic of Pakistan', 'Republic of Palau', 'State of Palestine', 'Republic of Panama', 'Independent State of Papua New Guinea', 'Republic of Paraguay', 'Republic of Peru', 'Republic of the Philippines', 'Pitcairn', 'Republic of Poland', 'Portuguese Republic', 'Puerto Rico', 'State of Qatar', 'Réunion', 'Romania', 'Russian Federation', 'Republic of Rwanda', 'Saint-Martin (French part)', 'Independent State of Samoa', 'Republic of San Marino', 'Democratic Republic of São Tomé and Príncipe', 'Kingdom of Saudi Arabia', 'Republic of Senegal', 'Republic of Serbia', 'Republic of Seychelles', 'Republic of Sierra Leone', 'Republic of Singapore', 'Sint Maarten (Dutch part)', 'Slovak Republic', 'Republic of Slovenia', 'Solomon Islands', 'Federal Republic of Somalia', 'Republic of South Africa', 'South Georgia and The South Sandwich Islands', 'Republic of Korea', 'Republic of South Sudan', 'Kingdom of Spain', 'Democratic Socialist Republic of Sri Lanka', 'Territorial collectivity of Saint-Barthélemy', 'Saint Helena, Ascension and Tristan da Cunha', 'Saint Kitts and Nevis', 'Saint Lucia', 'Saint Pierre and Miquelon', 'Saint Vincent and the Grenadines', 'Republic of the Sudan', 'Republic of Suriname', 'Svalbard and Jan Mayen Islands', 'Kingdom of Sweden', 'Swiss Confederation', 'Syrian Arab Republic', 'Republic of China', 'Republic of Tajikistan', 'United Republic of Tanzania', 'Kingdom of Thailand', 'Democratic Republic of Timor-Leste', 'Togolese Republic', 'Tokelau', 'Kingdom of Tonga', 'Republic of Trinidad and Tobago', 'Republic of Tunisia', 'Republic of Türkiye', 'Turkmenistan', 'Turks and Caicos Islands', 'Tuvalu', 'Republic of Uganda', 'Ukraine', 'United Arab Emirates', 'United Kingdom of Great Britain and Northern Ireland', 'United States of America', 'United States Minor Outlying Islands', 'Virgin Islands of the United States', 'Oriental Republic of Uruguay', 'Republic of Uzbekistan', 'Republic of Vanuatu', 'Vatican City State', 'Bolivarian Republic of Venezuela', 'Socialist Republic of Vietnam', 'Wallis and Futuna Islands', 'Western Sahara', 'Republic of Yemen', 'Republic of Zambia', 'Republic of Zimbabwe'],
+        'name_short': ['Afghanistan', 'Åland Islands', 'Albania', 'Algeria', 'American Samoa', 'Andorra', 'Angola', 'Anguilla', 'Antarctica', 'Antigua and Barbuda', 'Argentina', 'Armenia', 'Aruba', 'Australia', 'Austria', 'Azerbaijan', 'Bahamas', 'Bahrain', 'Bangladesh', 'Barbados', 'Belarus', 'Belgium', 'Belize', 'Benin', 'Bermuda', 'Bhutan', 'Bolivia', 'Bonaire, Saint Eustatius and Saba', 'Bosnia and Herzegovina', 'Botswana', 'Bouvet Island', 'Brazil', 'British Indian Ocean Territory', 'British Virgin Islands', 'Brunei Darussalam', 'Bulgaria', 'Burkina Faso', 'Burundi', 'Cabo Verde', 'Cambodia', 'Cameroon', 'Canada', 'Cayman Islands', 'Central African Republic', 'Chad', 'Chile', 'China', 'Christmas Island', 'Cocos (Keeling) Islands', 'Colombia', 'Comoros', 'Congo Republic', 'Cook Islands', 'Costa Rica', "Côte d'Ivoire", 'Croatia', 'Cuba', 'Curaçao', 'Cyprus', 'Czechia', 'Denmark', 'Djibouti', 'Dominica', 'Dominican Republic', 'DR Congo', 'Ecuador', 'Egypt', 'El Salvador', 'Equatorial Guinea', 'Eritrea', 'Estonia', 'Eswatini', 'Ethiopia', 'Faroe Islands', 'Falkland Islands', 'Fiji', 'Finland', 'France', 'French Guiana', 'French Polynesia', 'French Southern Territories', 'Gabon', 'Gambia', 'Georgia', 'Germany', 'Ghana', 'Gibraltar', 'Greece', 'Greenland', 'Grenada', 'Guadeloupe', 'Guam', 'Guatemala', 'Guernsey', 'Guinea', 'Guinea-Bissau', 'Guyana', 'Haiti', 'Heard and McDonald Islands', 'Honduras', 'Hong Kong', 'Hungary', 'Iceland', 'India', 'Indonesia', 'Iran', 'Iraq', 'Ireland', 'Isle of Man', 'Israel', 'Italy', 'Jamaica', 'Japan', 'Jersey', 'Jordan', 'Kazakhstan', 'Kenya', 'Kiribati', 'Kosovo', 'Kuwait', 'Kyrgyzstan', 'Laos', 'Latvia', 'Lebanon', 'Lesotho', 'Liberia', 'Libya', 'Liechtenstein', 'Lithuania', 'Luxembourg', 'Macau', 'North Macedonia', 'Madagascar', 'Malawi', 'Malaysia', 'Maldives', 'Mali', 'Malta', 'Marshall Islands', 'Martinique', 'Mauritania', 'Mauritius', 'Mayotte', 'Mexico', 'Micronesia, Fed. Sts.', 'Moldova', 'Monaco', 'Mongolia', 'Montenegro', 'Montserrat', 'Morocco', 'Mozambique', 'Myanmar', 'Namibia', 'Nauru', 'Nepal', 'Netherlands', 'New Caledonia', 'New Zealand', 'Nicaragua', 'Niger', 'Nigeria', 'Niue', 'Norfolk Island', 'North Korea', 'Northern Mariana Islands', 'Norway', 'Oman', 'Pakistan', 'Palau', 'Palestine', 'Panama', 'Papua New Guinea', 'Paraguay', 'Peru', 'Philippines', 'Pitcairn', 'Poland', 'Portugal', 'Puerto Rico', 'Qatar', 'Réunion', 'Romania', 'Russia', 'Rwanda', 'Saint-Martin', 'Samoa', 'San Marino', 'Sao Tome and Principe', 'Saudi Arabia', 'Senegal', 'Serbia', 'Seychelles', 'Sierra Leone', 'Singapore', 'Sint Maarten', 'Slovakia', 'Slovenia', 'Solomon Islands', 'Somalia', 'South Africa', 'South Georgia and South Sandwich Is.', 'South Korea', 'South Sudan', 'Spain', 'Sri Lanka', 'St. Barths', 'St. Helena', 'St. Kitts and Nevis', 'St. Lucia', 'St. Pierre and Miquelon', 'St. Vincent and the Grenadines', 'Sudan', 'Suriname', 'Svalbard and Jan Mayen Islands', 'Sweden', 'Switzerland', 'Syria', 'Taiwan', 'Tajikistan', 'Tanzania', 'Thailand', 'Timor-Leste', 'Togo', 'Tokelau', 'Tonga', 'Trinidad and Tobago', 'Tunisia', 'Türkiye', 'Turkmenistan', 'Turks and Caicos Islands', 'Tuvalu', 'Uganda', 'Ukraine', 'United Arab Emirates', 'United Kingdom', 'United States', 'United States Minor Outlying Islands', 'United States Virgin Islands', 'Uruguay', 'Uzbekistan', 'Vanuatu', 'Vatican', 'Venezuela', 'Vietnam', 'Wallis and Futuna Islands', 'Western Sahara', 'Yemen', 'Zambia', 'Zimbabwe'],
+        'obsolete': [nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan],
+        'regex': ['afghan', '\\b(a|å)land', 'albania', 'algeria', '^(?=.*americ).*samoa', 'andorra', 'angola', 'anguill?a', 'antarctica', 'antigua', 'argentin', 'armenia', '^(?!.*bonaire).*\\baruba', 'australia', 'austria', 'azerbaijan', 'bahamas', 'bahrain', 'bangladesh|^(?=.*east).*paki?stan', 'barbados', 'belarus|byelo', '^(?!.*luxem).*belgium', 'belize|^(?=.*british).*honduras', 'benin|dahome', 'bermuda', 'bhutan', 'bolivia', '^bonaire|(?=.*bonaire).*eustatius|^(?=.*carib).*netherlands|\\bbes.?islands', 'herzegovina|bosnia', 'botswana|bechuana|botsuana', 'bouvet', 'brazil', 'br.*indian.?ocean', '^(?=.*\\bu\\.?\\s?k).*virgin|^(?=.*br.*).*virgin|^(?=.*kingdom).*virgin|BVI', 'brunei', 'bulgaria', 'burkina|\\bfaso|upper.?volta', 'burundi', '(cabo|cape) *verde', 'cambodia|kampuchea|khmer|^p\\.?r\\.?k\\.?$', 'cameroon', 'canada', 'cayman', 'central.?african.?rep.*', '\\bchad', '\\bchile', '^(?!repub)(?!taiwan)(?!hong.*kong)(?!macao).*china(?!.*hong.*kong)(?!.*macao)|^PRC$', 'christmas', '\\bcocos|keeling', 'colombia', 'comoro', '^(?!.*\\bdem)(?!.*\\bdr)(?!.*kinshasa)(?!.*zaire)(?!.*belg)(?!.*l\\w{1,2}opoldville)(?!.*free)(^rep.*).*\\bcongo.*(?!.*\\bdem)(?!.*\\bdr).*|\\bwest.*congo|^congo[,;\\s]*(?!.*dem)rep.*?$|^congo$|\\bcongo.*brazza.*', '\\bcook', 'costa.?rica', '.*(ivoire|ivory)', 'croatia|hrvatska', '\\bcuba', '\\bcura(c|ç)ao', 'cyprus', '^(?=.*rep).*czech.*|czechia|bohemia|.*czech.*', 'denmark', 'djibouti', 'dominica(?!n)', 'dominican', '\\bdem.*congo|congo.*\\bdem|congo.*\\bdr|\\bdr.*congo|\\bd\\.?r\\.?c|\\bd\\.?r\\.?o\\.?c|\\br\\.?d\\.?c|belgian.?congo|congo.?free.?state|kinshasa|zaire|l\\w{1,2}opoldville|^the\\ congo$|^RDC$|^DROC$|\\bcongo.*dem.*', 'ecuador', 'egypt', 'el.?salvador', 'guine.*eq|eq.*guine|^(?=.*span).*guinea', 'eritrea', 'estonia', 'swaziland|eswatini', 'ethiopia|abyssinia', 'faroe|faeroe', 'falkland|malvinas', 'fiji', 'finland', '^(?!.*\\bdep).*france|french.?republic|\\bgaul', '^(?=.*french).*gu(i|y)ana|^(?!.*brit)(?!.*dut).*guiana', 'french.?polynesia', 'french.?southern|\\bfr.*\\bso.*\\ban.*\\b\\bt', 'gab(o|u)n', 'gambia', '^(?!.*south).*georgia(?!.*US.*)', '^(?!e|w)(fed)?.*germany(?!,? *e|,? *w)(,? *)(\\bfed)?', 'ghana|gold.?coast', 'gibraltar', 'greece|hellenic|hellas', 'greenland', 'grenada', 'guadeloupe', '\\bguam', 'guatemala', 'guernsey', '^(?!.*eq)(?!.*span)(?!.*bissau)(?!.*pap)(?!.*new)(?!p.*n.*).*guinea', '^(.*portu).*gu(i|y)nea|gu(y|i)nea.*bissau', '^(?!.*fren)(?!.*dut).*\\bguyana|^(.*brit).*gu(i|y)ana', '(ha(i|\\xef|\\xc3\\xaf)ti)', 'heard.*mc.*donald', '^(?!.*brit).*honduras', '.*hong.*kong|hksar', 'hungary', 'iceland', '^(?!\\D*(?:bassas))\\D*india(?!.*ocea)(?!na)', 'indonesia', '\\biran|persia', '\\biraq|mesopotamia', '^(?!.*north.*).*ireland', '^(?=.*isle).*\\bman', 'israel', '.*italy|.*italia.*', 'jamaica', 'japan', '^(?!.*new).*jersey', 'jordan', 'kazak', 'kenya|british.?east.?africa|east.?africa.?prot', 'kiribati', 'kosovo', 'kuwait', 'kyrgyz|kirghiz', '\\blaos?\\b', 'latvia', 'lebanon|lebanese', 'lesotho|basuto', 'liberia', 'libya', 'liechtenstein', 'lithuania', '^(?!.*belg).*luxem', '.*maca(o|u)', 'macedonia|^f\\.?y\\.?r\\.?o\\.?m\\.?$', 'madagascar|malagasy', 'malawi|nyasa', 'malaysia', 'maldive', '\\bmali\\b', '\\bmalta', 'marshall', 'martinique', 'mauritania', 'mauritius', 'mayotte', '^(?!.*new).*mexi(?!.*city)', 'micronesia', 'moldov|b(a|e)ssarabia', 'monaco', 'mongolia', '^(?!.*serbia).*montenegro', 'montserrat', 'morocco|\\bmaroc', 'mozambique', 'myanmar|burma', 'namibia', 'nauru', 'nepal', '^(?!.*\\bant)(?!.*\\bcarib).*netherlands', 'new.?caledonia', '(new|n).*zealand', 'nicaragua', '\\bniger(?!ia)', 'nigeria', 'niue', 'norfolk.*is', '^(?=.*dem).*\\bkorea|^(?=.*peo).*\\bkorea|^(?=.*nor).*\\bkorea|\\bd\\.?p\\.?r\\.|.*dpr.*|^n.*korea', 'mariana', 'norway', '\\boman|trucial', '^(?!.*east).*paki?stan', 'palau', 'palestin|\\bgaza|west.?bank', 'panama', '\\bp.*\\bn.*\\bguin.*|^p\\.?n\\.?g\\.?$|new.?guinea', 'paraguay', 'peru', 'philippines', 'pitcairn', 'poland', 'portugal|portuguese', 'puerto.?rico', 'qatar', 'reunion|réunion', 'r(o|u|ou)mania', '\\brussia', 'rwanda', '^(?!.*maarten)(?!.*saba)(?!.*dutch).*martin\\b', '^(?!.*amer.*)samoa|(\\bindep.*samoa)|^west.*samoa', 'san.?marino', 'tome|tomé', '\\bsa\\w*.?arabia', 'senegal', '^(?!.*monte).*serbia.*', 'seychell', 'sierra', 'singapore', '^(?!.*martin)(?!.*saba).*maarten|dutch.*martin|martin.*dutch', '^(?!.*cze).*slovak', 'slovenia', 'solomon', 'somali', '\\bs(\\.|outh)(?!.*sahar).*africa|^r\\.?s\\.?a\\.?$', 'south.?georgia|sandwich', '^(?!.*dem)(?!.*peo)(?!.*nor)(?!.*n)(?!.*dpr)(?!d\\.p\\.r).*\\bkorea|\\br\\.?o\\.?k\\b', '\\bs\\w*.?sudan', 'spain', 'sri.?lanka|ceylon', 'barth|barts', 'helena', 'kitts|\\bnevis', '\\blucia', 'miquelon', 'vincent', '^(?!.*\\bs(?!u)).*sudan', 'surinam|dutch.?gu(i|y)ana', '^(?!norway).*svalbard', 'swedish|sweden(?!.*except)', 'switz|swiss', 'syria', '.*taiwan|.*taipei|.*formosa|^(?!.*\\bdem)(?!.*\\bpe)(?!.*\\bdr)(^rep.*).*\\bchina.*(?!.*\\bdem.*)(?!\\bpe.*)(?!.*\\bdr.*).*|^ROC$|^taiwan r\\.?o\\.?c\\.?$', 'tajik', 'tanzania(?!: zan.*)', 'thailand|\\bsiam', '^(?=.*leste).*timor|^(?=.*east).*timor', 'togo', 'tokelau', 'tonga', 'trinidad|tobago', 'tunisia', 't[ü|u]rk[i|e]y', 'turk-?men', 'turks', 'tuvalu', 'uganda', 'ukrain', 'emirates|^u\\.?a\\.?e\\.?$|united.?arab.?em', '.*(united.?kingdom|britain|^u\\.?k\\.?$|gb)|england', '^(?!.*islands).*united.?states|^u\\.?s\\.?a\\.?$|^u\\.?s\\.?$', 'minor.?outlying.?is', '^(?=.*\\bu\\.?\\s?s).*virgin|^(?=.*states).*virgin', 'uruguay', 'uzbek', 'vanuatu|new.?hebrides', 'holy.?see|vatican|papal.?st', 'venezuela', '^((?!n|s|.*republic)|(?=.*socialist)).*viet.?nam(?! *,? *n| *,? *s)', 'futuna|wallis', '\\bw.*sahara', 'yemen', 'zambia|northern.?rhodesia', 'zimbabwe|^(?!.*northern).*rhodesia'],
+    },
+    'regex_index': ({'aby': {72}, 'afg': {0}, 'afr': {116}, 'ahr': {17}, 'aip': {218}, 'aiw': {218}, 'alb': {2}, 'alg': {3}, 'ali': {136}, 'alt': {137}, 'aly': {110}, 'ame': {4}, 'an ': {218}, 'ank': {205}, 'any': {84}, 'anz': {220}, 'arb': {19}, 'arg': {10}, 'ari': {165}, 'arm': {11}, 'aro': {150}, 'ars': {138}, 'aus': {13}, 'aze': {15}, 'azz': {51}, 'bar': {206}, 'bas': {124}, 'ben': {23}, 'bhu': {25}, 'bis': {95}, 'boh': {59}, 'bol': {26}, 'bon': {27}, 'bos': {28}, 'bri': {96}, 'bru': {34}, 'bul': {35}, 'bvi': {33}, 'cal': {157}, 'cam': {40}, 'car': {159}, 'cay': {42}, 'cey': {205}, 'cha': {44}, 'chr': {47}, 'chu': {29}, 'coa': {85}, 'coc': {48}, 'col': {49}, 'com': {50}, 'con': {51}, 'coo': {52}, 'cub': {56}, 'cur': {57}, 'cyp': {58}, 'cze': {59}, 'dag': {132}, 'dah': {23}, 'del': {90}, 'den': {60}, 'dia': {32, 103}, 'dji': {61}, 'dut': {213}, 'eas': {18}, 'ecu': {65}, 'eec': {87}, 'een': {88}, 'egy': {66}, 'ele': {207}, 'elg': {21}, 'ero': {73}, 'eru': {174}, 'erz': {28}, 'esw': {71}, 'eun': {181}, 'eus': {27}, 'eyc': {192}, 'fal': {74}, 'fas': {36}, 'fij': {75}, 'fin': {76}, 'for': {218}, 'fra': {77}, 'fre': {78}, 'fut': {245}, 'gab': {81}, 'gam': {82}, 'gap': {194}, 'gau': {77}, 'gaz': {170}, 'geo': {83, 201}, 'gib': {86}, 'gol': {6, 147}, 'gue': {93}, 'guy': {96}, 'ham': {16}, 'han': {85}, 'heb': {241}, 'hia': {59}, 'hin': {46, 218}, 'hks': {100}, 'hol': {242}, 'hon': {100}, 'hrv': {55}, 'hun': {101}, 'iam': {221}, 'ibe': {125}, 'iby': {126}, 'ice': {102}, 'ile': {45}, 'inc': {211}, 'ino': {187}, 'ira': {105}, 'isr': {109}, 'itr': {69}, 'ivo': {54}, 'jam': {111}, 'jap': {112}, 'jer': {113}, 'jor': {114}, 'kaz': {115}, 'kee': {48}, 'ken': {116}, 'kir': {117}, 'kit': {208}, 'kos': {118}, 'kuw': {119}, 'lag': {132}, 'lan': {1}, 'lao': {121}, 'lar': {20}, 'lat': {122}, 'lau': {169}, 'law': {133}, 'lay': {134}, 'ldi': {135}, 'leb': {123}, 'lie': {127}, 'lit': {128}, 'liz': {22}, 'lla': {87}, 'lle': {87}, 'luc': {209}, 'lux': {129}, 'lvi': {74}, 'lyn': {79}, 'maa': {195}, 'mac': {130}, 'man': {182}, 'mau': {140, 141}, 'may': {142}, 'mes': {106}, 'mex': {143}, 'mib': {153}, 'mic': {144}, 'miq': {210}, 'mol': {145}, 'moz': {151}, 'mya': {152}, 'nac': {146}, 'nad': {41}, 'nal': {98}, 'nau': {154}, 'nde': {186}, 'ndo': {104}, 'ndw': {201}, 'nea': {68, 94}, 'nep': {155}, 'net': {27, 156}, 'nev': {208}, 'nez': {243}, 'ngd': {33}, 'ngl': {18}, 'ngu': {7}, 'nid': {226}, 'nig': {160, 161}, 'nio': {181}, 'niq': {139}, 'nis': {227}, 'niu': {162}, 'nta': {8}, 'nte': {148}, 'ntr': {43}, 'nts': {149}, 'oba': {226}, 'occ': {150}, 'oma': {167}, 'omi': {62, 63}, 'ond': {22, 99}, 'orf': {163}, 'orr': {5}, 'orw': {166}, 'ost': {53}, 'ouv': {30}, 'ova': {196}, 'ove': {197}, 'pan': {171}, 'pap': {242}, 'par': {173}, 'phi': {175}, 'pit': {176}, 'pol': {177}, 'prc': {46}, 'pue': {179}, 'qat': {180}, 'rab': {189}, 'raq': {106}, 'raz': {31}, 'rbi': {191}, 'rel': {107}, 'ren': {89}, 'rep': {77}, 'rgh': {120}, 'rho': {249}, 'rki': {36}, 'rks': {230}, 'rmu': {24}, 'roa': {55}, 'roc': {218}, 'roe': {73}, 'rsi': {105}, 'rth': {248}, 'rti': {185, 195}, 'rtu': {95}, 'rub': {12}, 'rug': {239}, 'rwa': {184}, 'sah': {246}, 'sal': {67}, 'sam': {186}, 'sen': {190}, 'sie': {193}, 'sla': {27}, 'sle': {108}, 'sol': {198}, 'som': {199}, 'sot': {124}, 'spa': {204}, 'ssa': {145}, 'sta': {168}, 'ste': {222}, 'sti': {170}, 'sto': {70}, 'sud': {203, 212}, 'sur': {213}, 'sva': {214}, 'swe': {215}, 'swi': {216}, 'syr': {217}, 'taj': {219}, 'tal': {110}, 'tem': {92}, 'tes': {238}, 'tha': {221}, 'thi': {72}, 'tig': {9}, 'tim': {222}, 'tis': {116}, 'tog': {223}, 'tok': {224}, 'tom': {188}, 'ton': {225}, 'tri': {14}, 'tru': {167}, 'tsu': {29}, 'tsw': {29}, 'tug': {178}, 'tur': {229}, 'tuv': {231}, 'uam': {91}, 'uga': {232}, 'uia': {78}, 'uin': {68}, 'ukr': {233}, 'und': {37}, 'upp': {36}, 'urm': {152}, 'uss': {183}, 'utl': {237}, 'uzb': {240}, 'van': {241}, 'vat': {242}, 'ver': {38}, 'vie': {244}, 'vir': {33, 238}, 'wal': {245}, 'waz': {71}, 'wes': {170}, 'yas': {133}, 'yel': {20}, 'yem': {247}, 'yrg': {120}, 'zam': {248}, 'zea': {158}, 'zim': {249}}, {39, 64, 80, 97, 131, 164, 172, 200, 202, 228, 234, 235, 236}),
+    'code_index': {'APEC': {'apec': [13, 34, 41, 45, 46, 100, 104, 112, 134, 143, 158, 172, 174, 175, 183, 194, 202, 218, 221, 236, 244]}, 'BASIC': {'basic': [31, 46, 103, 200]}, 'BRIC': {'bric': [31, 46, 103, 183]}, 'CC41': {'rest of world': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 15, 16, 17, 18, 19, 20, 22, 23, 24, 25, 26, 27, 28, 29, 30, 32, 33, 34, 36, 37, 38, 39, 40, 42, 43, 44, 45, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 61, 62, 63, 64, 65, 66, 67, 68, 69, 71, 72, 73, 74, 75, 78, 79, 80, 81, 82, 83, 85, 86, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 102, 105, 106, 108, 109, 111, 113, 114, 115, 116, 117, 118, 119, 120, 121, 123, 124, 125, 126, 127, 130, 131, 132, 133, 134, 135, 136, 138, 139, 140, 141, 142, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 179, 180, 181, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 198, 199, 200, 201, 203, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 216, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 229, 230, 231, 232, 233, 234, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249], 'australia': [13], 'austria': [14], 'belgium': [21], 'brazil': [31], 'bulgaria': [35], 'canada': [41], 'china': [46], 'cyprus': [58], 'czech republic': [59], 'denmark': [60], 'estonia': [70], 'finland': [76], 'france': [77], 'germany': [84], 'greece': [87], 'hungary': [101], 'india': [103], 'indonesia': [104], 'ireland': [107], 'italy': [110], 'japan': [112], 'latvia': [122], 'lithuania': [128], 'luxembourg': [129], 'malta': [137], 'mexico': [143], 'netherlands': [156], 'poland': [177], 'portugal': [178], 'romania': [182], 'russia': [183], 'slovakia': [196], 'slovenia': [197], 'korea': [202], 'spain': [204], 'sweden': [215], 'taiwan': [218], 'turkey': [228], 'great britain and n': [235], 'usa': [236]}, 'CIS': {'cis': [11, 15, 20, 115, 145, 183, 219, 240]}, 'Cecilia2050': {'row': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 15, 16, 17, 18, 19, 20, 22, 23, 24, 25, 26, 27, 28, 29, 30, 32, 33, 34, 36, 37, 38, 39, 40, 42, 43, 44, 45, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 61, 62, 63, 64, 65, 66, 67, 68, 69, 71, 72, 73, 74, 75, 78, 79, 80, 81, 82, 83, 85, 86, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 102, 105, 106, 108, 109, 111, 113, 114, 115, 116, 117, 118, 119, 120, 121, 123, 124, 125, 126, 127, 130, 131, 132, 133, 134, 135, 136, 138, 139, 140, 141, 142, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 157, 158, 159, 160, 161, 162, 163, 164, 165, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 179, 180, 181, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 198, 199, 201, 203, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 229, 230, 231, 232, 233, 234, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249], 'hi': [13, 41, 112, 166, 202, 216, 218, 236], 'eu': [14, 21, 35, 58, 59, 60, 70, 76, 77, 84, 87, 101, 107, 110, 122, 128, 129, 137, 156, 177, 178, 182, 196, 197, 204, 215, 235], 'bx': [31, 46, 103, 104, 143, 183, 200, 228]}, 'CoE': {'coe': [2, 5, 11, 14, 15, 21, 28, 35, 55, 58, 59, 60, 70, 76, 77, 83, 84, 87, 101, 102, 107, 110, 122, 127, 128, 129, 131, 137, 145, 146, 148, 156, 166, 177, 178, 182, 187, 191, 196, 197, 204, 215, 216, 228, 233, 235]}, 'Continent_7': {'asia': [0, 11, 15, 17, 18, 25, 32, 34, 39, 46, 47, 48, 83, 100, 103, 104, 105, 106, 109, 112, 114, 115, 119, 120, 121, 123, 130, 134, 135, 147, 152, 155, 164, 167, 168, 170, 175, 180, 189, 194, 202, 205, 217, 218, 219, 221, 222, 228, 229, 234, 240, 244, 247], 'europe': [1, 2, 5, 14, 20, 21, 28, 35, 55, 58, 59, 60, 70, 73, 76, 77, 84, 86, 87, 93, 101, 102, 107, 108, 110, 113, 118, 122, 127, 128, 129, 131, 137, 145, 146, 148, 156, 166, 177, 178, 182, 183, 187, 191, 196, 197, 204, 214, 215, 216, 233, 235, 242], 'africa': [3, 6, 23, 29, 36, 37, 38, 40, 43, 44, 50, 51, 54, 61, 64, 66, 68, 69, 71, 72, 81, 82, 85, 94, 95, 116, 124, 125, 126, 132, 133, 136, 140, 141, 142, 150, 151, 153, 160, 161, 181, 184, 188, 190, 192, 193, 199, 200, 203, 207, 212, 220, 223, 227, 232, 246, 248, 249], 'oceania': [4, 13, 52, 75, 79, 91, 117, 138, 144, 154, 157, 158, 162, 163, 165, 169, 172, 176, 186, 198, 224, 225, 231, 237, 241, 245], 'north america': [7, 9, 12, 16, 19, 22, 24, 27, 33, 41, 42, 53, 56, 57, 62, 63, 67, 88, 89, 90, 92, 97, 99, 111, 139, 143, 149, 159, 171, 179, 185, 195, 206, 208, 209, 210, 211, 226, 230, 236, 238], 'antarctica': [8, 30, 80, 98], 'south america': [10, 26, 31, 45, 49, 65, 74, 78, 96, 173, 174, 201, 213, 239, 243]}, 'DACcode': {'625': [0], '71': [2], '130': [3], '880': [4], '225': [6], '377': [9], '425': [10], '610': [11], '801': [13], '1': [14], '611': [15], '666': [18], '86': [20], '2': [21], '352': [22], '236': [23], '630': [25], '428': [26], '64': [28], '227': [29], '431': [31], '72': [35], '287': [36], '228': [37], '230': [38], '728': [39], '229': [40], '301': [41], '231': [43], '232': [44], '730': [46], '437': [49], '233': [50], '234': [51], '336': [53], '247': [54], '62': [55], '338': [56], '30': [58], '68': [59], '3': [60], '274': [61], '378': [62], '340': [63], '235': [64], '440': [65], '142': [66], '342': [67], '245': [68], '271': [69], '82': [70], '280': [71], '238': [72], '832': [75], '18': [76], '4': [77], '239': [81], '240': [82], '612': [83], '5': [84], '241': [85], '40': [87], '381': [89], '347': [92], '243': [94], '244': [95], '446': [96], '349': [97], '351': [99], '75': [101], '20': [102], '645': [103], '738': [104], '540': [105], '543': [106], '21': [107], '546': [109], '6': [110], '354': [111], '701': [112], '549': [114], '613': [115], '248': [116], '836': [117], '57': [118], '552': [119], '614': [120], '745': [121], '83': [122], '555': [123], '249': [124], '251': [125], '133': [126], '70': [127], '84': [128], '22': [129], '66': [131], '252': [132], '253': [133], '751': [134], '655': [135], '255': [136], '45': [137], '859': [138], '256': [140], '257': [141], '358': [143], '860': [144], '93': [145], '753': [147], '65': [148], '385': [149], '136': [150], '259': [151], '635': [152], '275': [153], '845': [154], '660': [155], '7': [156], '820': [158], '364': [159], '260': [160], '261': [161], '856': [162], '740': [164], '8': [166], '665': [168], '861': [169], '550': [170], '366': [171], '862': [172], '451': [173], '454': [174], '755': [175], '76': [177], '9': [178], '561': [180], '77': [182], '87': [183], '266': [184], '268': [188], '566': [189], '269': [190], '63': [191], '272': [193], '69': [196], '61': [197], '866': [198], '273': [199], '218': [200], '742': [202], '279': [203], '50': [204], '640': [205], '276': [207], '383': [209], '384': [211], '278': [212], '457': [213], '10': [215], '11': [216], '573': [217], '732': [218], '615': [219], '282': [220], '764': [221], '765': [222], '283': [223], '868': [224], '870': [225], '139': [227], '55': [228], '616': [229], '872': [231], '285': [232], '85': [233], '576': [234], '12': [235], '302': [236], '617': [240], '854': [241], '463': [243], '769': [244], '876': [245], '580': [247], '288': [248], '265': [249]}, 'EEA': {'eea': [14, 21, 35, 55, 58, 59, 60, 70, 76, 77, 84, 87, 101, 102, 107, 110, 122, 127, 128, 129, 137, 156, 166, 177, 178, 182, 196, 197, 204, 215]}, 'EU': {'eu': [14, 21, 35, 55, 58, 59, 60, 70, 76, 77, 84, 87, 101, 107, 110, 122, 128, 129, 137, 156, 177, 178, 182, 196, 197, 204, 215]}, 'EU12': {'eu12': [21, 60, 77, 84, 87, 107, 110, 129, 156, 178, 204, 235]}, 'EU15': {'eu15': [14, 21, 60, 76, 77, 84, 87, 107, 110, 129, 156, 178, 204, 215, 235]}, 'EU25': {'eu25': [14, 21, 58, 59, 60, 70, 76, 77, 84, 87, 101, 107, 110, 122, 128, 129, 137, 156, 177, 178, 196, 197, 204, 215, 235]}, 'EU27': {'eu27': [14, 21, 35, 55, 58, 59, 60, 70, 76, 77, 84, 87, 101, 107, 110, 122, 128, 129, 137, 156, 177, 178, 182, 196, 197, 204, 215]}, 'EU27_2007': {'eu27_2007': [14, 21, 35, 58, 59, 60, 70, 76, 77, 84, 87, 101, 107, 110, 122, 128, 129, 137, 156, 177, 178, 182, 196, 197, 204, 215, 235]}, 'EU28': {'eu28': [14, 21, 35, 55, 58, 59, 60, 70, 76, 77, 84, 87, 101, 107, 110, 122, 128, 129, 137, 156, 177, 178, 182, 196, 197, 204, 215, 235]}, 'EURO': {'1999': [14, 21, 76, 77, 84, 107, 110, 129, 156, 178, 204], '2023': [55], '2008': [58, 137], '2011': [70], '2001': [87], '2014': [122], '2015': [128], '2009': [196], '2007': [197]}, 'EXIO1': {'ww': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 15, 16, 17, 18, 19, 20, 22, 23, 24, 25, 26, 27, 28, 29, 30, 32, 33, 34, 36, 37, 38, 39, 40, 42, 43, 44, 45, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 61, 62, 63, 64, 65, 66, 67, 68, 69, 71, 72, 73, 74, 75, 78, 79, 80, 81, 82, 83, 85, 86, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 102, 105, 106, 108, 109, 111, 113, 114, 115, 116, 117, 118, 119, 120, 121, 123, 124, 125, 126, 127, 130, 131, 132, 133, 134, 135, 136, 138, 139, 140, 141, 142, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 157, 158, 159, 160, 161, 162, 163, 164, 165, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 179, 180, 181, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 198, 199, 201, 203, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 229, 230, 231, 232, 233, 234, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249], 'au': [13], 'at': [14], 'be': [21], 'br': [31], 'bg': [35], 'ca': [41], 'cn': [46], 'cy': [58], 'cz': [59], 'dk': [60], 'ee': [70], 'fi': [76], 'fr': [77], 'de': [84], 'gr': [87], 'hu': [101], 'in': [103], 'id': [104], 'ie': [107], 'it': [110], 'jp': [112], 'lv': [122], 'lt': [128], 'lu': [129], 'mt': [137], 'mx': [143], 'nl': [156], 'no': [166], 'pl': [177], 'pt': [178], 'ro': [182], 'ru': [183], 'sk': [196], 'si': [197], 'za': [200], 'kr': [202], 'es': [204], 'se': [215], 'ch': [216], 'tw': [218], 'tr': [228], 'gb': [235], 'us': [236]}, 'EXIO1_3L': {'www': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 15, 16, 17, 18, 19, 20, 22, 23, 24, 25, 26, 27, 28, 29, 30, 32, 33, 34, 36, 37, 38, 39, 40, 42, 43, 44, 45, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 61, 62, 63, 64, 65, 66, 67, 68, 69, 71, 72, 73, 74, 75, 78, 79, 80, 81, 82, 83, 85, 86, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 102, 105, 106, 108, 109, 111, 113, 114, 115, 116, 117, 118, 119, 120, 121, 123, 124, 125, 126, 127, 130, 131, 132, 133, 134, 135, 136, 138, 139, 140, 141, 142, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 157, 158, 159, 160, 161, 162, 163, 164, 165, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 179, 180, 181, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 198, 199, 201, 203, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 229, 230, 231, 232, 233, 234, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249], 'aus': [13], 'aut': [14], 'bel': [21], 'bra': [31], 'bgr': [35], 'can': [41], 'chn': [46], 'cyp': [58], 'cze': [59], 'dnk': [60], 'est': [70], 'fin': [76], 'fra': [77], 'deu': [84], 'grc': [87], 'hun': [101], 'ind': [103], 'idn': [104], 'irl': [107], 'ita': [110], 'jpn': [112], 'lva': [122], 'ltu': [128], 'lux': [129], 'mlt': [137], 'mex': [143], 'nld': [156], 'nor': [166], 'pol': [177], 'prt': [178], 'rom': [182], 'rus': [183], 'svk': [196], 'svn': [197], 'zaf': [200], 'kor': [202], 'esp': [204], 'swe': [215], 'che': [216], 'twn': [218], 'tur': [228], 'gbr': [235], 'usa': [236]}, 'EXIO2': {'wa': [0, 4, 8, 11, 15, 18, 25, 30, 32, 34, 39, 47, 48, 52, 75, 79, 83, 91, 98, 100, 115, 117, 120, 121, 130, 134, 135, 138, 144, 147, 152, 154, 155, 157, 158, 162, 163, 164, 165, 168, 169, 172, 175, 176, 186, 194, 198, 201, 205, 219, 221, 222, 224, 225, 229, 231, 237, 240, 241, 244, 245], 'we': [1, 2, 5, 20, 28, 55, 73, 86, 93, 102, 108, 113, 118, 127, 131, 145, 146, 148, 187, 191, 214, 233, 242], 'wf': [3, 6, 23, 29, 36, 37, 38, 40, 43, 44, 50, 51, 54, 61, 64, 68, 69, 71, 72, 80, 81, 82, 85, 94, 95, 116, 124, 125, 126, 132, 133, 136, 140, 141, 142, 150, 151, 153, 160, 161, 181, 184, 188, 190, 192, 193, 199, 203, 207, 212, 220, 223, 227, 232, 246, 248, 249], 'wl': [7, 9, 10, 12, 16, 19, 22, 24, 26, 27, 33, 42, 45, 49, 53, 56, 57, 62, 63, 65, 67, 74, 78, 88, 89, 90, 92, 96, 97, 99, 111, 139, 149, 159, 171, 173, 174, 179, 185, 195, 206, 208, 209, 210, 211, 213, 226, 230, 238, 239, 243], 'au': [13], 'at': [14], 'wm': [17, 66, 105, 106, 109, 114, 119, 123, 167, 170, 180, 189, 217, 234, 247], 'be': [21], 'br': [31], 'bg': [35], 'ca': [41], 'cn': [46], 'cy': [58], 'cz': [59], 'dk': [60], 'ee': [70], 'fi': [76], 'fr': [77], 'de': [84], 'gr': [87], 'hu': [101], 'in': [103], 'id': [104], 'ie': [107], 'it': [110], 'jp': [112], 'lv': [122], 'lt': [128], 'lu': [129], 'mt': [137], 'mx': [143], 'nl': [156], 'no': [166], 'pl': [177], 'pt': [178], 'ro': [182], 'ru': [183], 'sk': [196], 'si': [197], 'za': [200], 'kr': [202], 'es': [204], 'se': [215], 'ch': [216], 'tw': [218], 'tr': [228], 'gb': [235], 'us': [236]}, 'EXIO2_3L': {'wwa': [0, 4, 8, 11, 15, 18, 25, 30, 32, 34, 39, 47, 48, 52, 75, 79, 83, 91, 98, 100, 115, 117, 120, 121, 130, 134, 135, 138, 144, 147, 152, 154, 155, 157, 158, 162, 163, 164, 165, 168, 169, 172, 175, 176, 186, 194, 198, 201, 205, 219, 221, 222, 224, 225, 229, 231, 237, 240, 241, 244, 245], 'wwe': [1, 2, 5, 20, 28, 55, 73, 86, 93, 102, 108, 113, 118, 127, 131, 145, 146, 148, 187, 191, 214, 233, 242], 'wwf': [3, 6, 23, 29, 36, 37, 38, 40, 43, 44, 50, 51, 54, 61, 64, 68, 69, 71, 72, 80, 81, 82, 85, 94, 95, 116, 124, 125, 126, 132, 133, 136, 140, 141, 142, 150, 151, 153, 160, 161, 181, 184, 188, 190, 192, 193, 199, 203, 207, 212, 220, 223, 227, 232, 246, 248, 249], 'wwl': [7, 9, 10, 12, 16, 19, 22, 24, 26, 27, 33, 42, 45, 49, 53, 56, 57, 62, 63, 65, 67, 74, 78, 88, 89, 90, 92, 96, 97, 99, 111, 139, 149, 159, 171, 173, 174, 179, 185, 195, 206, 208, 209, 210, 211, 213, 226, 230, 238, 239, 243], 'aus': [13], 'aut': [14], 'wwm': [17, 66, 105, 106, 109, 114, 119, 123, 167, 170, 180, 189, 217, 234, 247], 'bel': [21], 'bra': [31], 'bgr': [35], 'can': [41], 'chn': [46], 'cyp': [58], 'cze': [59], 'dnk': [60], 'est': [70], 'fin': [76], 'fra': [77], 'deu': [84], 'grc': [87], 'hun': [101], 'ind': [103], 'idn': [104], 'irl': [107], 'ita': [110], 'jpn': [112], 'lva': [122], 'ltu': [128], 'lux': [129], 'mlt': [137], 'mex': [143], 'nld': [156], 'nor': [166], 'pol': [177], 'prt': [178], 'rom': [182], 'rus': [183], 'svk': [196], 'svn': [197], 'zaf': [200], 'kor': [202], 'esp': [204], 'swe': [215], 'che': [216], 'twn': [218], 'tur': [228], 'gbr': [235], 'usa': [236]}, 'EXIO3': {'wa': [0, 4, 8, 11, 15, 18, 25, 30, 32, 34, 39, 47, 48, 52, 75, 79, 83, 91, 98, 100, 115, 117, 120, 121, 130, 134, 135, 138, 144, 147, 152, 154, 155, 157, 158, 162, 163, 164, 165, 168, 169, 172, 175, 176, 186, 194, 198, 201, 205, 219, 221, 222, 224, 225, 229, 231, 237, 240, 241, 244, 245], 'we': [1, 2, 5, 20, 28, 73, 86, 93, 102, 108, 113, 118, 127, 131, 145, 146, 148, 187, 191, 214, 233, 242], 'wf': [3, 6, 23, 29, 36, 37, 38, 40, 43, 44, 50, 51, 54, 61, 64, 68, 69, 71, 72, 80, 81, 82, 85, 94, 95, 116, 124, 125, 126, 132, 133, 136, 140, 141, 142, 150, 151, 153, 160, 161, 181, 184, 188, 190, 192, 193, 199, 203, 207, 212, 220, 223, 227, 232, 246, 248, 249], 'wl': [7, 9, 10, 12, 16, 19, 22, 24, 26, 27, 33, 42, 45, 49, 53, 56, 57, 62, 63, 65, 67, 74, 78, 88, 89, 90, 92, 96, 97, 99, 111, 139, 149, 159, 171, 173, 174, 179, 185, 195, 206, 208, 209, 210, 211, 213, 226, 230, 238, 239, 243], 'au': [13], 'at': [14], 'wm': [17, 66, 105, 106, 109, 114, 119, 123, 167, 170, 180, 189, 217, 234, 247], 'be': [21], 'br': [31], 'bg': [35], 'ca': [41], 'cn': [46], 'hr': [55], 'cy': [58], 'cz': [59], 'dk': [60], 'ee': [70], 'fi': [76], 'fr': [77], 'de': [84], 'gr': [87], 'hu': [101], 'in': [103], 'id': [104], 'ie': [107], 'it': [110], 'jp': [112], 'lv': [122], 'lt': [128], 'lu': [129], 'mt': [137], 'mx': [143], 'nl': [156], 'no': [166], 'pl': [177], 'pt': [178], 'ro': [182], 'ru': [183], 'sk': [196], 'si': [197], 'za': [200], 'kr': [202], 'es': [204], 'se': [215], 'ch': [216], 'tw': [218], 'tr': [228], 'gb': [235], 'us': [236]}, 'EXIO3_3L': {'wwa': [0, 4, 8, 11, 15, 18, 25, 30, 32, 34, 39, 47, 48, 52, 75, 79, 83, 91, 98, 100, 115, 117, 120, 121, 130, 134, 135, 138, 144, 147, 152, 154, 155, 157, 158, 162, 163, 164, 165, 168, 169, 172, 175, 176, 186, 194, 198, 201, 205, 219, 221, 222, 224, 225, 229, 231, 237, 240, 241, 244, 245], 'wwe': [1, 2, 5, 20, 28, 73, 86, 93, 102, 108, 113, 118, 127, 131, 145, 146, 148, 187, 191, 214, 233, 242], 'wwf': [3, 6, 23, 29, 36, 37, 38, 40, 43, 44, 50, 51, 54, 61, 64, 68, 69, 71, 72, 80, 81, 82, 85, 94, 95, 116, 124, 125, 126, 132, 133, 136, 140, 141, 142, 150, 151, 153, 160, 161, 181, 184, 188, 190, 192, 193, 199, 203, 207, 212, 220, 223, 227, 232, 246, 248, 249], 'wwl': [7, 9, 10, 12, 16, 19, 22, 24, 26, 27, 33, 42, 45, 49, 53, 56, 57, 62, 63, 65, 67, 74, 78, 88, 89, 90, 92, 96, 97, 99, 111, 139, 149, 159, 171, 173, 174, 179, 185, 195, 206, 208, 209, 210, 211, 213, 226, 230, 238, 239, 243], 'aus': [13], 'aut': [14], 'wwm': [17, 66, 105, 106, 109, 114, 119, 123, 167, 170, 180, 189, 217, 234, 247], 'bel': [21], 'bra': [31], 'bgr': [35], 'can': [41], 'chn': [46], 'hrv': [55], 'cyp': [58], 'cze': [59], 'dnk': [60], 'est': [70], 'fin': [76], 'fra': [77], 'deu': [84], 'grc': [87], 'hun': [101], 'ind': [103], 'idn': [104], 'irl': [107], 'ita': [110], 'jpn': [112], 'lva': [122], 'ltu': [128], 'lux': [129], 'mlt': [137], 'mex': [143], 'nld': [156], 'nor': [166], 'pol': [177], 'prt': [178], 'rom': [182], 'rus': [183], 'svk': [196], 'svn': [197], 'zaf': [200], 'kor': [202], 'esp': [204], 'swe': [215], 'che': [216], 'twn': [218], 'tur': [228], 'gbr': [235], 'usa': [236]}, 'Eora': {'afg': [0], 'ala': [1], 'alb': [2], 'dza': [3], 'asm': [4], 'and': [5], 'ago': [6], 'aia': [7], 'atg': [9], 'arg': [10], 'arm': [11], 'abw': [12], 'aus': [13], 'aut': [14], 'aze': [15], 'bhs': [16], 'bhr': [17], 'bgd': [18], 'brb': [19], 'blr': [20], 'bel': [21], 'blz': [22], 'ben': [23], 'bmu': [24], 'btn': [25], 'bol': [26], 'bih': [28], 'bwa': [29], 'bra': [31], 'vgb': [33], 'brn': [34], 'bgr': [35], 'bfa': [36], 'bdi': [37], 'cpv': [38], 'khm': [39], 'cmr': [40], 'can': [41], 'cym': [42], 'caf': [43], 'tcd': [44], 'chl': [45], 'chn': [46], 'col': [49], 'com': [50], 'cog': [51], 'cok': [52], 'cri': [53], 'civ': [54], 'hrv': [55], 'cub': [56], 'cyp': [58], 'cze': [59], 'dnk': [60], 'dji': [61], 'dma': [62], 'dom': [63], 'cod': [64], 'ecu': [65], 'egy': [66], 'slv': [67], 'gnq': [68], 'eri': [69], 'est': [70], 'swz': [71], 'eth': [72], 'fro': [73], 'flk': [74], 'fji': [75], 'fin': [76], 'fra': [77], 'guf': [78], 'pyf': [79], 'gab': [81], 'gmb': [82], 'geo': [83], 'deu': [84], 'gha': [85], 'gib': [86], 'grc': [87], 'grl': [88], 'grd': [89], 'glp': [90], 'gum': [91], 'gtm': [92], 'ggy': [93], 'gin': [94], 'gnb': [95], 'guy': [96], 'hti': [97], 'hnd': [99], 'hkg': [100], 'hun': [101], 'isl': [102], 'ind': [103], 'idn': [104], 'irn': [105], 'irq': [106], 'irl': [107], 'imn': [108], 'isr': [109], 'ita': [110], 'jam': [111], 'jpn': [112], 'jey': [113], 'jor': [114], 'kaz': [115], 'ken': [116], 'kir': [117], 'ksv': [118], 'kwt': [119], 'kgz': [120], 'lao': [121], 'lva': [122], 'lbn': [123], 'lso': [124], 'lbr': [125], 'lby': [126], 'lie': [127], 'ltu': [128], 'lux': [129], 'mac': [130], 'mkd': [131], 'mdg': [132], 'mwi': [133], 'mys': [134], 'mdv': [135], 'mli': [136], 'mlt': [137], 'mhl': [138], 'mtq': [139], 'mrt': [140], 'mus': [141], 'myt': [142], 'mex': [143], 'fsm': [144], 'mda': [145], 'mco': [146], 'mng': [147], 'mne': [148], 'msr': [149], 'mar': [150], 'moz': [151], 'mmr': [152], 'nam': [153], 'nru': [154], 'npl': [155], 'nld': [156], 'ncl': [157], 'nzl': [158], 'nic': [159], 'ner': [160], 'nga': [161], 'niu': [162], 'nfk': [163], 'prk': [164], 'mnp': [165], 'nor': [166], 'omn': [167], 'pak': [168], 'plw': [169], 'pse': [170], 'pan': [171], 'png': [172], 'pry': [173], 'per': [174], 'phl': [175], 'pcn': [176], 'pol': [177], 'prt': [178], 'qat': [180], 'reu': [181], 'rou': [182], 'rus': [183], 'rwa': [184], 'maf': [185], 'wsm': [186], 'smr': [187], 'stp': [188], 'sau': [189], 'sen': [190], 'srb': [191], 'syc': [192], 'sle': [193], 'sgp': [194], 'svk': [196], 'svn': [197], 'slb': [198], 'som': [199], 'zaf': [200], 'kor': [202], 'sds': [203], 'esp': [204], 'lka': [205], 'blm': [206], 'shn': [207], 'kna': [208], 'lca': [209], 'spm': [210], 'vct': [211], 'sud': [212], 'sur': [213], 'sjm': [214], 'swe': [215], 'che': [216], 'syr': [217], 'twn': [218], 'tjk': [219], 'tza': [220], 'tha': [221], 'tls': [222], 'tgo': [223], 'tkl': [224], 'ton': [225], 'tto': [226], 'tun': [227], 'tur': [228], 'tkm': [229], 'tca': [230], 'tuv': [231], 'uga': [232], 'ukr': [233], 'are': [234], 'gbr': [235], 'usa': [236], 'vir': [238], 'ury': [239], 'uzb': [240], 'vut': [241], 'vat': [242], 'ven': [243], 'vnm': [244], 'wlf': [245], 'esh': [246], 'yem': [247], 'zmb': [248], 'zwe': [249]}, 'FAOcode': {'2': [0], '284': [1], '3': [2], '4': [3], '5': [4], '6': [5], '7': [6], '258': [7], '30': [8], '8': [9], '9': [10], '1': [11], '22': [12], '10': [13], '11': [14], '52': [15], '12': [16], '13': [17], '16': [18], '14': [19], '57': [20], '255': [21], '23': [22], '53': [23], '17': [24], '18': [25], '19': [26], '278': [27], '80': [28], '20': [29], '31': [30], '21': [31], '24': [32], '239': [33], '26': [34], '27': [35], '233': [36], '29': [37], '35': [38], '115': [39], '32': [40], '33': [41], '36': [42], '37': [43], '39': [44], '40': [45], '351': [46], '42': [47], '43': [48], '44': [49], '45': [50], '46': [51], '47': [52], '48': [53], '107': [54], '98': [55], '49': [56], '279': [57], '50': [58], '167': [59], '54': [60], '72': [61], '55': [62], '56': [63], '250': [64], '58': [65], '59': [66], '60': [67], '61': [68], '178': [69], '63': [70], '209': [71], '238': [72], '64': [73], '65': [74], '66': [75], '67': [76], '68': [77], '69': [78], '70': [79], '71': [80], '74': [81], '75': [82], '73': [83], '79': [84], '81': [85], '82': [86], '84': [87], '85': [88], '86': [89], '87': [90], '88': [91], '89': [92], '90': [94], '175': [95], '91': [96], '93': [97], '92': [98], '95': [99], '96': [100], '97': [101], '99': [102], '100': [103], '101': [104], '102': [105], '103': [106], '104': [107], '264': [108], '105': [109], '106': [110], '109': [111], '110': [112], '283': [113], '112': [114], '108': [115], '114': [116], '83': [117], '118': [119], '113': [120], '120': [121], '119': [122], '121': [123], '122': [124], '123': [125], '124': [126], '125': [127], '126': [128], '256': [129], '128': [130], '154': [131], '129': [132], '130': [133], '131': [134], '132': [135], '133': [136], '134': [137], '127': [138], '135': [139], '136': [140], '137': [141], '270': [142], '138': [143], '145': [144], '146': [145], '140': [146], '141': [147], '273': [148], '142': [149], '143': [150], '144': [151], '28': [152], '147': [153], '148': [154], '149': [155], '150': [156], '153': [157], '156': [158], '157': [159], '158': [160], '159': [161], '160': [162], '161': [163], '116': [164], '163': [165], '162': [166], '221': [167], '165': [168], '180': [169], '299': [170], '166': [171], '168': [172], '169': [173], '170': [174], '171': [175], '172': [176], '173': [177], '174': [178], '177': [179], '179': [180], '182': [181], '183': [182], '185': [183], '184': [184], '281': [185], '244': [186], '192': [187], '193': [188], '194': [189], '195': [190], '272': [191], '196': [192], '197': [193], '200': [194], '280': [195], '199': [196], '198': [197], '25': [198], '201': [199], '202': [200], '271': [201], '117': [202], '277': [203], '203': [204], '38': [205], '282': [206], '187': [207], '188': [208], '189': [209], '190': [210], '191': [211], '207': [213], '260': [214], '210': [215], '211': [216], '212': [217], '214': [218], '208': [219], '215': [220], '216': [221], '176': [222], '217': [223], '218': [224], '219': [225], '220': [226], '222': [227], '223': [228], '213': [229], '224': [230], '227': [231], '226': [232], '230': [233], '225': [234], '229': [235], '231': [236], '232': [237], '240': [238], '234': [239], '235': [240], '155': [241], '94': [242], '236': [243], '237': [244], '243': [245], '205': [246], '249': [247], '251': [248], '181': [249]}, 'FIFA': {'afg': [0], 'alb': [2], 'alg': [3], 'asa': [4], 'and': [5], 'ang': [6], 'aia': [7], 'atg': [9], 'arg': [10], 'arm': [11], 'aru': [12], 'aus': [13], 'aut': [14], 'aze': [15], 'bah': [16], 'bhr': [17], 'ban': [18], 'bar': [19], 'blr': [20], 'bel': [21], 'blz': [22], 'ben': [23], 'ber': [24], 'bhu': [25], 'bol': [26], 'bih': [28], 'bot': [29], 'bra': [31], 'vgb': [33], 'bru': [34], 'bul': [35], 'bfa': [36], 'bdi': [37], 'cpv': [38], 'cam': [39], 'cmr': [40], 'can': [41], 'cay': [42], 'cta': [43], 'cha': [44], 'chi': [45], 'chn': [46], 'col': [49], 'com': [50], 'cgo': [51], 'cok': [52], 'crc': [53], 'civ': [54], 'cro': [55], 'cub': [56], 'cuw': [57], 'cyp': [58], 'cze': [59], 'den': [60], 'dji': [61], 'dma': [62], 'dom': [63], 'cod': [64], 'ecu': [65], 'egy': [66], 'slv': [67], 'edq': [68], 'eri': [69], 'est': [70], 'swz': [71], 'eth': [72], 'fro': [73], 'fij': [75], 'fin': [76], 'fra': [77], 'gab': [81], 'gam': [82], 'geo': [83], 'ger': [84], 'gha': [85], 'gib': [86], 'gre': [87], 'grn': [89], 'gum': [91], 'gua': [92], 'gui': [94], 'gnb': [95], 'guy': [96], 'hai': [97], 'hon': [99], 'hkg': [100], 'hun': [101], 'isl': [102], 'ind': [103], 'idn': [104], 'irn': [105], 'irq': [106], 'irl': [107], 'isr': [109], 'ita': [110], 'jam': [111], 'jpn': [112], 'jor': [114], 'kaz': [115], 'ken': [116], 'kir': [117], 'kos': [118], 'kuw': [119], 'kgz': [120], 'lao': [121], 'lva': [122], 'lbn': [123], 'les': [124], 'lbr': [125], 'lby': [126], 'lie': [127], 'ltu': [128], 'lux': [129], 'mac': [130], 'mkd': [131], 'mad': [132], 'mwi': [133], 'mas': [134], 'mdv': [135], 'mli': [136], 'mlt': [137], 'mhl': [138], 'mtn': [140], 'mri': [141], 'mex': [143], 'fsm': [144], 'mda': [145], 'mon': [146], 'mng': [147], 'mne': [148], 'msr': [149], 'mar': [150], 'moz': [151], 'mya': [152], 'nam': [153], 'nru': [154], 'nep': [155], 'ned': [156], 'ncl': [157], 'nzl': [158], 'nca': [159], 'nig': [160], 'nga': [161], 'prk': [164], 'nor': [166], 'oma': [167], 'pak': [168], 'plw': [169], 'ple': [170], 'pan': [171], 'png': [172], 'par': [173], 'per': [174], 'phi': [175], 'pol': [177], 'por': [178], 'pur': [179], 'qat': [180], 'rou': [182], 'rus': [183], 'rwa': [184], 'sam': [186], 'smr': [187], 'stp': [188], 'ksa': [189], 'sen': [190], 'srb': [191], 'sey': [192], 'sle': [193], 'sgp': [194], 'svk': [196], 'svn': [197], 'sol': [198], 'som': [199], 'rsa': [200], 'kor': [202], 'ssd': [203], 'esp': [204], 'sri': [205], 'skn': [208], 'lca': [209], 'vin': [211], 'sud': [212], 'sur': [213], 'swe': [215], 'sui': [216], 'syr': [217], 'tpe': [218], 'tjk': [219], 'tan': [220], 'tha': [221], 'tls': [222], 'tog': [223], 'tga': [225], 'tri': [226], 'tun': [227], 'tur': [228], 'tkm': [229], 'tca': [230], 'tuv': [231], 'uga': [232], 'ukr': [233], 'uae': [234], 'eng': [235], 'usa': [236], 'vir': [238], 'uru': [239], 'uzb': [240], 'van': [241], 'ven': [243], 'vie': [244], 'yem': [247], 'zam': [248], 'zim': [249]}, 'G20': {'g20': [10, 13, 14, 21, 31, 35, 41, 46, 55, 58, 59, 60, 70, 76, 77, 84, 87, 101, 103, 104, 107, 110, 112, 122, 128, 129, 137, 143, 156, 177, 178, 182, 183, 189, 196, 197, 200, 202, 204, 215, 228, 235, 236]}, 'G7': {'g7': [41, 77, 84, 110, 112, 235, 236]}, 'GBDcode': {'160': [0], '43': [2], '139': [3], '298': [4], '74': [5], '168': [6], '105': [9], '97': [10], '33': [11], '71': [13], '75': [14], '34': [15], '106': [16], '140': [17], '161': [18], '107': [19], '57': [20], '76': [21], '108': [22], '200': [23], '305': [24], '162': [25], '121': [26], '44': [28], '193': [29], '135': [31], '66': [34], '45': [35], '201': [36], '175': [37], '203': [38], '10': [39], '202': [40], '101': [41], '169': [43], '204': [44], '98': [45], '6': [46], '125': [49], '176': [50], '170': [51], '320': [52], '126': [53], '205': [54], '46': [55], '109': [56], '77': [58], '47': [59], '78': [60], '177': [61], '110': [62], '111': [63], '171': [64], '122': [65], '141': [66], '127': [67], '172': [68], '178': [69], '58': [70], '197': [71], '179': [72], '22': [75], '79': [76], '80': [77], '173': [81], '206': [82], '35': [83], '81': [84], '207': [85], '82': [87], '349': [88], '112': [89], '351': [91], '128': [92], '208': [94], '209': [95], '113': [96], '114': [97], '129': [99], '48': [101], '83': [102], '163': [103], '11': [104], '142': [105], '143': [106], '84': [107], '85': [109], '86': [110], '115': [111], '67': [112], '144': [114], '36': [115], '180': [116], '23': [117], '145': [119], '37': [120], '12': [121], '59': [122], '146': [123], '194': [124], '210': [125], '147': [126], '60': [128], '87': [129], '49': [131], '181': [132], '182': [133], '13': [134], '14': [135], '211': [136], '88': [137], '24': [138], '212': [140], '183': [141], '130': [143], '25': [144], '61': [145], '367': [146], '38': [147], '50': [148], '148': [150], '184': [151], '15': [152], '195': [153], '369': [154], '164': [155], '89': [156], '72': [158], '131': [159], '213': [160], '214': [161], '374': [162], '7': [164], '376': [165], '90': [166], '150': [167], '165': [168], '380': [169], '149': [170], '132': [171], '26': [172], '136': [173], '123': [174], '16': [175], '51': [177], '91': [178], '385': [179], '151': [180], '52': [182], '62': [183], '185': [184], '27': [186], '396': [187], '215': [188], '152': [189], '216': [190], '53': [191], '186': [192], '217': [193], '69': [194], '54': [196], '55': [197], '28': [198], '187': [199], '196': [200], '68': [202], '435': [203], '92': [204], '17': [205], '393': [208], '116': [209], '117': [211], '522': [212], '118': [213], '93': [215], '94': [216], '153': [217], '8': [218], '39': [219], '189': [220], '18': [221], '19': [222], '218': [223], '413': [224], '29': [225], '119': [226], '154': [227], '155': [228], '40': [229], '416': [231], '190': [232], '63': [233], '156': [234], '95': [235], '102': [236], '422': [238], '99': [239], '41': [240], '30': [241], '133': [243], '20': [244], '199': [246], '157': [247], '191': [248], '198': [249]}, 'GEOnumeric': {'660': [0], '70': [2], '208': [3], '830': [4], '43': [5], '330': [6], '446': [7], '891': [8], '459': [9], '528': [10], '77': [11], '474': [12], '800': [13], '38': [14], '78': [15], '453': [16], '640': [17], '666': [18], '469': [19], '73': [20], '17': [21], '421': [22], '284': [23], '413': [24], '675': [25], '516': [26], '477': [27], '93': [28], '391': [29], '892': [30], '508': [31], '357': [32], '468': [33], '703': [34], '68': [35], '236': [36], '328': [37], '247': [38], '696': [39], '302': [40], '404': [41], '463': [42], '306': [43], '244': [44], '512': [45], '720': [46], '834': [47], '833': [48], '480': [49], '375': [50], '318': [51], '837': [52], '436': [53], '272': [54], '92': [55], '448': [56], '475': [57], '600': [58], '61': [59], '8': [60], '338': [61], '460': [62], '456': [63], '322': [64], '500': [65], '220': [66], '428': [67], '310': [68], '336': [69], '53': [70], '393': [71], '334': [72], '41': [73], '529': [74], '815': [75], '31': [76], '1': [77], '496': [78], '822': [79], '894': [80], '314': [81], '252': [82], '76': [83], '4': [84], '276': [85], '44': [86], '9': [87], '406': [88], '473': [89], '458': [90], '831': [91], '416': [92], '260': [94], '257': [95], '488': [96], '452': [97], '835': [98], '424': [99], '740': [100], '64': [101], '24': [102], '664': [103], '700': [104], '616': [105], '612': [106], '7': [107], '624': [109], '5': [110], '464': [111], '732': [112], '628': [114], '79': [115], '346': [116], '812': [117], '95': [118], '636': [119], '83': [120], '684': [121], '54': [122], '604': [123], '395': [124], '268': [125], '216': [126], '37': [127], '55': [128], '18': [129], '743': [130], '96': [131], '370': [132], '386': [133], '701': [134], '667': [135], '232': [136], '46': [137], '824': [138], '462': [139], '228': [140], '373': [141], '377': [142], '412': [143], '823': [144], '74': [145], '716': [147], '97': [148], '470': [149], '204': [150], '366': [151], '676': [152], '389': [153], '803': [154], '672': [155], '3': [156], '809': [157], '804': [158], '432': [159], '240': [160], '288': [161], '838': [162], '836': [163], '724': [164], '820': [165], '28': [166], '649': [167], '662': [168], '825': [169], '625': [170], '442': [171], '801': [172], '520': [173], '504': [174], '708': [175], '813': [176], '60': [177], '10': [178], '644': [180], '371': [181], '66': [182], '75': [183], '324': [184], '819': [186], '47': [187], '311': [188], '632': [189], '248': [190], '98': [191], '355': [192], '264': [193], '706': [194], '479': [195], '63': [196], '91': [197], '806': [198], '342': [199], '388': [200], '893': [201], '728': [202], '225': [203], '11': [204], '669': [205], '466': [206], '329': [207], '449': [208], '465': [209], '408': [210], '467': [211], '224': [212], '492': [213], '27': [214], '30': [215], '39': [216], '608': [217], '736': [218], '82': [219], '352': [220], '680': [221], '626': [222], '280': [223], '839': [224], '817': [225], '472': [226], '212': [227], '52': [228], '80': [229], '454': [230], '807': [231], '350': [232], '72': [233], '647': [234], '6': [235], '400': [236], '832': [237], '457': [238], '524': [239], '81': [240], '816': [241], '45': [242], '484': [243], '690': [244], '811': [245], '229': [246], '653': [247], '378': [248], '382': [249]}, 'GWcode': {'700': [0], '339': [2], '615': [3], '232': [5], '540': [6], '58': [9], '160': [10], '371': [11], '900': [13], '305': [14], '373': [15], '31': [16], '692': [17], '771': [18], '53': [19], '370': [20], '211': [21], '80': [22], '434': [23], '760': [25], '145': [26], '346': [28], '571': [29], '140': [31], '835': [34], '355': [35], '439': [36], '516': [37], '402': [38], '811': [39], '471': [40], '20': [41], '482': [43], '483': [44], '155': [45], '710': [46], '100': [49], '581': [50], '484': [51], '94': [53], '437': [54], '344': [55], '40': [56], '352': [58], '315': [59], '390': [60], '522': [61], '54': [62], '42': [63], '490': [64], '130': [65], '651': [66], '92': [67], '411': [68], '531': [69], '366': [70], '572': [71], '530': [72], '950': [75], '375': [76], '220': [77], '481': [81], '420': [82], '372': [83], '260': [84], '452': [85], '350': [87], '55': [89], '90': [92], '438': [94], '404': [95], '110': [96], '41': [97], '91': [99], '310': [101], '395': [102], '750': [103], '850': [104], '630': [105], '645': [106], '205': [107], '666': [109], '325': [110], '51': [111], '740': [112], '663': [114], '705': [115], '501': [116], '970': [117], '347': [118], '690': [119], '703': [120], '812': [121], '367': [122], '660': [123], '570': [124], '450': [125], '620': [126], '223': [127], '368': [128], '212': [129], '343': [131], '580': [132], '553': [133], '820': [134], '781': [135], '432': [136], '338': [137], '983': [138], '435': [140], '590': [141], '70': [143], '987': [144], '359': [145], '221': [146], '712': [147], '341': [148], '600': [150], '541': [151], '775': [152], '565': [153], '971': [154], '790': [155], '210': [156], '920': [158], '93': [159], '436': [160], '475': [161], '731': [164], '385': [166], '698': [167], '770': [168], '986': [169], '95': [171], '910': [172], '150': [173], '135': [174], '840': [175], '290': [177], '235': [178], '694': [180], '360': [182], '365': [183], '517': [184], '990': [186], '331': [187], '403': [188], '670': [189], '433': [190], '340': [191], '591': [192], '451': [193], '830': [194], '317': [196], '349': [197], '940': [198], '520': [199], '560': [200], '732': [202], '626': [203], '230': [204], '780': [205], '60': [208], '56': [209], '57': [211], '625': [212], '115': [213], '380': [215], '225': [216], '652': [217], '713': [218], '702': [219], '510': [220], '800': [221], '860': [222], '461': [223], '972': [225], '52': [226], '616': [227], '640': [228], '701': [229], '973': [231], '500': [232], '369': [233], '696': [234], '200': [235], '2': [236], '165': [239], '704': [240], '935': [241], '101': [243], '817': [244], '680': [247], '551': [248], '552': [249]}, 'IEA': {'other non-oecd asia': [0, 4, 8, 25, 30, 32, 47, 48, 52, 75, 79, 91, 98, 117, 130, 135, 138, 144, 154, 157, 162, 163, 165, 169, 170, 172, 176, 186, 198, 201, 222, 224, 225, 231, 237, 241, 245], 'albania': [2], 'algeria': [3], 'angola': [6], 'other non-oecd americas': [7, 9, 12, 16, 19, 22, 24, 27, 33, 42, 62, 74, 78, 88, 89, 90, 139, 149, 179, 185, 195, 206, 208, 209, 210, 211, 230, 238], 'argentina': [10], 'armenia': [11], 'australia': [13], 'austria': [14], 'azerbaijan': [15], 'bahrain': [17], 'bangladesh': [18], 'belarus': [20], 'belgium': [21], 'benin': [23], 'plurinational state of bolivia': [26], 'bosnia and herzegovina': [28], 'botswana': [29], 'brazil': [31], 'brunei darussalam': [34], 'bulgaria': [35], 'other africa': [36, 37, 38, 43, 44, 50, 61, 71, 80, 82, 94, 95, 124, 125, 132, 133, 136, 140, 142, 181, 184, 188, 192, 193, 199, 207, 232, 246], 'cambodia': [39], 'cameroon': [40], 'canada': [41], 'chile': [45], "people's republic of china": [46], 'colombia': [49], 'republic of the congo': [51], 'costa rica': [53], "côte d'ivoire": [54], 'croatia': [55], 'cuba': [56], 'curaçao/netherlands antilles': [57], 'cyprus': [58], 'czech republic': [59], 'denmark': [60], 'dominican republic': [63], 'democratic republic of the congo': [64], 'ecuador': [65], 'egypt': [66], 'el salvador': [67], 'equatorial guinea': [68], 'eritrea': [69], 'estonia': [70], 'ethiopia': [72], 'finland': [76], 'france': [77], 'gabon': [81], 'georgia': [83], 'germany': [84], 'ghana': [85], 'gibraltar': [86], 'greece': [87], 'guatemala': [92], 'guyana': [96], 'haiti': [97], 'honduras': [99], 'hong kong (china)': [100], 'hungary': [101], 'iceland': [102], 'india': [103], 'indonesia': [104], 'islamic republic of iran': [105], 'iraq': [106], 'ireland': [107], 'israel': [109], 'italy': [110], 'jamaica': [111], 'japan': [112], 'jordan': [114], 'kazakhstan': [115], 'kenya': [116], 'kosovo': [118], 'kuwait': [119], 'kyrgyzstan': [120], "lao people's democratic republic": [121], 'latvia': [122], 'lebanon': [123], 'libya': [126], 'lithuania': [128], 'luxembourg': [129], 'republic of north macedonia': [131], 'malaysia': [134], 'malta': [137], 'mauritius': [141], 'mexico': [143], 'republic of moldova': [145], 'mongolia': [147], 'montenegro': [148], 'morocco': [150], 'mozambique': [151], 'myanmar': [152], 'namibia': [153], 'nepal': [155], 'netherlands': [156], 'new zealand': [158], 'nicaragua': [159], 'niger': [160], 'nigeria': [161], "democratic people's republic of korea": [164], 'norway': [166], 'oman': [167], 'pakistan': [168], 'panama': [171], 'paraguay': [173], 'peru': [174], 'philippines': [175], 'poland': [177], 'portugal': [178], 'qatar': [180], 'romania': [182], 'russian federation': [183], 'saudi arabia': [189], 'senegal': [190], 'serbia': [191], 'singapore': [194], 'slovak republic': [196], 'slovenia': [197], 'south africa': [200], 'korea': [202], 'south sudan': [203], 'spain': [204], 'sri lanka': [205], 'sudan': [212], 'suriname': [213], 'sweden': [215], 'switzerland': [216], 'syrian arab republic': [217], 'chinese taipei': [218], 'tajikistan': [219], 'united republic of tanzania': [220], 'thailand': [221], 'togo': [223], 'trinidad and tobago': [226], 'tunisia': [227], 'türkiye': [228], 'turkmenistan': [229], 'ukraine': [233], 'united arab emirates': [234], 'united kingdom': [235], 'united states': [236], 'uruguay': [239], 'uzbekistan': [240], 'bolivarian republic of venezuela': [243], 'viet nam': [244], 'yemen': [247], 'zambia': [248], 'zimbabwe': [249]}, 'IEA_v2025': {'oth_non_oecdao': [0, 4, 8, 25, 30, 32, 47, 48, 52, 75, 79, 91, 98, 117, 130, 135, 138, 144, 154, 157, 162, 163, 165, 169, 172, 176, 186, 198, 201, 222, 224, 225, 231, 237, 241, 245], 'albania': [2], 'algeria': [3], 'angola': [6], 'oth_non_oecdam': [7, 9, 12, 16, 19, 22, 24, 27, 33, 42, 62, 74, 78, 89, 90, 139, 149, 179, 185, 195, 206, 208, 209, 210, 211, 230, 238], 'argentina': [10], 'armenia': [11], 'australia': [13], 'austria': [14], 'azerbaijan': [15], 'bahrain': [17], 'bangladesh': [18], 'belarus': [20], 'belgium': [21], 'benin': [23], 'bolivia': [26], 'bosniaherz': [28], 'botswana': [29], 'brazil': [31], 'brunei': [34], 'bulgaria': [35], 'burkinafaso': [36], 'oth_non_oecdafr': [37, 38, 43, 50, 61, 80, 82, 94, 95, 124, 125, 133, 142, 181, 188, 192, 193, 199, 207, 246], 'cambodia': [39], 'cameroon': [40], 'canada': [41], 'chad': [44], 'chile': [45], 'china': [46], 'colombia': [49], 'congo_repub': [51], 'costarica': [53], 'coteivoire': [54], 'croatia': [55], 'cuba': [56], 'curacao': [57], 'cyprus': [58], 'czech': [59], 'denmark': [60], 'dominicanrep': [63], 'congo_drc': [64], 'ecuador': [65], 'egypt': [66], 'elsalvador': [67], 'eqguinea': [68], 'eritrea': [69], 'estonia': [70], 'eswatini': [71], 'ethiopia': [72], 'finland': [76], 'france': [77], 'gabon': [81], 'georgia': [83], 'germany': [84], 'ghana': [85], 'gibraltar': [86], 'greece': [87], 'greenland': [88], 'guatemala': [92], 'guyana': [96], 'haiti': [97], 'honduras': [99], 'hongkong': [100], 'hungary': [101], 'iceland': [102], 'india': [103], 'indonesia': [104], 'iran': [105], 'iraq': [106], 'ireland': [107], 'israel': [109], 'italy': [110], 'jamaica': [111], 'japan': [112], 'jordan': [114], 'kazakhstan': [115], 'kenya': [116], 'kosovo': [118], 'kuwait': [119], 'kyrgyzstan': [120], 'lao': [121], 'latvia': [122], 'lebanon': [123], 'libya': [126], 'lithuania': [128], 'luxembourg': [129], 'northmaced': [131], 'madagascar': [132], 'malaysia': [134], 'mali': [136], 'malta': [137], 'mauritania': [140], 'mauritius': [141], 'mexico': [143], 'moldova': [145], 'mongolia': [147], 'montenegro': [148], 'morocco': [150], 'mozambique': [151], 'myanmar': [152], 'namibia': [153], 'nepal': [155], 'netherlands': [156], 'newzealand': [158], 'nicaragua': [159], 'niger': [160], 'nigeria': [161], 'koreadpr': [164], 'norway': [166], 'oman': [167], 'pakistan': [168], 'palestine': [170], 'panama': [171], 'paraguay': [173], 'peru': [174], 'philippines': [175], 'poland': [177], 'portugal': [178], 'qatar': [180], 'romania': [182], 'russia': [183], 'rwanda': [184], 'saudiarabia': [189], 'senegal': [190], 'serbia': [191], 'singapore': [194], 'slovakia': [196], 'slovenia': [197], 'southafrica': [200], 'korea': [202], 'ssudan': [203], 'spain': [204], 'srilanka': [205], 'sudan': [212], 'suriname': [213], 'sweden': [215], 'switzerland': [216], 'syria': [217], 'taipei': [218], 'tajikistan': [219], 'tanzania': [220], 'thailand': [221], 'togo': [223], 'trinidad': [226], 'tunisia': [227], 'turkiye': [228], 'turkmenistan': [229], 'uganda': [232], 'ukraine': [233], 'uae': [234], 'uk': [235], 'usa': [236], 'uruguay': [239], 'uzbekistan': [240], 'venezuela': [243], 'vietnam': [244], 'yemen': [247], 'zambia': [248], 'zimbabwe': [249]}, 'IMAGE': {'rest of south asia': [0, 18, 25, 135, 155, 168, 205], 'central europe': [2, 28, 35, 55, 58, 59, 70, 101, 122, 128, 131, 148, 177, 182, 191, 196, 197], 'northern africa': [3, 66, 126, 150, 227, 246], 'oceania': [4, 13, 52, 75, 79, 117, 138, 144, 154, 157, 158, 162, 165, 169, 176, 186, 198, 224, 225, 231, 241, 245], 'western europe': [5, 14, 21, 60, 73, 76, 77, 84, 86, 87, 102, 107, 110, 127, 129, 137, 146, 156, 166, 178, 187, 204, 215, 216, 235, 242], 'rest of southern africa': [6, 29, 71, 124, 133, 151, 153, 220, 248, 249], 'central america': [7, 12, 16, 19, 22, 24, 33, 42, 53, 62, 63, 67, 89, 90, 92, 97, 99, 111, 139, 149, 159, 171, 179, 208, 209, 211, 226, 230, 238], 'rest of south america': [10, 26, 45, 49, 65, 74, 78, 96, 173, 174, 213, 239, 243], 'russia region': [11, 15, 83, 183], 'middle east': [17, 105, 106, 109, 114, 119, 123, 167, 180, 189, 217, 234, 247], 'ukraine region': [20, 145, 233], 'western africa': [23, 36, 38, 40, 43, 44, 51, 54, 64, 68, 81, 82, 85, 94, 95, 125, 136, 140, 160, 161, 188, 190, 193, 207, 223], 'brazil': [31], 'southeastern asia': [34, 39, 121, 134, 152, 175, 194, 221, 244], 'eastern africa': [37, 50, 61, 69, 72, 116, 132, 141, 181, 184, 192, 199, 212, 232], 'canada': [41], 'china region': [46, 100, 130, 147, 218], 'india': [103], 'indonesia region': [104, 172, 222], 'japan': [112], 'central asia': [115, 120, 219, 229, 240], 'mexico': [143], 'korea region': [164, 202], 'south africa': [200], 'usa': [210, 236], 'turkey': [228]}, 'IOC': {'afg': [0], 'alb': [2], 'alg': [3], 'asa': [4], 'and': [5], 'ang': [6], 'ant': [9], 'arg': [10], 'arm': [11], 'aru': [12], 'aus': [13], 'aut': [14], 'aze': [15], 'bah': [16], 'brn': [17], 'ban': [18], 'bar': [19], 'blr': [20], 'bel': [21], 'biz': [22], 'ben': [23], 'ber': [24], 'bhu': [25], 'bol': [26], 'bih': [28], 'bot': [29], 'bra': [31], 'ivb': [33], 'bru': [34], 'bul': [35], 'bur': [36], 'bdi': [37], 'cpv': [38], 'cam': [39], 'cmr': [40], 'can': [41], 'cay': [42], 'caf': [43], 'cha': [44], 'chi': [45], 'chn': [46], 'col': [49], 'com': [50], 'cgo': [51], 'cok': [52], 'crc': [53], 'civ': [54], 'cro': [55], 'cub': [56], 'cyp': [58], 'cze': [59], 'den': [60], 'dji': [61], 'dma': [62], 'dom': [63], 'cod': [64], 'ecu': [65], 'egy': [66], 'esa': [67], 'geq': [68], 'eri': [69], 'est': [70], 'swz': [71], 'eth': [72], 'fij': [75], 'fin': [76], 'fra': [77], 'gab': [81], 'gam': [82], 'geo': [83], 'ger': [84], 'gha': [85], 'gre': [87], 'grn': [89], 'gum': [91], 'gua': [92], 'gui': [94], 'gbs': [95], 'guy': [96], 'hai': [97], 'hon': [99], 'hkg': [100], 'hun': [101], 'isl': [102], 'ind': [103], 'ina': [104], 'iri': [105], 'irq': [106], 'irl': [107], 'isr': [109], 'ita': [110], 'jam': [111], 'jpn': [112], 'jor': [114], 'kaz': [115], 'ken': [116], 'kir': [117], 'kos': [118], 'kuw': [119], 'kgz': [120], 'lao': [121], 'lat': [122], 'lbn': [123], 'les': [124], 'lbr': [125], 'lba': [126], 'lie': [127], 'ltu': [128], 'lux': [129], 'mkd': [131], 'mad': [132], 'maw': [133], 'mas': [134], 'mdv': [135], 'mli': [136], 'mlt': [137], 'mhl': [138], 'mtn': [140], 'mri': [141], 'mex': [143], 'fsm': [144], 'mda': [145], 'mon': [146], 'mgl': [147], 'mne': [148], 'mar': [150], 'moz': [151], 'mya': [152], 'nam': [153], 'nru': [154], 'nep': [155], 'ned': [156], 'nzl': [158], 'nca': [159], 'nig': [160], 'ngr': [161], 'prk': [164], 'nor': [166], 'oma': [167], 'pak': [168], 'plw': [169], 'ple': [170], 'pan': [171], 'png': [172], 'par': [173], 'per': [174], 'phi': [175], 'pol': [177], 'por': [178], 'pur': [179], 'qat': [180], 'rou': [182], 'rus': [183], 'rwa': [184], 'sam': [186], 'smr': [187], 'stp': [188], 'ksa': [189], 'sen': [190], 'srb': [191], 'sey': [192], 'sle': [193], 'sgp': [194], 'svk': [196], 'slo': [197], 'sol': [198], 'som': [199], 'rsa': [200], 'kor': [202], 'ssd': [203], 'esp': [204], 'sri': [205], 'skn': [208], 'lca': [209], 'vin': [211], 'sud': [212], 'sur': [213], 'swe': [215], 'sui': [216], 'syr': [217], 'tpe': [218], 'tjk': [219], 'tan': [220], 'tha': [221], 'tls': [222], 'tog': [223], 'tga': [225], 'tto': [226], 'tun': [227], 'tur': [228], 'tkm': [229], 'tuv': [231], 'uga': [232], 'ukr': [233], 'uae': [234], 'gbr': [235], 'usa': [236], 'isv': [238], 'uru': [239], 'uzb': [240], 'van': [241], 'ven': [243], 'vie': [244], 'yem': [247], 'zam': [248], 'zim': [249]}, 'ISO2': {'af': [0], 'ax': [1], 'al': [2], 'dz': [3], 'as': [4], 'ad': [5], 'ao': [6], 'ai': [7], 'aq': [8], 'ag': [9], 'ar': [10], 'am': [11], 'aw': [12], 'au': [13], 'at': [14], 'az': [15], 'bs': [16], 'bh': [17], 'bd': [18], 'bb': [19], 'by': [20], 'be': [21], 'bz': [22], 'bj': [23], 'bm': [24], 'bt': [25], 'bo': [26], 'bq': [27], 'ba': [28], 'bw': [29], 'bv': [30], 'br': [31], 'io': [32], 'vg': [33], 'bn': [34], 'bg': [35], 'bf': [36], 'bi': [37], 'cv': [38], 'kh': [39], 'cm': [40], 'ca': [41], 'ky': [42], 'cf': [43], 'td': [44], 'cl': [45], 'cn': [46], 'cx': [47], 'cc': [48], 'co': [49], 'km': [50], 'cg': [51], 'ck': [52], 'cr': [53], 'ci': [54], 'hr': [55], 'cu': [56], 'cw': [57], 'cy': [58], 'cz': [59], 'dk': [60], 'dj': [61], 'dm': [62], 'do': [63], 'cd': [64], 'ec': [65], 'eg': [66], 'sv': [67], 'gq': [68], 'er': [69], 'ee': [70], 'sz': [71], 'et': [72], 'fo': [73], 'fk': [74], 'fj': [75], 'fi': [76], 'fr': [77], 'gf': [78], 'pf': [79], 'tf': [80], 'ga': [81], 'gm': [82], 'ge': [83], 'de': [84], 'gh': [85], 'gi': [86], '^gr$|^el$': [87], 'gl': [88], 'gd': [89], 'gp': [90], 'gu': [91], 'gt': [92], 'gg': [93], 'gn': [94], 'gw': [95], 'gy': [96], 'ht': [97], 'hm': [98], 'hn': [99], 'hk': [100], 'hu': [101], 'is': [102], 'in': [103], 'id': [104], 'ir': [105], 'iq': [106], 'ie': [107], 'im': [108], 'il': [109], 'it': [110], 'jm': [111], 'jp': [112], 'je': [113], 'jo': [114], 'kz': [115], 'ke': [116], 'ki': [117], 'xk': [118], 'kw': [119], 'kg': [120], 'la': [121], 'lv': [122], 'lb': [123], 'ls': [124], 'lr': [125], 'ly': [126], 'li': [127], 'lt': [128], 'lu': [129], 'mo': [130], 'mk': [131], 'mg': [132], 'mw': [133], 'my': [134], 'mv': [135], 'ml': [136], 'mt': [137], 'mh': [138], 'mq': [139], 'mr': [140], 'mu': [141], 'yt': [142], 'mx': [143], 'fm': [144], 'md': [145], 'mc': [146], 'mn': [147], 'me': [148], 'ms': [149], 'ma': [150], 'mz': [151], 'mm': [152], 'na': [153], 'nr': [154], 'np': [155], 'nl': [156], 'nc': [157], 'nz': [158], 'ni': [159], 'ne': [160], 'ng': [161], 'nu': [162], 'nf': [163], 'kp': [164], 'mp': [165], 'no': [166], 'om': [167], 'pk': [168], 'pw': [169], 'ps': [170], 'pa': [171], 'pg': [172], 'py': [173], 'pe': [174], 'ph': [175], 'pn': [176], 'pl': [177], 'pt': [178], 'pr': [179], 'qa': [180], 're': [181], 'ro': [182], 'ru': [183], 'rw': [184], 'mf': [185], 'ws': [186], 'sm': [187], 'st': [188], 'sa': [189], 'sn': [190], 'rs': [191], 'sc': [192], 'sl': [193], 'sg': [194], 'sx': [195], 'sk': [196], 'si': [197], 'sb': [198], 'so': [199], 'za': [200], 'gs': [201], 'kr': [202], 'ss': [203], 'es': [204], 'lk': [205], 'bl': [206], 'sh': [207], 'kn': [208], 'lc': [209], 'pm': [210], 'vc': [211], 'sd': [212], 'sr': [213], 'sj': [214], 'se': [215], 'ch': [216], 'sy': [217], 'tw': [218], 'tj': [219], 'tz': [220], 'th': [221], 'tl': [222], 'tg': [223], 'tk': [224], 'to': [225], 'tt': [226], 'tn': [227], 'tr': [228], 'tm': [229], 'tc': [230], 'tv': [231], 'ug': [232], 'ua': [233], 'ae': [234], '^gb$|^uk$': [235], 'us': [236], 'um': [237], 'vi': [238], 'uy': [239], 'uz': [240], 'vu': [241], 'va': [242], 've': [243], 'vn': [244], 'wf': [245], 'eh': [246], 'ye': [247], 'zm': [248], 'zw': [249]}, 'ISO3': {'afg': [0], 'ala': [1], 'alb': [2], 'dza': [3], 'asm': [4], 'and': [5], 'ago': [6], 'aia': [7], 'ata': [8], 'atg': [9], 'arg': [10], 'arm': [11], 'abw': [12], 'aus': [13], 'aut': [14], 'aze': [15], 'bhs': [16], 'bhr': [17], 'bgd': [18], 'brb': [19], 'blr': [20], 'bel': [21], 'blz': [22], 'ben': [23], 'bmu': [24], 'btn': [25], 'bol': [26], 'bes': [27], 'bih': [28], 'bwa': [29], 'bvt': [30], 'bra': [31], 'iot': [32], 'vgb': [33], 'brn': [34], 'bgr': [35], 'bfa': [36], 'bdi': [37], 'cpv': [38], 'khm': [39], 'cmr': [40], 'can': [41], 'cym': [42], 'caf': [43], 'tcd': [44], 'chl': [45], 'chn': [46], 'cxr': [47], 'cck': [48], 'col': [49], 'com': [50], 'cog': [51], 'cok': [52], 'cri': [53], 'civ': [54], 'hrv': [55], 'cub': [56], 'cuw': [57], 'cyp': [58], 'cze': [59], 'dnk': [60], 'dji': [61], 'dma': [62], 'dom': [63], 'cod': [64], 'ecu': [65], 'egy': [66], 'slv': [67], 'gnq': [68], 'eri': [69], 'est': [70], 'swz': [71], 'eth': [72], 'fro': [73], 'flk': [74], 'fji': [75], 'fin': [76], 'fra': [77], 'guf': [78], 'pyf': [79], 'atf': [80], 'gab': [81], 'gmb': [82], 'geo': [83], 'deu': [84], 'gha': [85], 'gib': [86], 'grc': [87], 'grl': [88], 'grd': [89], 'glp': [90], 'gum': [91], 'gtm': [92], 'ggy': [93], 'gin': [94], 'gnb': [95], 'guy': [96], 'hti': [97], 'hmd': [98], 'hnd': [99], 'hkg': [100], 'hun': [101], 'isl': [102], 'ind': [103], 'idn': [104], 'irn': [105], 'irq': [106], 'irl': [107], 'imn': [108], 'isr': [109], 'ita': [110], 'jam': [111], 'jpn': [112], 'jey': [113], 'jor': [114], 'kaz': [115], 'ken': [116], 'kir': [117], 'xkx': [118], 'kwt': [119], 'kgz': [120], 'lao': [121], 'lva': [122], 'lbn': [123], 'lso': [124], 'lbr': [125], 'lby': [126], 'lie': [127], 'ltu': [128], 'lux': [129], 'mac': [130], 'mkd': [131], 'mdg': [132], 'mwi': [133], 'mys': [134], 'mdv': [135], 'mli': [136], 'mlt': [137], 'mhl': [138], 'mtq': [139], 'mrt': [140], 'mus': [141], 'myt': [142], 'mex': [143], 'fsm': [144], 'mda': [145], 'mco': [146], 'mng': [147], 'mne': [148], 'msr': [149], 'mar': [150], 'moz': [151], 'mmr': [152], 'nam': [153], 'nru': [154], 'npl': [155], 'nld': [156], 'ncl': [157], 'nzl': [158], 'nic': [159], 'ner': [160], 'nga': [161], 'niu': [162], 'nfk': [163], 'prk': [164], 'mnp': [165], 'nor': [166], 'omn': [167], 'pak': [168], 'plw': [169], 'pse': [170], 'pan': [171], 'png': [172], 'pry': [173], 'per': [174], 'phl': [175], 'pcn': [176], 'pol': [177], 'prt': [178], 'pri': [179], 'qat': [180], 'reu': [181], 'rou': [182], 'rus': [183], 'rwa': [184], 'maf': [185], 'wsm': [186], 'smr': [187], 'stp': [188], 'sau': [189], 'sen': [190], 'srb': [191], 'syc': [192], 'sle': [193], 'sgp': [194], 'sxm': [195], 'svk': [196], 'svn': [197], 'slb': [198], 'som': [199], 'zaf': [200], 'sgs': [201], 'kor': [202], 'ssd': [203], 'esp': [204], 'lka': [205], 'blm': [206], 'shn': [207], 'kna': [208], 'lca': [209], 'spm': [210], 'vct': [211], 'sdn': [212], 'sur': [213], 'sjm': [214], 'swe': [215], 'che': [216], 'syr': [217], 'twn': [218], 'tjk': [219], 'tza': [220], 'tha': [221], 'tls': [222], 'tgo': [223], 'tkl': [224], 'ton': [225], 'tto': [226], 'tun': [227], 'tur': [228], 'tkm': [229], 'tca': [230], 'tuv': [231], 'uga': [232], 'ukr': [233], 'are': [234], 'gbr': [235], 'usa': [236], 'umi': [237], 'vir': [238], 'ury': [239], 'uzb': [240], 'vut': [241], 'vat': [242], 'ven': [243], 'vnm': [244], 'wlf': [245], 'esh': [246], 'yem': [247], 'zmb': [248], 'zwe': [249]}, 'ISOnumeric': {'4': [0], '248': [1], '8': [2], '12': [3], '16': [4], '20': [5], '24': [6], '660': [7], '10': [8], '28': [9], '32': [10], '51': [11], '533': [12], '36': [13], '40': [14], '31': [15], '44': [16], '48': [17], '50': [18], '52': [19], '112': [20], '56': [21], '84': [22], '204': [23], '60': [24], '64': [25], '68': [26], '535': [27], '70': [28], '72': [29], '74': [30], '76': [31], '86': [32], '92': [33], '96': [34], '100': [35], '854': [36], '108': [37], '132': [38], '116': [39], '120': [40], '124': [41], '136': [42], '140': [43], '148': [44], '152': [45], '156': [46], '162': [47], '166': [48], '170': [49], '174': [50], '178': [51], '184': [52], '188': [53], '384': [54], '191': [55], '192': [56], '531': [57], '196': [58], '203': [59], '208': [60], '262': [61], '212': [62], '214': [63], '180': [64], '218': [65], '818': [66], '222': [67], '226': [68], '232': [69], '233': [70], '748': [71], '231': [72], '234': [73], '238': [74], '242': [75], '246': [76], '250': [77], '254': [78], '258': [79], '260': [80], '266': [81], '270': [82], '268': [83], '276': [84], '288': [85], '292': [86], '300': [87], '304': [88], '308': [89], '312': [90], '316': [91], '320': [92], '831': [93], '324': [94], '624': [95], '328': [96], '332': [97], '334': [98], '340': [99], '344': [100], '348': [101], '352': [102], '356': [103], '360': [104], '364': [105], '368': [106], '372': [107], '833': [108], '376': [109], '380': [110], '388': [111], '392': [112], '832': [113], '400': [114], '398': [115], '404': [116], '296': [117], '412': [118], '414': [119], '417': [120], '418': [121], '428': [122], '422': [123], '426': [124], '430': [125], '434': [126], '438': [127], '440': [128], '442': [129], '446': [130], '807': [131], '450': [132], '454': [133], '458': [134], '462': [135], '466': [136], '470': [137], '584': [138], '474': [139], '478': [140], '480': [141], '175': [142], '484': [143], '583': [144], '498': [145], '492': [146], '496': [147], '499': [148], '500': [149], '504': [150], '508': [151], '104': [152], '516': [153], '520': [154], '524': [155], '528': [156], '540': [157], '554': [158], '558': [159], '562': [160], '566': [161], '570': [162], '574': [163], '408': [164], '580': [165], '578': [166], '512': [167], '586': [168], '585': [169], '275': [170], '591': [171], '598': [172], '600': [173], '604': [174], '608': [175], '612': [176], '616': [177], '620': [178], '630': [179], '634': [180], '638': [181], '642': [182], '643': [183], '646': [184], '663': [185], '882': [186], '674': [187], '678': [188], '682': [189], '686': [190], '688': [191], '690': [192], '694': [193], '702': [194], '534': [195], '703': [196], '705': [197], '90': [198], '706': [199], '710': [200], '239': [201], '410': [202], '728': [203], '724': [204], '144': [205], '652': [206], '654': [207], '659': [208], '662': [209], '666': [210], '670': [211], '729': [212], '740': [213], '744': [214], '752': [215], '756': [216], '760': [217], '158': [218], '762': [219], '834': [220], '764': [221], '626': [222], '768': [223], '772': [224], '776': [225], '780': [226], '788': [227], '792': [228], '795': [229], '796': [230], '798': [231], '800': [232], '804': [233], '784': [234], '826': [235], '840': [236], '581': [237], '850': [238], '858': [239], '860': [240], '548': [241], '336': [242], '862': [243], '704': [244], '876': [245], '732': [246], '887': [247], '894': [248], '716': [249]}, 'MESSAGE': {'sas': [0, 18, 25, 103, 135, 155, 168, 205], 'eeu': [2, 28, 35, 55, 59, 70, 101, 122, 128, 131, 148, 177, 182, 191, 196, 197], 'mea': [3, 17, 66, 105, 106, 109, 114, 119, 123, 126, 150, 167, 170, 180, 189, 203, 212, 217, 227, 234, 246, 247], 'pas': [4, 34, 47, 48, 52, 75, 79, 104, 117, 130, 134, 138, 144, 152, 154, 157, 162, 163, 165, 169, 172, 175, 176, 186, 194, 198, 202, 218, 221, 222, 224, 225, 231, 241, 245], 'weu': [5, 14, 21, 58, 60, 73, 76, 77, 84, 86, 87, 88, 102, 107, 108, 110, 127, 129, 137, 146, 156, 166, 178, 187, 204, 214, 215, 216, 228, 235, 242], 'afr': [6, 23, 29, 32, 36, 37, 38, 40, 43, 44, 50, 51, 54, 61, 64, 68, 69, 71, 72, 81, 82, 85, 94, 95, 116, 124, 125, 132, 133, 136, 140, 141, 142, 151, 153, 160, 161, 181, 184, 188, 190, 192, 193, 199, 200, 207, 220, 223, 232, 248, 249], 'lac': [7, 9, 10, 12, 16, 19, 22, 24, 26, 27, 31, 33, 42, 45, 49, 53, 56, 57, 62, 63, 65, 67, 74, 78, 89, 90, 92, 96, 97, 99, 111, 139, 143, 149, 159, 171, 173, 174, 195, 208, 209, 211, 213, 226, 230, 239, 243], 'fsu': [11, 15, 20, 83, 115, 120, 145, 183, 219, 229, 233, 240], 'pao': [13, 112, 158], 'cpa': [39, 46, 100, 121, 147, 164, 244], 'nam': [41, 91, 179, 210, 236, 238]}, 'OECD': {'1971': [13], '1961': [14, 21, 41, 60, 77, 84, 87, 102, 107, 129, 156, 166, 178, 204, 215, 216, 228, 235, 236], '2010': [45, 70, 109, 197], '2020': [49], '2021': [53], '1995': [59], '1969': [76], '1996': [101, 177, 202], '1962': [110], '1964': [112], '2016': [122], '2018': [128], '1994': [143], '1973': [158], '2000': [196]}, 'REMIND': {'oas': [0, 4, 18, 25, 32, 34, 39, 47, 48, 52, 75, 79, 80, 91, 104, 117, 121, 134, 135, 138, 144, 147, 152, 154, 155, 157, 162, 163, 164, 165, 168, 169, 172, 175, 176, 186, 194, 198, 202, 205, 221, 222, 224, 225, 231, 237, 241, 244, 245], 'eur': [1, 14, 21, 35, 55, 58, 59, 60, 70, 73, 76, 77, 84, 86, 87, 93, 101, 107, 108, 110, 113, 122, 128, 129, 137, 156, 177, 178, 182, 196, 197, 204, 215, 235], 'neu': [2, 5, 28, 88, 102, 127, 131, 146, 148, 166, 187, 191, 214, 216, 228, 242], 'mea': [3, 17, 66, 105, 106, 109, 114, 119, 123, 126, 150, 167, 170, 180, 189, 212, 217, 227, 234, 246, 247], 'ssa': [6, 23, 29, 36, 37, 38, 40, 43, 44, 50, 51, 54, 61, 64, 68, 69, 71, 72, 81, 82, 85, 94, 95, 116, 124, 125, 132, 133, 136, 140, 141, 142, 151, 153, 160, 161, 181, 184, 188, 190, 192, 193, 199, 200, 203, 207, 220, 223, 232, 248, 249], 'lam': [7, 8, 9, 10, 12, 16, 19, 22, 24, 26, 27, 30, 31, 33, 42, 45, 49, 53, 56, 57, 62, 63, 65, 67, 74, 78, 89, 90, 92, 96, 97, 99, 111, 139, 143, 149, 159, 171, 173, 174, 179, 185, 195, 201, 206, 208, 209, 211, 213, 226, 230, 238, 239, 243], 'ref': [11, 15, 20, 83, 115, 120, 145, 183, 219, 229, 233, 240], 'caz': [13, 41, 98, 158, 210], 'cha': [46, 100, 130, 218], 'ind': [103], 'jpn': [112], 'usa': [236]}, 'Schengen': {'schengen': [14, 21, 59, 60, 70, 73, 76, 77, 84, 87, 88, 101, 102, 110, 122, 127, 128, 129, 137, 156, 166, 177, 178, 196, 197, 204, 215, 216]}, 'UN': {'1946': [0, 102, 215, 221], '1955': [2, 14, 35, 39, 76, 101, 107, 110, 114, 121, 126, 155, 178, 182, 204, 205], '1962': [3, 37, 111, 184, 226, 232], '1993': [5, 59, 69, 131, 146, 196], '1976': [6, 186, 192], '1981': [9, 22, 241], '1945': [10, 13, 20, 21, 26, 31, 41, 45, 46, 49, 53, 56, 60, 63, 65, 66, 67, 72, 77, 87, 92, 97, 99, 103, 105, 106, 123, 125, 129, 143, 156, 158, 159, 166, 171, 173, 174, 175, 177, 183, 189, 200, 217, 228, 233, 235, 236, 239, 243], '1992': [11, 15, 28, 55, 83, 115, 120, 145, 187, 197, 219, 229, 240], '1973': [16, 84], '1971': [17, 25, 167, 180, 234], '1974': [18, 89, 95], '1966': [19, 29, 96, 124], '1960': [23, 36, 40, 43, 44, 51, 54, 58, 64, 81, 132, 136, 160, 161, 190, 199, 223], '1984': [34], '1975': [38, 50, 151, 172, 188, 213], '1977': [61, 244], '1978': [62, 198], '1968': [68, 71, 141], '1991': [70, 122, 128, 138, 144, 164, 202], '1970': [75], '1965': [82, 135, 194], '1957': [85, 134], '1958': [94], '1950': [104], '1949': [109], '1956': [112, 150, 212, 227], '1963': [116, 119], '1999': [117, 154, 225], '1990': [127, 153], '1964': [133, 137, 248], '1961': [140, 147, 193, 220], '2006': [148], '1948': [152], '1947': [168, 247], '1994': [169], '2000': [191, 231], '2011': [203], '1983': [208], '1979': [209], '1980': [211, 249], '2002': [216, 222]}, 'UNcode': {'4': [0], '248': [1], '8': [2], '12': [3], '16': [4], '20': [5], '24': [6], '660': [7], '10': [8], '28': [9], '32': [10], '51': [11], '533': [12], '36': [13], '40': [14], '31': [15], '44': [16], '48': [17], '50': [18], '52': [19], '112': [20], '56': [21], '84': [22], '204': [23], '60': [24], '64': [25], '68': [26], '535': [27], '70': [28], '72': [29], '74': [30], '76': [31], '86': [32], '92': [33], '96': [34], '100': [35], '854': [36], '108': [37], '132': [38], '116': [39], '120': [40], '124': [41], '136': [42], '140': [43], '148': [44], '152': [45], '156': [46], '162': [47], '166': [48], '170': [49], '174': [50], '178': [51], '184': [52], '188': [53], '384': [54], '191': [55], '192': [56], '531': [57], '196': [58], '203': [59], '208': [60], '262': [61], '212': [62], '214': [63], '180': [64], '218': [65], '818': [66], '222': [67], '226': [68], '232': [69], '233': [70], '748': [71], '231': [72], '234': [73], '238': [74], '242': [75], '246': [76], '250': [77], '254': [78], '258': [79], '260': [80], '266': [81], '270': [82], '268': [83], '276': [84], '288': [85], '292': [86], '300': [87], '304': [88], '308': [89], '312': [90], '316': [91], '320': [92], '831': [93], '324': [94], '624': [95], '328': [96], '332': [97], '334': [98], '340': [99], '344': [100], '348': [101], '352': [102], '356': [103], '360': [104], '364': [105], '368': [106], '372': [107], '833': [108], '376': [109], '380': [110], '388': [111], '392': [112], '832': [113], '400': [114], '398': [115], '404': [116], '296': [117], '414': [119], '417': [120], '418': [121], '428': [122], '422': [123], '426': [124], '430': [125], '434': [126], '438': [127], '440': [128], '442': [129], '446': [130], '807': [131], '450': [132], '454': [133], '458': [134], '462': [135], '466': [136], '470': [137], '584': [138], '474': [139], '478': [140], '480': [141], '175': [142], '484': [143], '583': [144], '498': [145], '492': [146], '496': [147], '499': [148], '500': [149], '504': [150], '508': [151], '104': [152], '516': [153], '520': [154], '524': [155], '528': [156], '540': [157], '554': [158], '558': [159], '562': [160], '566': [161], '570': [162], '574': [163], '408': [164], '580': [165], '578': [166], '512': [167], '586': [168], '585': [169], '275': [170], '591': [171], '598': [172], '600': [173], '604': [174], '608': [175], '612': [176], '616': [177], '620': [178], '630': [179], '634': [180], '638': [181], '642': [182], '643': [183], '646': [184], '663': [185], '882': [186], '674': [187], '678': [188], '682': [189], '686': [190], '688': [191], '690': [192], '694': [193], '702': [194], '534': [195], '703': [196], '705': [197], '90': [198], '706': [199], '710': [200], '239': [201], '410': [202], '728': [203], '724': [204], '144': [205], '652': [206], '654': [207], '659': [208], '662': [209], '666': [210], '670': [211], '729': [212], '740': [213], '744': [214], '752': [215], '756': [216], '760': [217], '762': [219], '834': [220], '764': [221], '626': [222], '768': [223], '772': [224], '776': [225], '780': [226], '788': [227], '792': [228], '795': [229], '796': [230], '798': [231], '800': [232], '804': [233], '784': [234], '826': [235], '840': [236], '581': [237], '850': [238], '858': [239], '860': [240], '548': [241], '336': [242], '862': [243], '704': [244], '876': [245], '732': [246], '887': [247], '894': [248], '716': [249]}, 'UNmember': {'1946': [0, 102, 215, 221], '1955': [2, 14, 35, 39, 76, 101, 107, 110, 114, 121, 126, 155, 178, 182, 204, 205], '1962': [3, 37, 111, 184, 226, 232], '1993': [5, 59, 69, 131, 146, 196], '1976': [6, 186, 192], '1981': [9, 22, 241], '1945': [10, 13, 20, 21, 26, 31, 41, 45, 46, 49, 53, 56, 60, 63, 65, 66, 67, 72, 77, 87, 92, 97, 99, 103, 105, 106, 123, 125, 129, 143, 156, 158, 159, 166, 171, 173, 174, 175, 177, 183, 189, 200, 217, 228, 233, 235, 236, 239, 243], '1992': [11, 15, 28, 55, 83, 115, 120, 145, 187, 197, 219, 229, 240], '1973': [16, 84], '1971': [17, 25, 167, 180, 234], '1974': [18, 89, 95], '1966': [19, 29, 96, 124], '1960': [23, 36, 40, 43, 44, 51, 54, 58, 64, 81, 132, 136, 160, 161, 190, 199, 223], '1984': [34], '1975': [38, 50, 151, 172, 188, 213], '1977': [61, 244], '1978': [62, 198], '1968': [68, 71, 141], '1991': [70, 122, 128, 138, 144, 164, 202], '1970': [75], '1965': [82, 135, 194], '1957': [85, 134], '1958': [94], '1950': [104], '1949': [109], '1956': [112, 150, 212, 227], '1963': [116, 119], '1999': [117, 154, 225], '1990': [127, 153], '1964': [133, 137, 248], '1961': [140, 147, 193, 220], '2006': [148], '1948': [152], '1947': [168, 247], '1994': [169], '2000': [191, 231], '2011': [203], '1983': [208], '1979': [209], '1980': [211, 249], '2002': [216, 222]}, 'UNregion': {'southern asia': [0, 18, 25, 103, 105, 135, 155, 168, 205], 'northern europe': [1, 60, 70, 73, 76, 93, 102, 107, 108, 113, 122, 128, 166, 214, 215, 235], 'southern europe': [2, 5, 28, 55, 86, 87, 110, 118, 131, 137, 148, 178, 187, 191, 197, 204, 242], 'northern africa': [3, 66, 126, 150, 212, 227, 246], 'polynesia': [4, 52, 79, 154, 162, 176, 186, 224, 225, 231, 245], 'middle africa': [6, 40, 43, 44, 51, 64, 68, 81, 188], 'caribbean': [7, 9, 12, 16, 19, 27, 33, 42, 56, 57, 62, 63, 89, 90, 97, 111, 139, 149, 179, 185, 195, 206, 208, 209, 211, 226, 230, 238], 'antarctica': [8], 'south america': [10, 26, 30, 31, 45, 49, 65, 74, 78, 96, 173, 174, 201, 213, 239, 243], 'western asia': [11, 15, 17, 58, 83, 106, 109, 114, 119, 123, 167, 170, 180, 189, 217, 228, 234, 247], 'australia and new zealand': [13, 47, 48, 98, 158, 163], 'western europe': [14, 21, 77, 84, 127, 129, 146, 156, 216], 'eastern europe': [20, 35, 59, 101, 145, 177, 182, 183, 196, 233], 'central america': [22, 53, 67, 92, 99, 143, 159, 171], 'western africa': [23, 36, 38, 54, 82, 85, 94, 95, 125, 136, 140, 160, 161, 190, 193, 207, 223], 'northern america': [24, 41, 88, 210, 236], 'southern africa': [29, 71, 124, 153, 200], 'eastern africa': [32, 37, 50, 61, 69, 72, 80, 116, 132, 133, 141, 142, 151, 181, 184, 192, 199, 203, 220, 232, 248, 249], 'south-eastern asia': [34, 39, 104, 121, 134, 152, 175, 194, 221, 222, 244], 'eastern asia': [46, 100, 112, 130, 147, 164, 202, 218], 'melanesia': [75, 157, 172, 198, 241], 'micronesia': [91, 117, 138, 144, 165, 169, 237], 'central asia': [115, 120, 219, 229, 240]}, 'WIOD': {'row': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 15, 16, 17, 18, 19, 20, 22, 23, 24, 25, 26, 27, 28, 29, 30, 32, 33, 34, 36, 37, 38, 39, 40, 42, 43, 44, 45, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 61, 62, 63, 64, 65, 66, 67, 68, 69, 71, 72, 73, 74, 75, 78, 79, 80, 81, 82, 83, 85, 86, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 102, 105, 106, 108, 109, 111, 113, 114, 115, 116, 117, 118, 119, 120, 121, 123, 124, 125, 126, 127, 130, 131, 132, 133, 134, 135, 136, 138, 139, 140, 141, 142, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 179, 180, 181, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 198, 199, 200, 201, 203, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 216, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 229, 230, 231, 232, 233, 234, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249], 'aus': [13], 'aut': [14], 'bel': [21], 'bra': [31], 'bgr': [35], 'can': [41], 'chn': [46], 'cyp': [58], 'cze': [59], 'dnk': [60], 'est': [70], 'fin': [76], 'fra': [77], 'deu': [84], 'grc': [87], 'hun': [101], 'ind': [103], 'idn': [104], 'irl': [107], 'ita': [110], 'jpn': [112], 'lva': [122], 'ltu': [128], 'lux': [129], 'mlt': [137], 'mex': [143], 'nld': [156], 'pol': [177], 'prt': [178], 'rou': [182], 'rus': [183], 'svk': [196], 'svn': [197], 'kor': [202], 'esp': [204], 'swe': [215], 'twn': [218], 'tur': [228], 'gbr': [235], 'usa': [236]}, 'ccTLD': {'af': [0], 'ax': [1], 'al': [2], 'dz': [3], 'as': [4], 'ad': [5], 'ao': [6], 'ai': [7], 'aq': [8], 'ag': [9], 'ar': [10], 'am': [11], 'aw': [12], 'au': [13], 'at': [14], 'az': [15], 'bs': [16], 'bh': [17], 'bd': [18], 'bb': [19], 'by': [20], 'be': [21], 'bz': [22], 'bj': [23], 'bm': [24], 'bt': [25], 'bo': [26], 'bq': [27], 'ba': [28], 'bw': [29], 'br': [31], 'io': [32], 'vg': [33], 'bn': [34], 'bg': [35], 'bf': [36], 'bi': [37], 'cv': [38], 'kh': [39], 'cm': [40], 'ca': [41], 'ky': [42], 'cf': [43], 'td': [44], 'cl': [45], 'cn': [46], 'cx': [47], 'cc': [48], 'co': [49], 'km': [50], 'cg': [51], 'ck': [52], 'cr': [53], 'ci': [54], 'hr': [55], 'cu': [56], 'cw': [57], 'cy': [58], 'cz': [59], 'dk': [60], 'dj': [61], 'dm': [62], 'do': [63], 'cd': [64], 'ec': [65], 'eg': [66], 'sv': [67], 'gq': [68], 'er': [69], 'ee': [70], 'sz': [71], 'et': [72], 'fo': [73], 'fk': [74], 'fj': [75], 'fi': [76], 'fr': [77], 'gf': [78], 'pf': [79], 'tf': [80], 'ga': [81], 'gm': [82], 'ge': [83], 'de': [84], 'gh': [85], 'gi': [86], 'gr': [87], 'gl': [88], 'gd': [89], 'gp': [90], 'gu': [91], 'gt': [92], 'gg': [93], 'gn': [94], 'gw': [95], 'gy': [96], 'ht': [97], 'hm': [98], 'hn': [99], 'hk': [100], 'hu': [101], 'is': [102], 'in': [103], 'id': [104], 'ir': [105], 'iq': [106], 'ie': [107], 'im': [108], 'il': [109], 'it': [110], 'jm': [111], 'jp': [112], 'je': [113], 'jo': [114], 'kz': [115], 'ke': [116], 'ki': [117], 'kw': [119], 'kg': [120], 'la': [121], 'lv': [122], 'lb': [123], 'ls': [124], 'lr': [125], 'ly': [126], 'li': [127], 'lt': [128], 'lu': [129], 'mo': [130], 'mk': [131], 'mg': [132], 'mw': [133], 'my': [134], 'mv': [135], 'ml': [136], 'mt': [137], 'mh': [138], 'mq': [139], 'mr': [140], 'mu': [141], 'yt': [142], 'mx': [143], 'fm': [144], 'md': [145], 'mc': [146], 'mn': [147], 'me': [148], 'ms': [149], 'ma': [150], 'mz': [151], 'mm': [152], 'na': [153], 'nr': [154], 'np': [155], 'nl': [156], 'nc': [157], 'nz': [158], 'ni': [159], 'ne': [160], 'ng': [161], 'nu': [162], 'nf': [163], 'kp': [164], 'mp': [165], 'no': [166], 'om': [167], 'pk': [168], 'pw': [169], 'ps': [170], 'pa': [171], 'pg': [172], 'py': [173], 'pe': [174], 'ph': [175], 'pn': [176], 'pl': [177], 'pt': [178], 'pr': [179], 'qa': [180], 're': [181], 'ro': [182], 'ru': [183], 'rw': [184], 'ws': [186], 'sm': [187], 'st': [188], 'sa': [189], 'sn': [190], 'rs': [191], 'sc': [192], 'sl': [193], 'sg': [194], 'sx': [195], 'sk': [196], 'si': [197], 'sb': [198], 'so': [199], 'za': [200], 'gs': [201], 'kr': [202], 'ss': [203], 'es': [204], 'lk': [205], 'sh': [207], 'kn': [208], 'lc': [209], 'pm': [210], 'vc': [211], 'sd': [212], 'sr': [213], 'se': [215], 'ch': [216], 'sy': [217], 'tw': [218], 'tj': [219], 'tz': [220], 'th': [221], 'tl': [222], 'tg': [223], 'tk': [224], 'to': [225], 'tt': [226], 'tn': [227], 'tr': [228], 'tm': [229], 'tc': [230], 'tv': [231], 'ug': [232], 'ua': [233], 'ae': [234], 'uk': [235], 'us': [236], 'vi': [238], 'uy': [239], 'uz': [240], 'vu': [241], 'va': [242], 've': [243], 'vn': [244], 'wf': [245], 'eh': [246], 'ye': [247], 'zm': [248], 'zw': [249]}, 'continent': {'asia': [0, 11, 15, 17, 18, 25, 34, 39, 46, 47, 48, 58, 83, 100, 103, 104, 105, 106, 109, 112, 114, 115, 119, 120, 121, 123, 130, 134, 135, 147, 152, 155, 164, 167, 168, 170, 175, 180, 189, 194, 202, 205, 217, 218, 219, 221, 222, 228, 229, 234, 240, 244, 247], 'europe': [1, 2, 5, 14, 20, 21, 28, 35, 55, 59, 60, 70, 73, 76, 77, 84, 86, 87, 93, 101, 102, 107, 108, 110, 113, 118, 122, 127, 128, 129, 131, 137, 145, 146, 148, 156, 166, 177, 178, 182, 183, 187, 191, 196, 197, 204, 214, 215, 216, 233, 235, 242], 'africa': [3, 6, 23, 29, 32, 36, 37, 38, 40, 43, 44, 50, 51, 54, 61, 64, 66, 68, 69, 71, 72, 80, 81, 82, 85, 94, 95, 116, 124, 125, 126, 132, 133, 136, 140, 141, 142, 150, 151, 153, 160, 161, 181, 184, 188, 190, 192, 193, 199, 200, 203, 207, 212, 220, 223, 227, 232, 246, 248, 249], 'oceania': [4, 13, 52, 75, 79, 91, 117, 138, 144, 154, 157, 158, 162, 163, 165, 169, 172, 176, 186, 198, 224, 225, 231, 237, 241, 245], 'america': [7, 9, 10, 12, 16, 19, 22, 24, 26, 27, 31, 33, 41, 42, 45, 49, 53, 56, 57, 62, 63, 65, 67, 74, 78, 88, 89, 90, 92, 96, 97, 99, 111, 139, 143, 149, 159, 171, 173, 174, 179, 185, 195, 206, 208, 209, 210, 211, 213, 226, 230, 236, 238, 239, 243], 'antarctica': [8, 30, 98, 201]}, 'name_official': {'islamic republic of afghanistan': [0], 'åland islands': [1], 'republic of albania': [2], "people's democratic republic of algeria": [3], 'american samoa': [4], 'principality of andorra': [5], 'republic of angola': [6], 'anguilla': [7], 'antarctica': [8], 'antigua and barbuda': [9], 'argentine republic': [10], 'republic of armenia': [11], 'aruba': [12], 'commonwealth of australia': [13], 'republic of austria': [14], 'republic of azerbaijan': [15], 'commonwealth of the bahamas': [16], 'kingdom of bahrain': [17], "people's republic of bangladesh": [18], 'barbados': [19], 'republic of belarus': [20], 'kingdom of belgium': [21], 'belize': [22], 'republic of benin': [23], 'bermuda': [24], 'kingdom of bhutan': [25], 'plurinational state of bolivia': [26], 'bonaire, saint eustatius and saba': [27], 'bosnia and herzegovina': [28], 'republic of botswana': [29], 'bouvet island': [30], 'federative republic of brazil': [31], 'british indian ocean territory': [32], 'british virgin islands': [33], 'nation of brunei, abode of peace': [34], 'republic of bulgaria': [35], 'burkina faso': [36], 'republic of burundi': [37], 'republic of cabo verde': [38], 'kingdom of cambodia': [39], 'republic of cameroon': [40], 'canada': [41], 'cayman islands': [42], 'central african republic': [43], 'republic of chad': [44], 'republic of chile': [45], "people's republic of china": [46], 'christmas island': [47], 'territory of the cocos (keeling) islands': [48], 'republic of colombia': [49], 'union of the comoros': [50], 'republic of the congo': [51], 'cook islands': [52], 'republic of costa rica': [53], "republic of côte d'ivoire": [54], 'republic of croatia': [55], 'republic of cuba': [56], 'country of curaçao': [57], 'republic of cyprus': [58], 'czech republic': [59], 'kingdom of denmark': [60], 'republic of djibouti': [61], 'commonwealth of dominica': [62], 'dominican republic': [63], 'democratic republic of the congo': [64], 'republic of ecuador': [65], 'arab republic of egypt': [66], 'republic of el salvador': [67], 'republic of equatorial guinea': [68], 'state of eritrea': [69], 'republic of estonia': [70], 'kingdom of eswatini': [71], 'federal democratic republic of ethiopia': [72], 'faroe islands': [73], 'falkland islands (malvinas)': [74], 'republic of fiji': [75], 'republic of finland': [76], 'french republic': [77], 'guiana': [78], 'french polynesia': [79], 'territory of the french southern and antarctic lands': [80], 'gabonese republic': [81], 'republic of the gambia': [82], 'georgia': [83], 'federal republic of germany': [84], 'republic of ghana': [85], 'gibraltar': [86], 'hellenic republic': [87], 'greenland': [88], 'grenada': [89], 'guadeloupe': [90], 'guam': [91], 'republic of guatemala': [92], 'guernsey': [93], 'republic of guinea': [94], 'republic of guinea-bissau': [95], 'co-operative republic of guyana': [96], 'republic of haiti': [97], 'territory of heard island and mcdonald islands': [98], 'republic of honduras': [99], 'hong kong sar': [100], 'republic of hungary': [101], 'republic of iceland': [102], 'republic of india': [103], 'republic of indonesia': [104], 'islamic republic of iran': [105], 'republic of iraq': [106], 'ireland': [107], 'isle of man': [108], 'state of israel': [109], 'italian republic': [110], 'jamaica': [111], 'japan': [112], 'jersey': [113], 'hashemite kingdom of jordan': [114], 'republic of kazakhstan': [115], 'republic of kenya': [116], 'republic of kiribati': [117], 'republic of kosovo': [118], 'state of kuwait': [119], 'kyrgyz republic': [120], "lao people's democratic republic": [121], 'republic of latvia': [122], 'lebanese republic': [123], 'kingdom of lesotho': [124], 'republic of liberia': [125], 'state of libya': [126], 'principality of liechtenstein': [127], 'republic of lithuania': [128], 'grand duchy of luxembourg': [129], 'macau sar': [130], 'republic of north macedonia': [131], 'republic of madagascar': [132], 'republic of malawi': [133], 'malaysia': [134], 'republic of maldives': [135], 'republic of mali': [136], 'republic of malta': [137], 'republic of the marshall islands': [138], 'martinique': [139], 'islamic republic of mauritania': [140], 'republic of mauritius': [141], 'mayotte': [142], 'united mexican states': [143], 'federated states of micronesia': [144], 'republic of moldova': [145], 'principality of monaco': [146], 'mongolia': [147], 'montenegro': [148], 'montserrat': [149], 'kingdom of morocco': [150], 'republic of mozambique': [151], 'republic of the union of myanmar': [152], 'republic of namibia': [153], 'republic of nauru': [154], 'federal democratic republic of nepal': [155], 'kingdom of the netherlands': [156], 'new caledonia': [157], 'new zealand': [158], 'republic of nicaragua': [159], 'republic of niger': [160], 'federal republic of nigeria': [161], 'niue': [162], 'norfolk island': [163], "democratic people's republic of korea": [164], 'northern mariana islands': [165], 'kingdom of norway': [166], 'sultanate of oman': [167], 'islamic republic of pakistan': [168], 'republic of palau': [169], 'state of palestine': [170], 'republic of panama': [171], 'independent state of papua new guinea': [172], 'republic of paraguay': [173], 'republic of peru': [174], 'republic of the philippines': [175], 'pitcairn': [176], 'republic of poland': [177], 'portuguese republic': [178], 'puerto rico': [179], 'state of qatar': [180], 'réunion': [181], 'romania': [182], 'russian federation': [183], 'republic of rwanda': [184], 'saint-martin (french part)': [185], 'independent state of samoa': [186], 'republic of san marino': [187], 'democratic republic of são tomé and príncipe': [188], 'kingdom of saudi arabia': [189], 'republic of senegal': [190], 'republic of serbia': [191], 'republic of seychelles': [192], 'republic of sierra leone': [193], 'republic of singapore': [194], 'sint maarten (dutch part)': [195], 'slovak republic': [196], 'republic of slovenia': [197], 'solomon islands': [198], 'federal republic of somalia': [199], 'republic of south africa': [200], 'south georgia and the south sandwich islands': [201], 'republic of korea': [202], 'republic of south sudan': [203], 'kingdom of spain': [204], 'democratic socialist republic of sri lanka': [205], 'territorial collectivity of saint-barthélemy': [206], 'saint helena, ascension and tristan da cunha': [207], 'saint kitts and nevis': [208], 'saint lucia': [209], 'saint pierre and miquelon': [210], 'saint vincent and the grenadines': [211], 'republic of the sudan': [212], 'republic of suriname': [213], 'svalbard and jan mayen islands': [214], 'kingdom of sweden': [215], 'swiss confederation': [216], 'syrian arab republic': [217], 'republic of china': [218], 'republic of tajikistan': [219], 'united republic of tanzania': [220], 'kingdom of thailand': [221], 'democratic republic of timor-leste': [222], 'togolese republic': [223], 'tokelau': [224], 'kingdom of tonga': [225], 'republic of trinidad and tobago': [226], 'republic of tunisia': [227], 'republic of türkiye': [228], 'turkmenistan': [229], 'turks and caicos islands': [230], 'tuvalu': [231], 'republic of uganda': [232], 'ukraine': [233], 'united arab emirates': [234], 'united kingdom of great britain and northern ireland': [235], 'united states of america': [236], 'united states minor outlying islands': [237], 'virgin islands of the united states': [238], 'oriental republic of uruguay': [239], 'republic of uzbekistan': [240], 'republic of vanuatu': [241], 'vatican city state': [242], 'bolivarian republic of venezuela': [243], 'socialist republic of vietnam': [244], 'wallis and futuna islands': [245], 'western sahara': [246], 'republic of yemen': [247], 'republic of zambia': [248], 'republic of zimbabwe': [249]}, 'name_short': {'afghanistan': [0], 'åland islands': [1], 'albania': [2], 'algeria': [3], 'american samoa': [4], 'andorra': [5], 'angola': [6], 'anguilla': [7], 'antarctica': [8], 'antigua and barbuda': [9], 'argentina': [10], 'armenia': [11], 'aruba': [12], 'australia': [13], 'austria': [14], 'azerbaijan': [15], 'bahamas': [16], 'bahrain': [17], 'bangladesh': [18], 'barbados': [19], 'belarus': [20], 'belgium': [21], 'belize': [22], 'benin': [23], 'bermuda': [24], 'bhutan': [25], 'bolivia': [26], 'bonaire, saint eustatius and saba': [27], 'bosnia and herzegovina': [28], 'botswana': [29], 'bouvet island': [30], 'brazil': [31], 'british indian ocean territory': [32], 'british virgin islands': [33], 'brunei darussalam': [34], 'bulgaria': [35], 'burkina faso': [36], 'burundi': [37], 'cabo verde': [38], 'cambodia': [39], 'cameroon': [40], 'canada': [41], 'cayman islands': [42], 'central african republic': [43], 'chad': [44], 'chile': [45], 'china': [46], 'christmas island': [47], 'cocos (keeling) islands': [48], 'colombia': [49], 'comoros': [50], 'congo republic': [51], 'cook islands': [52], 'costa rica': [53], "côte d'ivoire": [54], 'croatia': [55], 'cuba': [56], 'curaçao': [57], 'cyprus': [58], 'czechia': [59], 'denmark': [60], 'djibouti': [61], 'dominica': [62], 'dominican republic': [63], 'dr congo': [64], 'ecuador': [65], 'egypt': [66], 'el salvador': [67], 'equatorial guinea': [68], 'eritrea': [69], 'estonia': [70], 'eswatini': [71], 'ethiopia': [72], 'faroe islands': [73], 'falkland islands': [74], 'fiji': [75], 'finland': [76], 'france': [77], 'french guiana': [78], 'french polynesia': [79], 'french southern territories': [80], 'gabon': [81], 'gambia': [82], 'georgia': [83], 'germany': [84], 'ghana': [85], 'gibraltar': [86], 'greece': [87], 'greenland': [88], 'grenada': [89], 'guadeloupe': [90], 'guam': [91], 'guatemala': [92], 'guernsey': [93], 'guinea': [94], 'guinea-bissau': [95], 'guyana': [96], 'haiti': [97], 'heard and mcdonald islands': [98], 'honduras': [99], 'hong kong': [100], 'hungary': [101], 'iceland': [102], 'india': [103], 'indonesia': [104], 'iran': [105], 'iraq': [106], 'ireland': [107], 'isle of man': [108], 'israel': [109], 'italy': [110], 'jamaica': [111], 'japan': [112], 'jersey': [113], 'jordan': [114], 'kazakhstan': [115], 'kenya': [116], 'kiribati': [117], 'kosovo': [118], 'kuwait': [119], 'kyrgyzstan': [120], 'laos': [121], 'latvia': [122], 'lebanon': [123], 'lesotho': [124], 'liberia': [125], 'libya': [126], 'liechtenstein': [127], 'lithuania': [128], 'luxembourg': [129], 'macau': [130], 'north macedonia': [131], 'madagascar': [132], 'malawi': [133], 'malaysia': [134], 'maldives': [135], 'mali': [136], 'malta': [137], 'marshall islands': [138], 'martinique': [139], 'mauritania': [140], 'mauritius': [141], 'mayotte': [142], 'mexico': [143], 'micronesia, fed': [144], 'moldova': [145], 'monaco': [146], 'mongolia': [147], 'montenegro': [148], 'montserrat': [149], 'morocco': [150], 'mozambique': [151], 'myanmar': [152], 'namibia': [153], 'nauru': [154], 'nepal': [155], 'netherlands': [156], 'new caledonia': [157], 'new zealand': [158], 'nicaragua': [159], 'niger': [160], 'nigeria': [161], 'niue': [162], 'norfolk island': [163], 'north korea': [164], 'northern mariana islands': [165], 'norway': [166], 'oman': [167], 'pakistan': [168], 'palau': [169], 'palestine': [170], 'panama': [171], 'papua new guinea': [172], 'paraguay': [173], 'peru': [174], 'philippines': [175], 'pitcairn': [176], 'poland': [177], 'portugal': [178], 'puerto rico': [179], 'qatar': [180], 'réunion': [181], 'romania': [182], 'russia': [183], 'rwanda': [184], 'saint-martin': [185], 'samoa': [186], 'san marino': [187], 'sao tome and principe': [188], 'saudi arabia': [189], 'senegal': [190], 'serbia': [191], 'seychelles': [192], 'sierra leone': [193], 'singapore': [194], 'sint maarten': [195], 'slovakia': [196], 'slovenia': [197], 'solomon islands': [198], 'somalia': [199], 'south africa': [200], 'south georgia and south sandwich is': [201], 'south korea': [202], 'south sudan': [203], 'spain': [204], 'sri lanka': [205], 'st': [206, 207, 208, 209, 210, 211], 'sudan': [212], 'suriname': [213], 'svalbard and jan mayen islands': [214], 'sweden': [215], 'switzerland': [216], 'syria': [217], 'taiwan': [218], 'tajikistan': [219], 'tanzania': [220], 'thailand': [221], 'timor-leste': [222], 'togo': [223], 'tokelau': [224], 'tonga': [225], 'trinidad and tobago': [226], 'tunisia': [227], 'türkiye': [228], 'turkmenistan': [229], 'turks and caicos islands': [230], 'tuvalu': [231], 'uganda': [232], 'ukraine': [233], 'united arab emirates': [234], 'united kingdom': [235], 'united states': [236], 'united states minor outlying islands': [237], 'united states virgin islands': [238], 'uruguay': [239], 'uzbekistan': [240], 'vanuatu': [241], 'vatican': [242], 'venezuela': [243], 'vietnam': [244], 'wallis and futuna islands': [245], 'western sahara': [246], 'yemen': [247], 'zambia': [248], 'zimbabwe': [249]}, 'obsolete': {}, 'regex': {'afghan': [0], '\\b(a|å)land': [1], 'albania': [2], 'algeria': [3], '^(?=': [4, 33, 59, 78, 108, 164, 222, 238], 'andorra': [5], 'angola': [6], 'anguill?a': [7], 'antarctica': [8], 'antigua': [9], 'argentin': [10], 'armenia': [11], '^(?!': [12, 21, 51, 77, 83, 94, 96, 99, 107, 113, 129, 143, 148, 156, 168, 185, 186, 191, 195, 196, 202, 212, 236], 'australia': [13], 'austria': [14], 'azerbaijan': [15], 'bahamas': [16], 'bahrain': [17], 'bangladesh|^(?=': [18], 'barbados': [19], 'belarus|byelo': [20], 'belize|^(?=': [22], 'benin|dahome': [23], 'bermuda': [24], 'bhutan': [25], 'bolivia': [26], '^bonaire|(?=': [27], 'herzegovina|bosnia': [28], 'botswana|bechuana|botsuana': [29], 'bouvet': [30], 'brazil': [31], 'br': [32], 'brunei': [34], 'bulgaria': [35], 'burkina|\\bfaso|upper': [36], 'burundi': [37], '(cabo|cape) *verde': [38], 'cambodia|kampuchea|khmer|^p\\': [39], 'cameroon': [40], 'canada': [41], 'cayman': [42], 'central': [43], '\\bchad': [44], '\\bchile': [45], '^(?!repub)(?!taiwan)(?!hong': [46], 'christmas': [47], '\\bcocos|keeling': [48], 'colombia': [49], 'comoro': [50], '\\bcook': [52], 'costa': [53], '': [54, 100, 110, 130, 218, 235], 'croatia|hrvatska': [55], '\\bcuba': [56], '\\bcura(c|ç)ao': [57], 'cyprus': [58], 'denmark': [60], 'djibouti': [61], 'dominica(?!n)': [62], 'dominican': [63], '\\bdem': [64], 'ecuador': [65], 'egypt': [66], 'el': [67], 'guine': [68], 'eritrea': [69], 'estonia': [70], 'swaziland|eswatini': [71], 'ethiopia|abyssinia': [72], 'faroe|faeroe': [73], 'falkland|malvinas': [74], 'fiji': [75], 'finland': [76], 'french': [79, 80], 'gab(o|u)n': [81], 'gambia': [82], '^(?!e|w)(fed)?': [84], 'ghana|gold': [85], 'gibraltar': [86], 'greece|hellenic|hellas': [87], 'greenland': [88], 'grenada': [89], 'guadeloupe': [90], '\\bguam': [91], 'guatemala': [92], 'guernsey': [93], '^(': [95], '(ha(i|\\xef|\\xc3\\xaf)ti)': [97], 'heard': [98], 'hungary': [101], 'iceland': [102], '^(?!\\d*(?:bassas))\\d*india(?!': [103], 'indonesia': [104], '\\biran|persia': [105], '\\biraq|mesopotamia': [106], 'israel': [109], 'jamaica': [111], 'japan': [112], 'jordan': [114], 'kazak': [115], 'kenya|british': [116], 'kiribati': [117], 'kosovo': [118], 'kuwait': [119], 'kyrgyz|kirghiz': [120], '\\blaos?\\b': [121], 'latvia': [122], 'lebanon|lebanese': [123], 'lesotho|basuto': [124], 'liberia': [125], 'libya': [126], 'liechtenstein': [127], 'lithuania': [128], 'macedonia|^f\\': [131], 'madagascar|malagasy': [132], 'malawi|nyasa': [133], 'malaysia': [134], 'maldive': [135], '\\bmali\\b': [136], '\\bmalta': [137], 'marshall': [138], 'martinique': [139], 'mauritania': [140], 'mauritius': [141], 'mayotte': [142], 'micronesia': [144], 'moldov|b(a|e)ssarabia': [145], 'monaco': [146], 'mongolia': [147], 'montserrat': [149], 'morocco|\\bmaroc': [150], 'mozambique': [151], 'myanmar|burma': [152], 'namibia': [153], 'nauru': [154], 'nepal': [155], 'new': [157], '(new|n)': [158], 'nicaragua': [159], '\\bniger(?!ia)': [160], 'nigeria': [161], 'niue': [162], 'norfolk': [163], 'mariana': [165], 'norway': [166], '\\boman|trucial': [167], 'palau': [169], 'palestin|\\bgaza|west': [170], 'panama': [171], '\\bp': [172], 'paraguay': [173], 'peru': [174], 'philippines': [175], 'pitcairn': [176], 'poland': [177], 'portugal|portuguese': [178], 'puerto': [179], 'qatar': [180], 'reunion|réunion': [181], 'r(o|u|ou)mania': [182], '\\brussia': [183], 'rwanda': [184], 'san': [187], 'tome|tomé': [188], '\\bsa\\w*': [189], 'senegal': [190], 'seychell': [192], 'sierra': [193], 'singapore': [194], 'slovenia': [197], 'solomon': [198], 'somali': [199], '\\bs(\\': [200], 'south': [201], '\\bs\\w*': [203], 'spain': [204], 'sri': [205], 'barth|barts': [206], 'helena': [207], 'kitts|\\bnevis': [208], '\\blucia': [209], 'miquelon': [210], 'vincent': [211], 'surinam|dutch': [213], '^(?!norway)': [214], 'swedish|sweden(?!': [215], 'switz|swiss': [216], 'syria': [217], 'tajik': [219], 'tanzania(?!: zan': [220], 'thailand|\\bsiam': [221], 'togo': [223], 'tokelau': [224], 'tonga': [225], 'trinidad|tobago': [226], 'tunisia': [227], 't[ü|u]rk[i|e]y': [228], 'turk-?men': [229], 'turks': [230], 'tuvalu': [231], 'uganda': [232], 'ukrain': [233], 'emirates|^u\\': [234], 'minor': [237], 'uruguay': [239], 'uzbek': [240], 'vanuatu|new': [241], 'holy': [242], 'venezuela': [243], '^((?!n|s|': [244], 'futuna|wallis': [245], '\\bw': [246], 'yemen': [247], 'zambia|northern': [248], 'zimbabwe|^(?!': [249]}},
+    'iso2_index': ({'AF': [0], 'AX': [1], 'AL': [2], 'DZ': [3], 'AS': [4], 'AD': [5], 'AO': [6], 'AI': [7], 'AQ': [8], 'AG': [9], 'AR': [10], 'AM': [11], 'AW': [12], 'AU': [13], 'AT': [14], 'AZ': [15], 'BS': [16], 'BH': [17], 'BD': [18], 'BB': [19], 'BY': [20], 'BE': [21], 'BZ': [22], 'BJ': [23], 'BM': [24], 'BT': [25], 'BO': [26], 'BQ': [27], 'BA': [28], 'BW': [29], 'BV': [30], 'BR': [31], 'IO': [32], 'VG': [33], 'BN': [34], 'BG': [35], 'BF': [36], 'BI': [37], 'CV': [38], 'KH': [39], 'CM': [40], 'CA': [41], 'KY': [42], 'CF': [43], 'TD': [44], 'CL': [45], 'CN': [46], 'CX': [47], 'CC': [48], 'CO': [49], 'KM': [50], 'CG': [51], 'CK': [52], 'CR': [53], 'CI': [54], 'HR': [55], 'CU': [56], 'CW': [57], 'CY': [58], 'CZ': [59], 'DK': [60], 'DJ': [61], 'DM': [62], 'DO': [63], 'CD': [64], 'EC': [65], 'EG': [66], 'SV': [67], 'GQ': [68], 'ER': [69], 'EE': [70], 'SZ': [71], 'ET': [72], 'FO': [73], 'FK': [74], 'FJ': [75], 'FI': [76], 'FR': [77], 'GF': [78], 'PF': [79], 'TF': [80], 'GA': [81], 'GM': [82], 'GE': [83], 'DE': [84], 'GH': [85], 'GI': [86], 'GR': [87], 'EL': [87], 'GL': [88], 'GD': [89], 'GP': [90], 'GU': [91], 'GT': [92], 'GG': [93], 'GN': [94], 'GW': [95], 'GY': [96], 'HT': [97], 'HM': [98], 'HN': [99], 'HK': [100], 'HU': [101], 'IS': [102], 'IN': [103], 'ID': [104], 'IR': [105], 'IQ': [106], 'IE': [107], 'IM': [108], 'IL': [109], 'IT': [110], 'JM': [111], 'JP': [112], 'JE': [113], 'JO': [114], 'KZ': [115], 'KE': [116], 'KI': [117], 'XK': [118], 'KW': [119], 'KG': [120], 'LA': [121], 'LV': [122], 'LB': [123], 'LS': [124], 'LR': [125], 'LY': [126], 'LI': [127], 'LT': [128], 'LU': [129], 'MO': [130], 'MK': [131], 'MG': [132], 'MW': [133], 'MY': [134], 'MV': [135], 'ML': [136], 'MT': [137], 'MH': [138], 'MQ': [139], 'MR': [140], 'MU': [141], 'YT': [142], 'MX': [143], 'FM': [144], 'MD': [145], 'MC': [146], 'MN': [147], 'ME': [148], 'MS': [149], 'MA': [150], 'MZ': [151], 'MM': [152], 'NA': [153], 'NR': [154], 'NP': [155], 'NL': [156], 'NC': [157], 'NZ': [158], 'NI': [159], 'NE': [160], 'NG': [161], 'NU': [162], 'NF': [163], 'KP': [164], 'MP': [165], 'NO': [166], 'OM': [167], 'PK': [168], 'PW': [169], 'PS': [170], 'PA': [171], 'PG': [172], 'PY': [173], 'PE': [174], 'PH': [175], 'PN': [176], 'PL': [177], 'PT': [178], 'PR': [179], 'QA': [180], 'RE': [181], 'RO': [182], 'RU': [183], 'RW': [184], 'MF': [185], 'WS': [186], 'SM': [187], 'ST': [188], 'SA': [189], 'SN': [190], 'RS': [191], 'SC': [192], 'SL': [193], 'SG': [194], 'SX': [195], 'SK': [196], 'SI': [197], 'SB': [198], 'SO': [199], 'ZA': [200], 'GS': [201], 'KR': [202], 'SS': [203], 'ES': [204], 'LK': [205], 'BL': [206], 'SH': [207], 'KN': [208], 'LC': [209], 'PM': [210], 'VC': [211], 'SD': [212], 'SR': [213], 'SJ': [214], 'SE': [215], 'CH': [216], 'SY': [217], 'TW': [218], 'TJ': [219], 'TZ': [220], 'TH': [221], 'TL': [222], 'TG': [223], 'TK': [224], 'TO': [225], 'TT': [226], 'TN': [227], 'TR': [228], 'TM': [229], 'TC': [230], 'TV': [231], 'UG': [232], 'UA': [233], 'AE': [234], 'GB': [235], 'UK': [235], 'US': [236], 'UM': [237], 'VI': [238], 'UY': [239], 'UZ': [240], 'VU': [241], 'VA': [242], 'VE': [243], 'VN': [244], 'WF': [245], 'EH': [246], 'YE': [247], 'ZM': [248], 'ZW': [249]}, [], [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249]),
+    'reports': [],
+}
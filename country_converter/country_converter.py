@@ -2,21 +2,141 @@
 """country_converter - Classification converter for countries."""
 
 import argparse
+import array
+import bisect
+import contextlib
+import csv
+import functools
+import hashlib
+import io
+import itertools
 import logging
+import math
 import os
+import pickle
 import re
+import struct
 import sys
-from collections import OrderedDict
+import threading
+import time
+import weakref
+from collections import OrderedDict, namedtuple
+from typing import TYPE_CHECKING
 
-import pandas as pd
-from pandas._libs.parsers import STR_NA_VALUES
+try:
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - python < 3.11
+    import sre_parse
 
 from country_converter.version import __version__
 
+if TYPE_CHECKING:  # pragma: no cover - pandas is only imported when needed
+    import pandas as pd
+
 COUNTRY_DATA_FILE = os.path.join(os.path.split(os.path.abspath(__file__))[0], "country_data.tsv")
 
+# Format version of the binary country data snapshots
+_SNAPSHOT_FORMAT = 3
+
+# Start and format version of the files written by CountryConverter.share
+_SHARE_MAGIC = b"COCOSHR1"
+
+# Hashes of the data files found without duplicated entries in this process,
+# their duplicate checks are skipped (see strict_validation of CountryConverter)
+_VALIDATED_HASHES = set()
+
+_MUST_BE_UNIQUE = ("name_short", "name_official", "regex")
+_MUST_BE_STRING = (
+    *_MUST_BE_UNIQUE,
+    "ISO2",
+    "ISO3",
+    "continent",
+    "UNregion",
+    "EXIO1",
+    "EXIO2",
+    "EXIO3",
+    "WIOD",
+)
+_MUST_BE_INT = (
+    "ISOnumeric",
+    "UNcode",
+    "FAOcode",
+    "GBDcode",
+    "EURO",
+    "UN",
+    "UNmember",
+    "obsolete",
+    "GEOnumeric",
+)
+
+# Strings read as missing values (the defaults of pandas.read_csv)
+_NA_VALUES = frozenset(
+    (
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    )
+)
+
 log = logging.getLogger(__name__)
 
+# CountryConverter instances shared by the module level functions
+_shared_converters = {}
+_shared_converters_lock = threading.Lock()
+
+# ISO2 entries which can be looked up in a hash index instead of regex search
+_ISO2_CODE = re.compile(r"\^?([A-Za-z0-9]{2})\$?")
+
+# Minimum number of unique names per process for parallel conversions
+_MIN_NAMES_PER_JOB = 256
+
+# CountryConverter of a worker process of a parallel conversion
+_worker_converter = None
+
+# Maximum number of distinct names kept converted in the streaming mode of the CLI
+_STREAM_CACHE_SIZE = 100000
+
+# Number of correspondence tables cached by a CountryConverter
+_CORRESPONDENCE_CACHE_SIZE = 128
+
+CorrespondenceCodes = namedtuple("CorrespondenceCodes", ["classes_a", "classes_b", "codes_a", "codes_b"])
+
+# Aggregation concordance of agg_conc (as_dataframe 'csr' or 'index')
+Concordance = namedtuple("Concordance", ["original", "aggregated", "concordance"])
+
+# Largest code of a numeric classification held in a direct lookup table
+_MAX_DIRECT_CODE = 1 << 20
+
+# Upper bounds (seconds) of the latency histogram buckets of the statistics
+_STATS_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, math.inf)
+
+# Marker for names which were not found in the conversion results
+_NOT_FOUND = object()
+
+# Non ASCII characters which match ASCII letters in case insensitive regexes
+_ASCII_CASE_FIXES = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _case_key(text):
+    """Normalize text for case insensitive comparisons (as re.IGNORECASE, plus full case folding)."""
+    return text.translate(_ASCII_CASE_FIXES).casefold()
+
 
 def agg_conc(
     original_countries,
@@ -70,12 +190,15 @@ def agg_conc(
     coco: instance of CountryConverter, optional
         CountryConverter instance used for the conversion.  Pass a custom one
         if additional data is needed in addition to the custom country
-        converter file.  If None (default), the bare CountryConverter is used
+        converter file.  If None (default), the bare CountryConverter
+        (see shared_converter) is used
 
     as_dataframe: boolean or st, optional
         If False, output as OrderedDict.  If True or str, output as pandas
         dataframe.  If str and 'full', output as a full matrix, otherwise only
         two columns with the original and aggregated names are returned.
+        'csr' and 'index' return a Concordance (see below) with a
+        scipy.sparse matrix or an index vector instead of a dataframe.
 
     original_countries_class: str, optional
         Valid column name of CountryConverter.data.  This parameter is needed
@@ -85,11 +208,22 @@ def agg_conc(
 
     Returns
     -------
-    OrderedDict or DataFrame (defined by 'as_dataframe')
+    OrderedDict, DataFrame or Concordance (defined by 'as_dataframe')
+        The namedtuple Concordance has the fields
+            original: list of the original countries
+            aggregated: list of the aggregates (sorted, as the columns of the
+                'full' matrix)
+            concordance: for 'csr', a scipy.sparse CSR matrix (original x
+                aggregated) with ones at the aggregates of the countries; for
+                'index', an int array giving the position of the aggregate of
+                each original country in 'aggregated'.
+        Both can be used with apply_concordance.
 
     """
+    import pandas as pd
+
     if coco is None:
-        coco = CountryConverter()
+        coco = shared_converter()
 
     if type(original_countries) is str:
         original_countries_class = original_countries_class or original_countries
@@ -101,32 +235,36 @@ def agg_conc(
         aggregates = [aggregates]
 
     correspond = OrderedDict.fromkeys(original_countries)
+    # countries without aggregate so far, only these are looked up in the
+    # following aggregation information
+    pending = list(correspond)
     for agg in aggregates:
         if type(agg) is str:
             agg = coco.get_correspondence_dict(original_countries_class, agg)
-        for country in original_countries:
-            # if country=='US':
-            # import ipdb; ipdb.set_trace()
-            if correspond.get(country) is None:
-                try:
-                    entry = agg[country]
-                except KeyError:
-                    entry = None
-
-                if type(entry) is list:
-                    if 1 < len(entry):
-                        if merge_multiple_string:
-                            entry = merge_multiple_string.join([str(e) for e in entry])
-                        else:
-                            entry = None
-                        if log_merge_multiple_strings:
-                            log_merge_multiple_strings(country)
+        still_pending = []
+        for country in pending:
+            try:
+                entry = agg[country]
+            except KeyError:
+                entry = None
+
+            if type(entry) is list:
+                if 1 < len(entry):
+                    if merge_multiple_string:
+                        entry = merge_multiple_string.join([str(e) for e in entry])
                     else:
-                        entry = entry[0]
-                        if pd.isna(entry):
-                            entry = None
-
-                correspond[country] = entry
+                        entry = None
+                    if log_merge_multiple_strings:
+                        log_merge_multiple_strings(country)
+                else:
+                    entry = entry[0]
+                    if pd.isna(entry):
+                        entry = None
+
+            correspond[country] = entry
+            if entry is None:
+                still_pending.append(country)
+        pending = still_pending
 
     for country in original_countries:
         if correspond.get(country) is None:
@@ -139,6 +277,9 @@ def agg_conc(
             if log_missing_countries:
                 log_missing_countries(country)
 
+    if as_dataframe in ("index", "csr"):
+        return _concordance(correspond, as_dataframe)
+
     if as_dataframe:
         correspond = pd.DataFrame.from_dict(correspond, orient="index").reset_index()
         correspond.columns = ["original", "aggregated"]
@@ -151,6 +292,198 @@ def agg_conc(
     return correspond
 
 
+def _factorize_with_na(values, sort=False):
+    """Encode values as pandas.factorize, with missing values as a category of their own.
+
+    Same as pandas.factorize(values, sort, use_na_sentinel=False), which is
+    not available before pandas 1.5: missing values are encoded at their
+    first occurrence, or last if sorted.
+
+    Returns
+    -------
+    tuple (codes, uniques) as pandas.factorize
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(values, sort=sort)
+    missing = codes < 0
+    if missing.any():
+        na_code = len(uniques) if sort else int(codes[: missing.argmax()].max(initial=-1)) + 1
+        codes[codes >= na_code] += 1
+        codes[missing] = na_code
+        uniques = np.insert(np.asarray(uniques, dtype=object), na_code, np.nan)
+    return codes, uniques
+
+
+def _concordance(correspond, kind):
+    """Build the Concordance of agg_conc for as_dataframe 'index' or 'csr'."""
+    import numpy as np
+
+    original = list(correspond)
+    index, aggregated = _factorize_with_na(np.array(list(correspond.values()), dtype=object), sort=True)
+    if kind == "csr":
+        from scipy import sparse
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(index)), index, np.arange(len(index) + 1)),
+            shape=(len(original), len(aggregated)),
+        )
+        return Concordance(original, list(aggregated), matrix)
+    return Concordance(original, list(aggregated), index)
+
+
+def apply_concordance(data, concordance, axis=0):
+    """Aggregate numeric data with a concordance of agg_conc.
+
+    Parameters
+    ----------
+    data: numpy array or pandas DataFrame
+        Numeric data with the original countries along 'axis'. For arrays,
+        the entries along 'axis' must be in the order of
+        concordance.original, DataFrames are aligned by their labels.
+
+    concordance: Concordance
+        Result of agg_conc with as_dataframe 'csr' or 'index'.
+
+    axis: 0, 1 or 'both', optional
+        Axis to aggregate, 'both' aggregates rows and columns (e.g. for
+        square multi-regional matrices). Default: 0
+
+    Returns
+    -------
+    numpy array or DataFrame (same type as data)
+        Sums over the original countries of each aggregate, with the dtype
+        of the sum of data (as np.sum, e.g. int64 for integers and booleans)
+        for both kinds of concordances. A sparse concordance is applied by a
+        sparse matrix product, an index vector by np.add.reduceat.
+
+    """
+    if axis == "both":
+        return apply_concordance(apply_concordance(data, concordance, axis=0), concordance, axis=1)
+    if axis not in (0, 1):
+        raise ValueError(f"axis must be 0, 1 or 'both', not {axis}")
+
+    import numpy as np
+
+    if _is_dataframe(data):
+        import pandas as pd
+
+        labels = data.axes[axis]
+        positions = pd.Index(concordance.original).get_indexer(labels)
+        if (positions < 0).any():
+            missing = list(labels[positions < 0])
+            raise ValueError(f"Entries {missing} are not in the original countries of the concordance")
+        values = _aggregate(data.to_numpy(), concordance.concordance[positions], len(concordance.aggregated), axis)
+        if axis == 0:
+            return pd.DataFrame(values, index=concordance.aggregated, columns=data.columns)
+        return pd.DataFrame(values, index=data.index, columns=concordance.aggregated)
+
+    data = np.asarray(data)
+    if data.shape[axis] != len(concordance.original):
+        raise ValueError(
+            f"Length {data.shape[axis]} of axis {axis} does not match the "
+            f"{len(concordance.original)} original countries of the concordance"
+        )
+    return _aggregate(data, concordance.concordance, len(concordance.aggregated), axis)
+
+
+def _aggregate(values, concordance, n_aggregated, axis):
+    """Sum the entries of values along axis (0 or 1) by the concordance."""
+    import numpy as np
+
+    # same result dtype for both kinds of concordances, that of np.sum
+    values = values.astype(np.zeros(0, dtype=values.dtype).sum().dtype, copy=False)
+    if getattr(concordance, "ndim", 1) == 2:
+        # sparse matrix (original x aggregated)
+        if values.dtype.kind in "iufc":
+            concordance = concordance.astype(values.dtype)
+        if axis == 0:
+            return np.asarray(concordance.T @ values)
+        return np.asarray((concordance.T @ values.T).T)
+
+    order = np.argsort(concordance, kind="stable")
+    codes = concordance[order]
+    values = np.take(values, order, axis=axis)
+    result_shape = list(values.shape)
+    result_shape[axis] = n_aggregated
+    result = np.zeros(result_shape, dtype=values.dtype)
+    if len(codes):
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        sums = np.add.reduceat(values, starts, axis=axis)
+        if axis == 0:
+            result[codes[starts]] = sums
+        else:
+            result[:, codes[starts]] = sums
+    return result
+
+
+def shared_converter(
+    country_data=COUNTRY_DATA_FILE,
+    additional_data=None,
+    only_UNmember=False,
+    include_obsolete=False,
+):
+    """Get a CountryConverter instance shared within the process.
+
+    The instance is build at the first call for a given combination of
+    parameters and returned for all subsequent calls with the same
+    parameters. This is used by the module level functions (convert, match,
+    agg_conc), which thus do not reload the country data at every call.
+
+    Instances based on Pandas DataFrames (country_data or additional_data)
+    are not shared, a new instance is returned for every call in this case.
+
+    Note
+    ----
+    Changes to the data files are not picked up by shared instances, call
+    clear_shared_converters() to discard them.
+    Changing the shared instance (e.g. its data attribute) affects all
+    subsequent calls of the module level functions.
+
+    Parameters
+    ----------
+    country_data, additional_data, only_UNmember, include_obsolete:
+        See CountryConverter
+
+    Returns
+    -------
+    CountryConverter
+
+    """
+    key = _shared_converter_key(country_data, additional_data, only_UNmember, include_obsolete)
+    if key is None:
+        return CountryConverter(country_data, additional_data, only_UNmember, include_obsolete)
+
+    coco = _shared_converters.get(key)
+    if coco is None:
+        with _shared_converters_lock:
+            coco = _shared_converters.get(key)
+            if coco is None:
+                coco = CountryConverter(country_data, additional_data, only_UNmember, include_obsolete)
+                _shared_converters[key] = coco
+    return coco
+
+
+def clear_shared_converters():
+    """Discard all CountryConverter instances shared by the module level functions."""
+    with _shared_converters_lock:
+        _shared_converters.clear()
+
+
+def _shared_converter_key(country_data, additional_data, only_UNmember, include_obsolete):
+    """Build the key for a shared CountryConverter, None if it can not be shared."""
+    if additional_data is None:
+        additional_data = []
+    if not isinstance(additional_data, list):
+        additional_data = [additional_data]
+    try:
+        data_files = tuple(os.path.abspath(os.fspath(data)) for data in [country_data, *additional_data])
+    except TypeError:
+        return None
+    return (data_files, bool(only_UNmember), bool(include_obsolete))
+
+
 def match(
     list_a,
     list_b,
@@ -158,6 +491,8 @@ def match(
     enforce_sublist=False,
     country_data=COUNTRY_DATA_FILE,
     additional_data=None,
+    coco=None,
+    as_dataframe=False,
 ):
     """Match the country names given in two lists into a dictionary.
 
@@ -189,9 +524,20 @@ def match(
          country_data file. (utf-8 encoded tab separated data, same
          column headers in all files)
 
+    coco : instance of CountryConverter, optional
+        CountryConverter instance used for the matching. If given,
+        country_data and additional_data are ignored. If None (default), the
+        instance shared for country_data and additional_data is used (see
+        shared_converter).
+
+    as_dataframe : boolean, optional
+        If True, return a pandas DataFrame with the columns 'name_a' and
+        'name_b' and one row per correspondence instead of the dict.
+        Default: False
+
     Returns
     -------
-    dict:
+    dict or DataFrame:
         A dictionary with a key for every entry in list_a. The value
         correspond to the matching entry in list_b if found. If there is
         a 1:1 correspondence, the value is a str (if enforce_sublist is False),
@@ -207,20 +553,27 @@ def match(
     if isinstance(list_b, tuple):
         list_b = list(list_b)
 
-    coco = CountryConverter(country_data, additional_data)
+    if coco is None:
+        coco = shared_converter(country_data, additional_data)
+
+    # classify list_b once: regex row -> entries of list_b (in order)
+    rows_b = {}
+    entries_b = {}
+    for name_b in list_b:
+        if name_b not in rows_b:
+            rows_b[name_b] = coco._regex_rows(name_b)
+        for row in rows_b[name_b]:
+            entries_b.setdefault(row, []).append(name_b)
 
     name_dict_a = {}
-    match_dict_a = {}
 
     for name_a in list_a:
+        if name_a in name_dict_a:
+            continue
         name_dict_a[name_a] = []
-        match_dict_a[name_a] = []
-
-        for regex in coco.regexes:
-            if regex.search(name_a):
-                match_dict_a[name_a].append(regex)
+        rows_a = coco._regex_rows(name_a)
 
-        if len(match_dict_a[name_a]) == 0:
+        if len(rows_a) == 0:
             log.warning(f"Could not identify {name_a} in list_a")
             _not_found_entry = name_a if not not_found else not_found
             name_dict_a[name_a].append(_not_found_entry)
@@ -228,15 +581,12 @@ def match(
                 name_dict_a[name_a] = name_dict_a[name_a][0]
             continue
 
-        if len(match_dict_a[name_a]) > 1:
+        if len(rows_a) > 1:
             log.warning(f"Multiple matches for name {name_a} in list_a")
 
-        for match_case in match_dict_a[name_a]:
-            b_matches = 0
-            for name_b in list_b:
-                if match_case.search(name_b):
-                    b_matches += 1
-                    name_dict_a[name_a].append(name_b)
+        for row in rows_a:
+            name_dict_a[name_a].extend(entries_b.get(row, []))
+        b_matches = len(name_dict_a[name_a])
 
         if b_matches == 0:
             log.warning(f"Could not find any correspondence for {name_a} in list_b")
@@ -249,16 +599,26 @@ def match(
         if not enforce_sublist and (len(name_dict_a[name_a]) == 1):
             name_dict_a[name_a] = name_dict_a[name_a][0]
 
+    if as_dataframe:
+        import pandas as pd
+
+        pairs = [
+            (name_a, name_b)
+            for name_a, names_b in name_dict_a.items()
+            for name_b in (names_b if isinstance(names_b, list) else [names_b])
+        ]
+        return pd.DataFrame(pairs, columns=["name_a", "name_b"])
+
     return name_dict_a
 
 
 def convert(*args, **kargs):
     """Call CountryConverter.convert() - a simple wrapper.
 
-    Uses the same parameters. This function has the same performance as
-    CountryConverter.convert for one call; for multiple calls it is better to
-    instantiate a common CountryConverter (this avoid loading the source data
-    file multiple times).
+    Uses the same parameters. The CountryConverter instance used for the
+    conversion is shared between calls with the same data parameters (see
+    shared_converter), thus the source data files are only loaded at the
+    first call.
 
     Note
     ----
@@ -313,11 +673,803 @@ def convert(*args, **kargs):
         "include_obsolete": False,
     }
     init.update({kk: kargs.get(kk) for kk in init.keys() if kk in kargs})
-    coco = CountryConverter(**init)
+    coco = shared_converter(**init)
     kargs = {kk: ii for kk, ii in kargs.items() if kk not in init.keys()}
     return coco.convert(*args, **kargs)
 
 
+def _is_file_source(data):
+    """Check if data is given as path to a data file (and not as DataFrame)."""
+    return isinstance(data, (str, os.PathLike))
+
+
+def _is_dataframe(obj):
+    """Check if obj is a pandas DataFrame (without importing pandas)."""
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, pd.DataFrame)
+
+
+def _isna(value):
+    """Check for missing values (None or nan) in the country tables."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _reporter(level, reports):
+    """Get a function logging messages and appending them to reports.
+
+    If reports is None, the messages are discarded.
+    """
+
+    def report_fun(message):
+        if reports is not None:
+            log.log(level, message)
+            reports.append((level, message))
+
+    return report_fun
+
+
+def _test_for_unique_names(df, data_name="passed dataframe", report_fun=log.error):
+    """Report duplicated entries in the columns which must be unique.
+
+    Returns
+    -------
+    boolean, True if no duplicates were found
+    """
+    unique = True
+    for name_entry in _MUST_BE_UNIQUE:
+        if df[name_entry].duplicated().any():
+            report_fun(f"Duplicated values in column {name_entry} of {data_name}")
+            unique = False
+    return unique
+
+
+def _test_table_for_unique_names(table, data_name, report_fun=log.error):
+    """Report duplicated entries in a country table (see _test_for_unique_names)."""
+    unique = True
+    for name_entry in _MUST_BE_UNIQUE:
+        values = [None if _isna(value) else value for value in table[name_entry]]
+        if len(set(values)) < len(values):
+            report_fun(f"Duplicated values in column {name_entry} of {data_name}")
+            unique = False
+    return unique
+
+
+def _validate_file(file_hash, check, strict=False):
+    """Run check() for a data file unless its hash was validated before.
+
+    check returns True if no duplicates were found, the hash is then added
+    to the validated hashes. With strict, check() always runs.
+
+    Returns
+    -------
+    boolean, True if the file has no duplicates
+    """
+    if not strict and file_hash in _VALIDATED_HASHES:
+        return True
+    unique = check()
+    if unique:
+        _VALIDATED_HASHES.add(file_hash)
+    return unique
+
+
+def _data_loader(data, report_fun=log.error, strict=False):
+    """Read country data from a file or DataFrame and check it.
+
+    Returns
+    -------
+    tuple (DataFrame, boolean if no duplicates were found), files validated
+    before are not checked again unless strict (see _validate_file)
+    """
+    import pandas as pd
+    from pandas._libs.parsers import STR_NA_VALUES
+
+    if isinstance(data, pd.DataFrame):
+        return data, _test_for_unique_names(data, report_fun=report_fun)
+
+    ret = pd.read_csv(
+        data,
+        sep="\t",
+        encoding="utf-8",
+        converters=dict.fromkeys(_MUST_BE_STRING, str),
+        na_values=STR_NA_VALUES - {"NA"},
+    )
+    ret = ret.astype({col: "Int64" for col in ret.columns if col in _MUST_BE_INT})
+    file_hash = _file_hash(data) if _is_file_source(data) else None
+    if file_hash is None:
+        return ret, _test_for_unique_names(ret, data, report_fun=report_fun)
+    return ret, _validate_file(file_hash, lambda: _test_for_unique_names(ret, data, report_fun=report_fun), strict)
+
+
+def _load_country_data(country_data, additional_data, only_UNmember, include_obsolete, reports, strict=False):
+    """Load, merge and check the data for a CountryConverter.
+
+    See CountryConverter for the parameters. Issues found in the data are
+    logged and appended as (level, message) to the list 'reports' (discarded
+    if 'reports' is None).
+
+    Returns
+    -------
+    DataFrame with a RangeIndex
+    """
+    import pandas as pd
+
+    basic_df, unique = _data_loader(country_data, _reporter(logging.ERROR, reports), strict)
+
+    if only_UNmember:
+        basic_df = basic_df.dropna(subset=["UNmember"])
+
+    if not include_obsolete:
+        basic_df = basic_df[basic_df.obsolete.isna()]
+
+    if additional_data is None:
+        additional_data = []
+    if not isinstance(additional_data, list):
+        additional_data = [additional_data]
+
+    add_data = [_data_loader(df, _reporter(logging.ERROR, reports), strict)[0] for df in additional_data]
+
+    data = pd.concat([basic_df, *add_data], ignore_index=True, axis=0, sort=True)
+
+    # without additional data, a table without duplicates needs no merge
+    if strict or add_data or not unique:
+        _test_for_unique_names(
+            data, data_name="merged data - keep last one", report_fun=_reporter(logging.WARNING, reports)
+        )
+
+        for name_entry in _MUST_BE_UNIQUE:
+            data = data.drop_duplicates(subset=[name_entry], keep="last")
+
+    return data.reset_index(drop=True)
+
+
+def _parse_values(raw_values):
+    """Parse the raw strings of a column like pandas.read_csv.
+
+    Missing values become nan. If all other values are numbers, they are
+    converted to int (if integral) or float, otherwise the strings are kept.
+    """
+    values = [math.nan if raw in _NA_VALUES else raw for raw in raw_values]
+    try:
+        numbers = [value if _isna(value) else float(value) for value in values]
+    except ValueError:
+        return values
+    return [number if _isna(number) or not number.is_integer() else int(number) for number in numbers]
+
+
+def _read_country_table(data_file, report_fun=log.error, strict=False):
+    """Read a country data file into a table, without pandas.
+
+    This is the pure python counterpart of _data_loader for data files.
+
+    Returns
+    -------
+    tuple (dict: column name -> list of values (missing values as nan),
+    boolean if no duplicates were found), files validated before are not
+    checked again unless strict (see _validate_file)
+    """
+    with open(data_file, "rb") as df:
+        content = df.read()
+    rows = [row for row in csv.reader(io.StringIO(content.decode("utf-8-sig"), newline=""), delimiter="\t") if row]
+    header = rows.pop(0)
+
+    table = {}
+    for pos, col in enumerate(header):
+        raw_values = [row[pos] if pos < len(row) else "" for row in rows]
+        # string columns keep empty entries, as read by pandas with str converters
+        table[col] = raw_values if col in _MUST_BE_STRING else _parse_values(raw_values)
+    file_hash = hashlib.sha256(content).hexdigest()
+    return table, _validate_file(file_hash, lambda: _test_table_for_unique_names(table, data_file, report_fun), strict)
+
+
+def _select_rows(table, rows):
+    """Get a table with the given rows (positions) of table."""
+    return {col: [values[row] for row in rows] for col, values in table.items()}
+
+
+def _load_country_table(country_data, additional_data, only_UNmember, include_obsolete, reports, strict=False):
+    """Load, merge and check data files for a CountryConverter, without pandas.
+
+    Same as _load_country_data, but only for data files and returning a
+    table (see _read_country_table). The columns and rows of the table
+    correspond to the DataFrame returned by _load_country_data.
+    """
+    basic_table, unique = _read_country_table(country_data, _reporter(logging.ERROR, reports), strict)
+    nrows = len(basic_table["name_short"])
+
+    if only_UNmember:
+        basic_table = _select_rows(
+            basic_table, [row for row in range(nrows) if not _isna(basic_table["UNmember"][row])]
+        )
+        nrows = len(basic_table["name_short"])
+
+    if not include_obsolete:
+        basic_table = _select_rows(basic_table, [row for row in range(nrows) if _isna(basic_table["obsolete"][row])])
+
+    if additional_data is None:
+        additional_data = []
+    if not isinstance(additional_data, list):
+        additional_data = [additional_data]
+
+    tables = [
+        basic_table,
+        *(
+            _read_country_table(data_file, _reporter(logging.ERROR, reports), strict)[0]
+            for data_file in additional_data
+        ),
+    ]
+    # without additional data, a table without duplicates needs no merge (only the sorted columns)
+    if unique and not (strict or additional_data):
+        return {col: basic_table[col] for col in sorted(basic_table)}
+
+    # same as pandas.concat with sort=True: sorted union of all columns
+    table = {}
+    for col in sorted(set().union(*tables)):
+        table[col] = []
+        for tab in tables:
+            table[col].extend(tab.get(col) or [math.nan] * len(next(iter(tab.values()), [])))
+
+    _test_table_for_unique_names(
+        table, data_name="merged data - keep last one", report_fun=_reporter(logging.WARNING, reports)
+    )
+
+    rows = range(len(table["name_short"]))
+    for name_entry in _MUST_BE_UNIQUE:
+        last_rows = {}
+        for row in rows:
+            value = table[name_entry][row]
+            last_rows[None if _isna(value) else value] = row
+        rows = sorted(last_rows.values())
+
+    return _select_rows(table, rows)
+
+
+def _frame_to_table(df):
+    """Convert a DataFrame with country data to a table (see _read_country_table)."""
+    return {
+        col: [math.nan if isna else value for value, isna in zip(df[col].tolist(), df[col].isna().tolist())]
+        for col in df.columns
+    }
+
+
+def _user_cache_dir():
+    """Return the default directory for the country data snapshots."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(base, "country_converter")
+
+
+def _snapshot_file(snapshot_dir, country_data, additional_data, only_UNmember, include_obsolete):
+    """Get the snapshot file for the given data, None if not applicable.
+
+    The file name is a hash of the content of all data files, the data
+    parameters and the version of coco.
+    """
+    if snapshot_dir is None:
+        snapshot_dir = os.environ.get("COCO_SNAPSHOT_DIR")
+    if not snapshot_dir:
+        return None
+    if snapshot_dir is True:
+        snapshot_dir = _user_cache_dir()
+
+    if additional_data is None:
+        additional_data = []
+    if not isinstance(additional_data, list):
+        additional_data = [additional_data]
+
+    content_hash = hashlib.sha256(
+        repr((__version__, _SNAPSHOT_FORMAT, bool(only_UNmember), bool(include_obsolete))).encode()
+    )
+    for data in [country_data, *additional_data]:
+        if not _is_file_source(data):
+            return None
+        try:
+            with open(data, "rb") as data_file:
+                content_hash.update(hashlib.sha256(data_file.read()).digest())
+        except (OSError, TypeError):
+            return None
+    return os.path.join(snapshot_dir, f"coco_{content_hash.hexdigest()[:32]}.pickle")
+
+
+def _file_hash(file_name):
+    """Hash (sha256) of the content of a file."""
+    with open(file_name, "rb") as hashed_file:
+        return hashlib.sha256(hashed_file.read()).hexdigest()
+
+
+def _bundled_state(country_data, additional_data, only_UNmember, include_obsolete):
+    """Get the prebuilt state of the bundled country data (see country_converter._bundle).
+
+    Returns
+    -------
+    dict (see CountryConverter._index_state) or None if the parameters are
+    not the defaults or the generated module does not match the data file
+    """
+    if only_UNmember or include_obsolete or not (additional_data is None or isinstance(additional_data, list)):
+        return None
+    if additional_data:
+        return None
+    if not isinstance(country_data, (str, os.PathLike)):
+        return None
+    if os.path.abspath(country_data) != COUNTRY_DATA_FILE:
+        return None
+    try:
+        from country_converter import _bundled_data
+    except ImportError:
+        return None
+    try:
+        if _bundled_data.FORMAT != _SNAPSHOT_FORMAT or _bundled_data.DATA_HASH != _file_hash(COUNTRY_DATA_FILE):
+            log.debug("The prebuilt bundled data is outdated, run 'python -m country_converter._bundle'")
+            return None
+    except OSError:
+        return None
+    if not _bundled_data.STATE["reports"]:
+        # validated when the module was generated
+        _VALIDATED_HASHES.add(_bundled_data.DATA_HASH)
+    return _bundled_data.STATE
+
+
+def _load_snapshot(snapshot_file):
+    """Load a snapshot written by _write_snapshot, None if not possible."""
+    try:
+        with open(snapshot_file, "rb") as sf:
+            return pickle.load(sf)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError) as err:
+        log.debug(f"Could not read country data snapshot {snapshot_file}: {err}")
+        return None
+
+
+def _write_snapshot(snapshot_file, state):
+    """Write state to snapshot_file (atomic, failures are only logged)."""
+    try:
+        os.makedirs(os.path.dirname(snapshot_file), exist_ok=True)
+        tmp_file = f"{snapshot_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, "wb") as sf:
+            pickle.dump(state, sf, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, snapshot_file)
+    except (OSError, pickle.PicklingError) as err:
+        log.debug(f"Could not write country data snapshot {snapshot_file}: {err}")
+
+
+def _table_fingerprint(columns):
+    """Hash of a country table (content and order of all rows and columns)."""
+    return hashlib.sha256(repr((__version__, list(columns.items()))).encode()).hexdigest()
+
+
+class _ResolutionStore:
+    """Persistent store of regex resolutions (name -> matching rows) in a SQLite file.
+
+    The entries are stored per fingerprint of the country table (see
+    _table_fingerprint), thus any change of the data starts a new set of
+    entries. The database is used in write ahead log mode (if supported by
+    the file system) and each new entry is committed at once, thus the write
+    lock is only held for single inserts and the entries are visible to
+    other processes immediately. Failures of the database are logged (lock
+    timeouts as warning), the store then acts as empty.
+    """
+
+    _TIMEOUT = 10
+
+    def __init__(self, store_file, fingerprint):
+        import sqlite3
+
+        self.store_file = store_file
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(store_file)), exist_ok=True)
+        self._connection = sqlite3.connect(store_file, timeout=self._TIMEOUT, check_same_thread=False)
+        # readers do not block the writer, commits need no sync (durable at checkpoints)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS resolutions "
+            "(fingerprint TEXT NOT NULL, name TEXT NOT NULL, rows TEXT NOT NULL, PRIMARY KEY (fingerprint, name))"
+        )
+        self._connection.commit()
+        self._finalizer = weakref.finalize(self, _ResolutionStore._close_connection, self._connection, self._lock)
+
+    @staticmethod
+    def _close_connection(connection, lock):
+        import sqlite3
+
+        with lock:
+            try:
+                connection.commit()
+                connection.close()
+            except sqlite3.Error as err:
+                log.debug(f"Could not close the resolution store: {err}")
+
+    def get(self, name):
+        """Get the stored rows for name, None if not stored."""
+        import sqlite3
+
+        with self._lock:
+            try:
+                entry = self._connection.execute(
+                    "SELECT rows FROM resolutions WHERE fingerprint = ? AND name = ?", (self.fingerprint, name)
+                ).fetchone()
+            except sqlite3.Error as err:
+                self._report(f"Could not read from the resolution store {self.store_file}: {err}", err)
+                return None
+        if entry is None:
+            return None
+        return [int(row) for row in entry[0].split(",") if row]
+
+    def put(self, name, rows):
+        """Store the rows for name."""
+        import sqlite3
+
+        with self._lock:
+            try:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?)",
+                        (self.fingerprint, name, ",".join(str(row) for row in rows)),
+                    )
+            except sqlite3.Error as err:
+                self._report(f"Could not write to the resolution store {self.store_file}: {err}", err)
+
+    @staticmethod
+    def _report(message, err):
+        """Log a database failure, lock timeouts (another process writing) as warning."""
+        import sqlite3
+
+        locked = isinstance(err, sqlite3.OperationalError) and "locked" in str(err)
+        log.log(logging.WARNING if locked else logging.DEBUG, message)
+
+    def close(self):
+        """Close the database."""
+        self._finalizer()
+
+
+def _open_resolution_store(resolution_store, columns):
+    """Open the resolution store for a CountryConverter, None if not applicable.
+
+    See the parameter resolution_store of CountryConverter.
+    """
+    import sqlite3
+
+    if resolution_store is None:
+        resolution_store = os.environ.get("COCO_RESOLUTION_STORE")
+    if not resolution_store:
+        return None
+    if resolution_store is True:
+        resolution_store = os.path.join(_user_cache_dir(), "resolutions.sqlite")
+    try:
+        return _ResolutionStore(os.fspath(resolution_store), _table_fingerprint(columns))
+    except (OSError, sqlite3.Error) as err:
+        log.debug(f"Could not open the resolution store {resolution_store}: {err}")
+        return None
+
+
+def _required_literals(items):
+    """Get literals of which at least one must occur in any match of a regex.
+
+    Parameters
+    ----------
+    items : list
+        Parsed regular expression (as returned by sre_parse.parse)
+
+    Returns
+    -------
+    set of str (lower case, at least three ASCII characters) or None if no
+    such literals can be derived from the expression.
+    """
+    candidates = []
+    run = []
+    for op, av in [*items, (None, None)]:
+        op_name = getattr(op, "name", None)
+        if op_name == "LITERAL" and av < 128:
+            run.append(chr(av).lower())
+            continue
+        if len(run) >= 3:
+            candidates.append({"".join(run)})
+        run = []
+
+        required = None
+        if op_name == "SUBPATTERN":
+            required = _required_literals(av[-1])
+        elif op_name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT") and av[0] >= 1:
+            required = _required_literals(av[2])
+        elif op_name == "BRANCH":
+            branches = [_required_literals(branch) for branch in av[1]]
+            if all(branches):
+                required = set().union(*branches)
+        elif op_name == "ASSERT":
+            required = _required_literals(av[1])
+        if required:
+            candidates.append(required)
+
+    if not candidates:
+        return None
+    return min(candidates, key=lambda literals: (len(literals), -min(len(lit) for lit in literals)))
+
+
+class _LazyPatterns:
+    """Sequence of regular expressions (ignoring case), each compiled at its first use.
+
+    The lookups restored from a snapshot or the prebuilt bundled data only
+    compile the expressions needed for the names converted.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = patterns
+        self._compiled = [None] * len(patterns)
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            return [self[row] for row in range(*pos.indices(len(self)))]
+        regex = self._compiled[pos]
+        if regex is None:
+            regex = self._compiled[pos] = re.compile(self.patterns[pos], re.IGNORECASE)
+        return regex
+
+    def __iter__(self):
+        return (self[row] for row in range(len(self)))
+
+
+class _RegexMatcher:
+    """Find all regular expressions matching a name in one scan of the name.
+
+    Each regex is indexed by a trigram of a literal which must be part of any
+    string it matches. The trigrams of a name then give the candidate
+    expressions, which are verified by a regular search. Expressions without
+    such a literal are always verified.
+    """
+
+    def __init__(self, regexes, trigram_index=None, unindexed=None):
+        self.regexes = regexes
+        if trigram_index is not None:
+            self.trigram_index = trigram_index
+            self.unindexed = unindexed
+            return
+
+        required = []
+        for regex in regexes:
+            try:
+                required.append(_required_literals(sre_parse.parse(regex.pattern, regex.flags)))
+            except (re.error, AttributeError, IndexError, TypeError, ValueError):
+                # unknown structure of the parsed regex - always search it
+                required.append(None)
+
+        trigram_count = {}
+        for literals in required:
+            for lit in literals or ():
+                for pos in range(len(lit) - 2):
+                    trigram_count[lit[pos : pos + 3]] = trigram_count.get(lit[pos : pos + 3], 0) + 1
+
+        self.trigram_index = {}
+        self.unindexed = set()
+        for row, literals in enumerate(required):
+            if literals is None:
+                self.unindexed.add(row)
+                continue
+            for lit in literals:
+                rarest = min((lit[pos : pos + 3] for pos in range(len(lit) - 2)), key=trigram_count.get)
+                self.trigram_index.setdefault(rarest, set()).add(row)
+
+    def match(self, name, stats=None):
+        """Return the positions of all regexes matching name (ascending)."""
+        norm_name = name.translate(_ASCII_CASE_FIXES).lower()
+        candidates = set(self.unindexed)
+        for pos in range(len(norm_name) - 2):
+            rows = self.trigram_index.get(norm_name[pos : pos + 3])
+            if rows:
+                candidates.update(rows)
+        if stats is not None:
+            stats.count("regex_evaluations", len(candidates))
+        return [row for row in sorted(candidates) if self.regexes[row].search(name)]
+
+
+# Types of the entries of a _SharedColumn
+_SHARED_NA, _SHARED_INT, _SHARED_FLOAT, _SHARED_STR, _SHARED_OBJECT = range(5)
+
+
+class _SharedColumn:
+    """Sequence of the entries of a column, read in place from the buffers of a shared file.
+
+    Each entry has a type code (see _SHARED_NA etc.) and an 8 byte slot with
+    the integer, the float or the offset of the utf-8 encoded string (or
+    pickled object) in the text buffer. Entries are decoded at each access,
+    no list of them is kept. Pickling gives a plain list.
+    """
+
+    def __init__(self, types, slots, lengths, text):
+        self._types = types
+        self._ints = slots.cast("q")
+        self._floats = slots.cast("d")
+        self._lengths = lengths.cast("q")
+        self._text = text
+
+    def __len__(self):
+        return len(self._types)
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            return [self[row] for row in range(*pos.indices(len(self)))]
+        entry_type = self._types[pos]
+        if entry_type == _SHARED_STR:
+            start = self._ints[pos]
+            return str(self._text[start : start + self._lengths[pos]], "utf-8")
+        if entry_type == _SHARED_INT:
+            return self._ints[pos]
+        if entry_type == _SHARED_FLOAT:
+            return self._floats[pos]
+        if entry_type == _SHARED_NA:
+            return math.nan
+        start = self._ints[pos]
+        return pickle.loads(self._text[start : start + self._lengths[pos]])
+
+    def __iter__(self):
+        return (self[row] for row in range(len(self)))
+
+    def __repr__(self):
+        # same as the list of the entries, the fingerprint of the table depends on it
+        return repr(list(self))
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class _SharedIndex:
+    """Mapping of strings to lists of rows, read in place from the buffers of a shared file.
+
+    The keys are sorted (found by bisection), the rows of the key at position
+    i are rows[starts[i]:starts[i + 1]]. Pickling gives a plain dict.
+    """
+
+    def __init__(self, keys, starts, rows):
+        self._keys = keys
+        self._starts = starts.cast("q")
+        self._rows = rows.cast("q")
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _rows_at(self, pos):
+        return self._rows[self._starts[pos] : self._starts[pos + 1]].tolist()
+
+    def get(self, key, default=None):
+        pos = bisect.bisect_left(self._keys, key)
+        if pos < len(self._keys) and self._keys[pos] == key:
+            return self._rows_at(pos)
+        return default
+
+    def __getitem__(self, key):
+        rows = self.get(key)
+        if rows is None:
+            raise KeyError(key)
+        return rows
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def keys(self):
+        return list(self._keys)
+
+    def items(self):
+        return ((key, self._rows_at(pos)) for pos, key in enumerate(self._keys))
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+
+class _SharedWriter:
+    """Collect the buffers of a shared file (see CountryConverter.share).
+
+    column() and index() add the buffers of a _SharedColumn and a
+    _SharedIndex and return their (offset, length) pairs for the header,
+    read back by _shared_column and _shared_index.
+    """
+
+    def __init__(self):
+        self.buffers = bytearray()
+
+    def add(self, data):
+        """Add a buffer (aligned to 8 bytes) and get its (offset, length)."""
+        self.buffers.extend(bytes(-len(self.buffers) % 8))
+        offset = len(self.buffers)
+        self.buffers.extend(data)
+        return offset, len(data)
+
+    def column(self, values):
+        """Add the buffers of a _SharedColumn with the values."""
+        types = bytearray()
+        slots = array.array("q")
+        lengths = array.array("q")
+        text = bytearray()
+        for value in values:
+            if type(value) is float and math.isnan(value):
+                entry_type, slot, data = _SHARED_NA, 0, b""
+            elif type(value) is float:
+                entry_type, slot, data = _SHARED_FLOAT, struct.unpack("=q", struct.pack("=d", value))[0], b""
+            elif type(value) is int and -(2**63) <= value < 2**63:
+                entry_type, slot, data = _SHARED_INT, value, b""
+            elif type(value) is str:
+                entry_type, slot, data = _SHARED_STR, len(text), value.encode("utf-8")
+            else:
+                entry_type, slot, data = _SHARED_OBJECT, len(text), pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            types.append(entry_type)
+            slots.append(slot)
+            lengths.append(len(data))
+            text.extend(data)
+        return self.add(types), self.add(slots.tobytes()), self.add(lengths.tobytes()), self.add(text)
+
+    def index(self, mapping):
+        """Add the buffers of a _SharedIndex with the mapping (str -> rows)."""
+        keys = sorted(mapping)
+        starts = array.array("q", [0])
+        rows = array.array("q")
+        for key in keys:
+            rows.extend(mapping[key])
+            starts.append(len(rows))
+        return self.column(keys), self.add(starts.tobytes()), self.add(rows.tobytes())
+
+
+def _shared_column(buffers, spec):
+    """Get the _SharedColumn of the buffers given by _SharedWriter.column."""
+    return _SharedColumn(*(buffers[offset : offset + length] for offset, length in spec))
+
+
+def _shared_index(buffers, spec):
+    """Get the _SharedIndex of the buffers given by _SharedWriter.index."""
+    keys, starts, rows = spec
+    return _SharedIndex(
+        _shared_column(buffers, keys), *(buffers[offset : offset + length] for offset, length in (starts, rows))
+    )
+
+
+class _Stats:
+    """Counters and latency histograms of the conversions (see CountryConverter.stats)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self.counters = {}
+            self.stages = {}
+
+    def count(self, counter, value=1):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            stage_stats = self.stages.get(stage)
+            if stage_stats is None:
+                stage_stats = self.stages[stage] = {"count": 0, "total": 0.0, "buckets": [0] * len(_STATS_BUCKETS)}
+            stage_stats["count"] += 1
+            stage_stats["total"] += seconds
+            stage_stats["buckets"][bisect.bisect_left(_STATS_BUCKETS, seconds)] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "stages": {
+                    stage: {
+                        "count": stage_stats["count"],
+                        "total": stage_stats["total"],
+                        "buckets": list(zip(_STATS_BUCKETS, stage_stats["buckets"])),
+                    }
+                    for stage, stage_stats in self.stages.items()
+                },
+            }
+
+
 class CountryConverter:
     """Main class for converting countries.
 
@@ -363,6 +1515,11 @@ class CountryConverter:
         additional_data=None,
         only_UNmember=False,
         include_obsolete=False,
+        snapshot_dir=None,
+        cache_size=0,
+        resolution_store=None,
+        collect_stats=False,
+        strict_validation=False,
     ):
         """Init for the main class.
 
@@ -388,97 +1545,320 @@ class CountryConverter:
             If True, includes countries that have become obsolete. If
             False (default) only includes currently valid countries.
 
-        """
-        must_be_unique = ["name_short", "name_official", "regex"]
-
-        must_be_string = (
-            *must_be_unique,
-            "ISO2",
-            "ISO3",
-            "continent",
-            "UNregion",
-            "EXIO1",
-            "EXIO2",
-            "EXIO3",
-            "WIOD",
-        )
-
-        must_be_int = [
-            "ISOnumeric",
-            "UNcode",
-            "FAOcode",
-            "GBDcode",
-            "EURO",
-            "UN",
-            "UNmember",
-            "obsolete",
-            "GEOnumeric",
-        ]
-        accepted_na_values = STR_NA_VALUES - {"NA"}
-
-        def test_for_unique_names(df, data_name="passed dataframe", report_fun=log.error):
-            for name_entry in must_be_unique:
-                if df[name_entry].duplicated().any():
-                    report_fun(f"Duplicated values in column {name_entry} of {data_name}")
-
-        def data_loader(data):
-            if isinstance(data, pd.DataFrame):
-                ret = data
-                test_for_unique_names(data)
-            else:
-                ret = pd.read_csv(
-                    data,
-                    sep="\t",
-                    encoding="utf-8",
-                    converters=dict.fromkeys(must_be_string, str),
-                    na_values=accepted_na_values,
-                )
-                ret = ret.astype({col: "Int64" for col in ret.columns if col in must_be_int})
-                test_for_unique_names(ret, data)
-            return ret
-
-        basic_df = data_loader(country_data)
+        snapshot_dir: str, path, boolean or None, optional
+            Directory for binary snapshots of the parsed and validated country
+            data (including the lookup indexes). A snapshot is identified by
+            the content of all data files and the parameters above, it is
+            written at the first instantiation and loaded subsequently.
+            Pass True for the default user cache directory. If None
+            (default), the directory given in the environment variable
+            COCO_SNAPSHOT_DIR is used, if this is not set no snapshot is
+            used. Data passed as DataFrames is never snapshotted. The bundled
+            data with the default parameters is loaded from a prebuilt
+            module instead (see country_converter._bundle).
+
+        cache_size: int or None, optional
+            Number of conversions (name, src, to, not_found, exclude_prefix)
+            kept in a least recently used cache of the instance. Useful if the
+            same names are converted repeatedly. Warnings for a name (e.g. not
+            found) are only logged at its first conversion. Pass None for an
+            unbounded cache. Default: 0 (no caching), see also cache_info()
+            and cache_clear().
+
+        resolution_store: str, path, boolean or None, optional
+            SQLite file storing the rows found for names matched by regular
+            expressions, shared between processes and sessions. The entries
+            are bound to a fingerprint of the country data, changes to any
+            data invalidate them. Pass True for a file in the default user
+            cache directory. If None (default), the file given in the
+            environment variable COCO_RESOLUTION_STORE is used, if this is
+            not set no store is used.
+
+        collect_stats: boolean, optional
+            If True, count the conversions and measure the time spent in
+            each stage, see stats() and stats_clear(). Default: False
+
+        strict_validation: boolean, optional
+            The check for duplicated entries is skipped for data files which
+            were found without duplicates before in this process (identified
+            by their content hash, the bundled data file is validated when
+            its prebuilt module is generated). If True, all data is checked
+            and read from the data files (no prebuilt module or snapshot).
+            Data passed as DataFrames is always checked. Default: False
 
-        if only_UNmember:
-            basic_df = basic_df.dropna(subset=["UNmember"])
-
-        if not include_obsolete:
-            basic_df = basic_df[basic_df.obsolete.isna()]
+        """
+        self._init_caches(cache_size, resolution_store, collect_stats)
+        self._data = None
+
+        snapshot_file = None
+        state = None
+        if not strict_validation:
+            state = _bundled_state(country_data, additional_data, only_UNmember, include_obsolete)
+        if state is None:
+            snapshot_file = _snapshot_file(snapshot_dir, country_data, additional_data, only_UNmember, include_obsolete)
+            if snapshot_file and not strict_validation:
+                state = _load_snapshot(snapshot_file)
 
         if additional_data is None:
             additional_data = []
         if not isinstance(additional_data, list):
             additional_data = [additional_data]
+        self._data_sources = (country_data, additional_data, only_UNmember, include_obsolete)
 
-        add_data = [data_loader(df) for df in additional_data]
+        if state is None:
+            reports = []
+            load_para = (country_data, additional_data, only_UNmember, include_obsolete, reports, strict_validation)
+            if self._data_from_files():
+                columns = _load_country_table(*load_para)
+            else:
+                self._data = _load_country_data(*load_para)
+                columns = _frame_to_table(self._data)
+            self._set_columns(columns)
+            if snapshot_file:
+                _write_snapshot(snapshot_file, {**self._index_state(), "reports": reports})
+        else:
+            self._restore_indexes(state)
+            for level, message in state["reports"]:
+                log.log(level, message)
+
+    def _init_caches(self, cache_size, resolution_store, collect_stats):
+        """Set up the caches and statistics of the instance (all empty)."""
+        self._stats = _Stats() if collect_stats else None
+        self._convert_name_cached = functools.lru_cache(maxsize=cache_size)(self._convert_name)
+        self._resolution_store_para = resolution_store
+        self._resolution_store = None
+        self._correspondence_cache = OrderedDict()
+        self._correspondence_lock = threading.Lock()
+        self._shortcuts = {}
+        self._numeric_tables = {}
+        self._output_views = {}
+
+    def _data_from_files(self):
+        """Check if data can be read from the data sources (all given as files)."""
+        if self._data_sources is None:
+            return False
+        country_data, additional_data = self._data_sources[:2]
+        return all(_is_file_source(data) for data in [country_data, *additional_data])
+
+    def _index_state(self):
+        """Get the country table and the lookup indexes built from it (see _restore_indexes)."""
+        return {
+            "columns": self._columns,
+            "regex_index": (self._regex_matcher.trigram_index, self._regex_matcher.unindexed),
+            "code_index": self._code_index,
+            "iso2_index": (self._iso2_index, self._iso2_unindexed, self._iso2_searchable),
+        }
 
-        self.data = pd.concat([basic_df, *add_data], ignore_index=True, axis=0, sort=True)
+    def _restore_indexes(self, state):
+        """Set the country table and lookup indexes of _index_state, the regexes get recompiled."""
+        self._columns = state["columns"]
+        self.regexes = _LazyPatterns(self._columns["regex"])
+        self.iso2_regexes = _LazyPatterns(self._columns["ISO2"])
+        self._regex_matcher = _RegexMatcher(self.regexes, *state["regex_index"])
+        self._code_index = state["code_index"]
+        self._iso2_index, self._iso2_unindexed, self._iso2_searchable = state["iso2_index"]
+        self._resolution_store = _open_resolution_store(self._resolution_store_para, self._columns)
+
+    def __getstate__(self):
+        """Get the compact state for pickling.
+
+        The state consists of the country table and the lookup indexes.
+        The caches, statistics and the connection to the resolution store
+        are not included, they start empty after unpickling (with the same
+        settings). The data DataFrame is only included if it can not be read
+        from the data files again.
+        """
+        from_files = self._data_from_files()
+        return {
+            **self._index_state(),
+            "data": None if from_files else self.data,
+            "data_sources": self._data_sources if from_files else None,
+            "cache_size": self._convert_name_cached.cache_info().maxsize,
+            "resolution_store": self._resolution_store_para,
+            "collect_stats": self._stats is not None,
+        }
 
-        test_for_unique_names(self.data, data_name="merged data - keep last one", report_fun=log.warning)
+    def __setstate__(self, state):
+        """Restore the instance from the state of __getstate__."""
+        self._init_caches(state["cache_size"], state["resolution_store"], state["collect_stats"])
+        self._data = state["data"]
+        self._data_sources = state["data_sources"]
+        self._restore_indexes(state)
+
+    def share(self, path):
+        """Write the converter into a file to be memory mapped by other processes.
+
+        The country table, the lookup indexes and the output entries of all
+        classifications are written as flat buffers (with offset tables for
+        the strings), worker processes get a converter reading them in place
+        with CountryConverter.attach(path). They neither read the data files
+        nor build the lookup indexes again, and the pages of the file are
+        shared by all processes attaching it. Neither the data DataFrame nor
+        pandas are loaded in the workers for the conversions. On Linux, a
+        path in /dev/shm keeps the file in shared memory.
 
-        for name_entry in must_be_unique:
-            self.data = self.data.drop_duplicates(subset=[name_entry], keep="last")
+        Parameters
+        ----------
+        path: str or path
+            File to write, replaced if it exists
 
-        self.data = self.data.reset_index(drop=True)
-        self.regexes = [re.compile(entry, re.IGNORECASE) for entry in self.data.regex]
-        self.iso2_regexes = [re.compile(entry, re.IGNORECASE) for entry in self.data.ISO2]
+        Returns
+        -------
+        str: the path of the file
+        """
+        from_files = self._data_from_files()
+        writer = _SharedWriter()
+        header = {
+            "byteorder": sys.byteorder,
+            "columns": {col: writer.column(values) for col, values in self._columns.items()},
+            "output_views": {col: writer.column(self._output_view(col)) for col in self._columns},
+            "code_index": {col: writer.index(index) for col, index in self._code_index.items()},
+            "regex_index": (writer.index(self._regex_matcher.trigram_index), sorted(self._regex_matcher.unindexed)),
+            "iso2_index": (writer.index(self._iso2_index), self._iso2_unindexed, self._iso2_searchable),
+            "data": None if from_files else writer.add(pickle.dumps(self.data, protocol=pickle.HIGHEST_PROTOCOL)),
+            "data_sources": self._data_sources if from_files else None,
+            "cache_size": self._convert_name_cached.cache_info().maxsize,
+            "resolution_store": self._resolution_store_para,
+            "collect_stats": self._stats is not None,
+        }
+        header = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+        header_end = len(_SHARE_MAGIC) + 8 + len(header)
+
+        path = os.fspath(path)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as shared_file:
+            shared_file.write(_SHARE_MAGIC)
+            shared_file.write(len(header).to_bytes(8, "little"))
+            shared_file.write(header)
+            shared_file.write(bytes(-header_end % 8))
+            shared_file.write(writer.buffers)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def attach(cls, path):
+        """Get the converter written by share() (see there).
+
+        The file is memory mapped read-only and the country table, the lookup
+        indexes and the output entries are read in place from its buffers,
+        only the small header (buffer positions and settings) is unpickled.
+        The regexes are compiled at their first use in each process, the
+        data DataFrame (if not read from files) is unpickled from the file
+        at the first access of data.
 
-        # the following section adds shortcuts to all classifications to the
-        # class.
-        def fun_provider(df, datacol):
-            def fun_provided(to):
-                ret = df.loc[:, [to, datacol]].dropna()
-                if to in ["ISO2", "ISO3"]:
-                    ret.loc[:, to] = (
-                        ret.loc[:, to].str.split("|").apply(lambda x: "".join(c for c in x[0] if c.isalnum()))
-                    )
-                return ret
+        Parameters
+        ----------
+        path: str or path
+            File written by share()
 
-            return fun_provided
+        Returns
+        -------
+        CountryConverter
+        """
+        import mmap
+
+        with open(path, "rb") as shared_file:
+            magic = shared_file.read(len(_SHARE_MAGIC))
+            if magic != _SHARE_MAGIC:
+                raise TypeError(f"{path} does not contain a shared {cls.__name__}")
+            mapped = mmap.mmap(shared_file.fileno(), 0, access=mmap.ACCESS_READ)
+        content = memoryview(mapped)
+        header_start = len(_SHARE_MAGIC) + 8
+        header_end = header_start + int.from_bytes(content[len(_SHARE_MAGIC) : header_start], "little")
+        header = pickle.loads(content[header_start:header_end])
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{path} was written on a machine with {header['byteorder']} endian byte order")
+        # the buffers stay mapped as long as any column or index of the converter refers to them
+        buffers = content[header_end + -header_end % 8 :]
+
+        coco = cls.__new__(cls)
+        coco._init_caches(header["cache_size"], header["resolution_store"], header["collect_stats"])
+        coco._data = None
+        coco._data_sources = header["data_sources"]
+        if header["data"] is not None:
+            offset, length = header["data"]
+            coco._shared_data = buffers[offset : offset + length]
+        trigram_index, unindexed = header["regex_index"]
+        iso2_index, iso2_unindexed, iso2_searchable = header["iso2_index"]
+        coco._restore_indexes(
+            {
+                "columns": {col: _shared_column(buffers, spec) for col, spec in header["columns"].items()},
+                "regex_index": (_shared_index(buffers, trigram_index), set(unindexed)),
+                "code_index": {col: _shared_index(buffers, spec) for col, spec in header["code_index"].items()},
+                "iso2_index": (_shared_index(buffers, iso2_index), iso2_unindexed, iso2_searchable),
+            }
+        )
+        coco._output_views.update({col: _shared_column(buffers, spec) for col, spec in header["output_views"].items()})
+        return coco
+
+    def _set_columns(self, columns):
+        """Set the country table (column name -> values) and build the lookups from it."""
+        self._columns = columns
+        self.regexes = _LazyPatterns(columns["regex"])
+        self.iso2_regexes = _LazyPatterns(columns["ISO2"])
+        self._regex_matcher = _RegexMatcher(self.regexes)
+        self._build_code_indexes()
+        self.cache_clear()
+        with self._correspondence_lock:
+            self._correspondence_cache.clear()
+        self._shortcuts.clear()
+        self._numeric_tables.clear()
+        self._output_views.clear()
+        if self._resolution_store is not None:
+            self._resolution_store.close()
+        self._resolution_store = _open_resolution_store(self._resolution_store_para, columns)
 
-        for col in self.data.columns:
-            self.__setattr__(col, self.data.loc[:, ["name_short", col]].dropna())
-            self.__setattr__(col + "as", fun_provider(self.data, col))
+    @property
+    def data(self):
+        """Country data as Pandas DataFrame.
+
+        Data given as files is read by pandas at the first access, the
+        conversions do not depend on it. Setting data rebuilds all lookups.
+        """
+        if self._data is None and self._data_sources is None:
+            # converter attached to a shared file (see attach)
+            self._data = pickle.loads(self._shared_data)
+        elif self._data is None:
+            self._data = _load_country_data(*self._data_sources, reports=None)
+        return self._data
+
+    @data.setter
+    def data(self, df):
+        self._data = df
+        # the data files do not give the data anymore
+        self._data_sources = None
+        self._set_columns(_frame_to_table(df))
+
+    def __getattr__(self, name):
+        """Provide the shortcuts to all classifications.
+
+        For each classification (column of data), the attribute with the
+        same name gives the DataFrame with name_short and the classification.
+        It is built at the first access and kept until the data is set.
+        The method with the name of the classification followed by 'as'
+        gives the classification together with the classification passed.
+        """
+        columns = self.__dict__.get("_columns")
+        if columns is not None and not name.startswith("_"):
+            if name in columns:
+                shortcut = self._shortcuts.get(name)
+                if shortcut is None:
+                    shortcut = self._shortcuts.setdefault(name, self.data.loc[:, ["name_short", name]].dropna())
+                return shortcut
+            if name.endswith("as") and name[:-2] in columns:
+                return functools.partial(self._classification_as, name[:-2])
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __dir__(self):
+        """Include the classification shortcuts."""
+        return [*super().__dir__(), *self._columns, *(col + "as" for col in self._columns)]
+
+    def _classification_as(self, datacol, to):
+        """Get the classification datacol together with the classification to."""
+        ret = self.data.loc[:, [to, datacol]]
+        if to in ["ISO2", "ISO3"]:
+            ret = ret.assign(**{to: list(self._output_view(to))})
+        return ret.dropna()
 
     def convert(
         self,
@@ -488,6 +1868,7 @@ class CountryConverter:
         enforce_list=False,
         not_found="not found",
         exclude_prefix=None,
+        n_jobs=None,
     ):
         r"""Convert names from a list to another list.
 
@@ -533,11 +1914,23 @@ class CountryConverter:
             'China excluding Hong Kong' becomes 'China' prior to conversion
             Default: ['excl\\w.*', 'without', 'w/o'])
 
+        n_jobs : int, optional
+            Number of processes used to match the unique names. Pass -1 to
+            use all CPUs. Worth it for many (thousands of) distinct names
+            which need the regular expression search, the names are then
+            distributed in chunks over a process pool. Default: None (one
+            process).
+
         Returns
         -------
         list or str, depending on enforce_list
 
         """
+        stats = self._stats
+        if stats is not None:
+            start = time.perf_counter()
+            cache_hits = self._convert_name_cached.cache_info().hits
+
         if exclude_prefix is None:
             exclude_prefix = ["excl\\w.*", "without", "w/o"]
 
@@ -550,89 +1943,244 @@ class CountryConverter:
         else:
             names = [str(names)]
 
-        outlist = names.copy()
+        to = self._validate_input_para(to, self.valid_class)
+        if src is not None:
+            src = self._validate_input_para(src, self.valid_class)
+        exclude_prefix = tuple(exclude_prefix)
+
+        converted = {}
+        if n_jobs is not None and n_jobs != 1:
+            converted = self._convert_parallel(names, src, to, exclude_prefix, n_jobs)
+
+        outlist = []
+        for name in names:
+            entries = list(converted.get(name) or self._convert_name_cached(name, src, to, not_found, exclude_prefix))
+            if entries[0] is _NOT_FOUND:
+                _fillin = not_found or entries[1]
+                outlist.append([_fillin] if enforce_list else _fillin)
+            elif len(entries) == 1 and enforce_list is False:
+                outlist.append(entries[0])
+            else:
+                outlist.append(entries)
 
-        to = [self._validate_input_para(to, self.data.columns.tolist())]
+        if stats is not None:
+            stats.count("convert_calls")
+            stats.count("names", len(names))
+            stats.count("cache_hits", self._convert_name_cached.cache_info().hits - cache_hits)
+            stats.observe("convert", time.perf_counter() - start)
 
-        exclude_split = {name: self._separate_exclude_cases(name, exclude_prefix) for name in names}
+        if (len(outlist) == 1) and not enforce_list:
+            return outlist[0]
+        else:
+            return outlist
 
-        for ind_names, current_name in enumerate(names):
-            spec_name = exclude_split[current_name]["clean_name"]
+    def cache_info(self):
+        """Statistics of the conversion cache (see cache_size of CountryConverter).
 
-            if src is None:
-                src_format = self._get_input_format_from_name(spec_name)
-            else:
-                src_format = self._validate_input_para(src, self.data.columns.tolist())
-
-            # if src_format.lower() == "regex":
-            if src_format.lower() in ["regex", "iso2"]:
-                result_list = []
-                # for ind_regex, ccregex in enumerate(self.regexes):
-                if src_format.lower() == "iso2":
-                    regexes = self.iso2_regexes
-                elif src_format.lower() == "regex":
-                    regexes = self.regexes
-                for ind_regex, ccregex in enumerate(regexes):
-                    if ccregex.search(spec_name):
-                        result_list.append(self.data.loc[ind_regex, to].to_numpy()[0])
-                    if len(result_list) > 1:
-                        log.warning(f"More than one regular expression match for {spec_name}")
+        Returns
+        -------
+        namedtuple (hits, misses, maxsize, currsize), see functools.lru_cache
+        """
+        return self._convert_name_cached.cache_info()
 
-            else:
-                _match_col = self.data[src_format].astype(str).str.replace("\\..*", "", regex=True)
-
-                result_list = [
-                    etr[0]
-                    for etr in self.data[
-                        _match_col.str.contains(
-                            "^" + re.escape(spec_name) + "$",
-                            flags=re.IGNORECASE,
-                            na=False,
-                        )
-                    ][to].to_numpy()
-                ]
+    def cache_clear(self):
+        """Clear the conversion cache and its statistics."""
+        self._convert_name_cached.cache_clear()
 
-            if len(result_list) == 0:
-                log.warning(f"{spec_name} not found in {src_format}")
-                _fillin = not_found or spec_name
-                outlist[ind_names] = [_fillin] if enforce_list else _fillin
-            else:
-                outlist[ind_names] = []
-                for etr in result_list:
-                    if to[0].lower() in ["iso2", "iso3"]:
-                        # remove regex characters from output
-                        etr = "".join(c for c in etr.split("|")[0] if c.isalnum()).upper()
+    def stats(self):
+        """Snapshot of the conversion statistics (see collect_stats of CountryConverter).
+
+        Returns
+        -------
+        dict with
+            'enabled': bool, whether statistics are collected
+            'counters': dict with the number of
+                convert_calls, pandas_convert_calls, names (passed to
+                convert), cache_hits, resolved (names passed through the
+                stages below), regex_evaluations (regexes searched after the
+                trigram prefilter), store_hits (names found in the resolution
+                store), not_found and multiple_matches
+            'stages': dict stage -> {'count', 'total' (seconds), 'buckets'}
+                for the stages convert and pandas_convert (whole calls) and
+                exclude (exclude_prefix splitting), detect (format
+                detection), regex (regex search), lookup (code indexes) and
+                output (formatting of the result) of each resolved name.
+                'buckets' is a list of (upper bound in seconds, count).
+            Names converted in a process pool (n_jobs) are not timed per
+            stage.
+        """
+        if self._stats is None:
+            return {"enabled": False, "counters": {}, "stages": {}}
+        return {"enabled": True, **self._stats.snapshot()}
 
-                    try:
-                        conv_etr = int(etr)
-                    except ValueError:
-                        conv_etr = etr
-                    outlist[ind_names].append(conv_etr)
+    def stats_clear(self):
+        """Reset all counters and histograms of the conversion statistics."""
+        if self._stats is not None:
+            self._stats.clear()
 
-                if len(outlist[ind_names]) == 1 and enforce_list is False:
-                    outlist[ind_names] = outlist[ind_names][0]
+    def _convert_name(self, name, src, to, not_found, exclude_prefix):
+        """Convert a single name, see convert for the parameters.
 
-        if (len(outlist) == 1) and not enforce_list:
-            return outlist[0]
+        src and to must be validated classifications (src can be None),
+        exclude_prefix a tuple.
+
+        Returns
+        -------
+        tuple of the converted entries, or (_NOT_FOUND, name without the
+        excluded part) if the name was not found
+        """
+        if self._stats is not None:
+            return self._convert_name_timed(name, src, to, exclude_prefix)
+        return self._format_resolution(*self._resolve_name(name, src, exclude_prefix), to)
+
+    def _convert_name_timed(self, name, src, to, exclude_prefix):
+        """Convert a single name as _convert_name, recording each stage in the statistics."""
+        stats = self._stats
+        start = time.perf_counter()
+        spec_name = self._separate_exclude_cases(name, exclude_prefix)["clean_name"]
+        split = time.perf_counter()
+        stats.observe("exclude", split - start)
+        if src is None:
+            src_format = self._get_input_format_from_name(spec_name)
+            detected = time.perf_counter()
+            stats.observe("detect", detected - split)
+            split = detected
         else:
-            return outlist
+            src_format = src
+
+        result_rows = self._find_rows(spec_name, src_format, stats)
+        found = time.perf_counter()
+        stats.observe("regex" if src_format.lower() == "regex" else "lookup", found - split)
+
+        entries = self._format_resolution(spec_name, src_format, result_rows, to)
+        stats.observe("output", time.perf_counter() - found)
+        stats.count("resolved")
+        if entries[0] is _NOT_FOUND:
+            stats.count("not_found")
+        elif len(result_rows) > 1:
+            stats.count("multiple_matches")
+        return entries
+
+    def _convert_parallel(self, names, src, to, exclude_prefix, n_jobs):
+        """Convert the unique names in a process pool.
+
+        Returns
+        -------
+        dict: name -> converted entries (see _convert_name)
+        """
+        import concurrent.futures
+
+        unique_names = list(dict.fromkeys(names))
+        if n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        n_jobs = min(n_jobs, math.ceil(len(unique_names) / _MIN_NAMES_PER_JOB))
+        if n_jobs <= 1:
+            return {}
+
+        # several chunks per process to balance the load
+        chunk_size = math.ceil(len(unique_names) / (n_jobs * 4))
+        chunks = [unique_names[pos : pos + chunk_size] for pos in range(0, len(unique_names), chunk_size)]
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=n_jobs, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            resolutions = executor.map(_resolve_chunk, chunks, [src] * len(chunks), [exclude_prefix] * len(chunks))
+            return {
+                name: self._format_resolution(*resolution, to)
+                for chunk, chunk_resolutions in zip(chunks, resolutions)
+                for name, resolution in zip(chunk, chunk_resolutions)
+            }
+
+    def _format_resolution(self, spec_name, src_format, result_rows, to):
+        """Get the entries of classification 'to' for the rows found for a name.
+
+        See _convert_name for the returned tuple.
+        """
+        if len(result_rows) > 1 and src_format.lower() in ["regex", "iso2"]:
+            log.warning(f"More than one regular expression match for {spec_name}")
+
+        if len(result_rows) == 0:
+            log.warning(f"{spec_name} not found in {src_format}")
+            return (_NOT_FOUND, spec_name)
+
+        output_view = self._output_view(to)
+        return tuple(output_view[row] for row in result_rows)
+
+    def _output_view(self, to):
+        """Get the entries of classification 'to' as returned by the conversions.
+
+        The view is built at the first use and kept until the data is set:
+        ISO2 and ISO3 entries without regex characters (first alternative,
+        upper case) and integers for all entries which are integers.
+
+        Returns
+        -------
+        list with the output entry of each row
+        """
+        output_view = self._output_views.get(to)
+        if output_view is None:
+            output_view = []
+            for etr in self._columns[to]:
+                if to.lower() in ["iso2", "iso3"] and isinstance(etr, str):
+                    # remove regex characters from output
+                    etr = "".join(c for c in etr.split("|")[0] if c.isalnum()).upper()
+                try:
+                    etr = int(etr)
+                except (TypeError, ValueError):
+                    pass
+                output_view.append(etr)
+            output_view = self._output_views.setdefault(to, output_view)
+        return output_view
+
+    def _resolve_name(self, name, src, exclude_prefix):
+        """Find the rows of the country table matching a name.
+
+        Returns
+        -------
+        tuple (name without the excluded part, source classification, list of rows)
+        """
+        spec_name = self._separate_exclude_cases(name, exclude_prefix)["clean_name"]
+        src_format = self._get_input_format_from_name(spec_name) if src is None else src
+        return spec_name, src_format, self._find_rows(spec_name, src_format)
+
+    def _find_rows(self, spec_name, src_format, stats=None):
+        """Find the rows of the country table for a name in classification src_format."""
+        src_lower = src_format.lower()
+        if src_lower == "regex":
+            result_rows = self._regex_rows(spec_name, stats)
+        elif src_lower == "iso2":
+            if len(spec_name) == 2:
+                result_rows = self._iso2_index.get(spec_name.upper(), []) + [
+                    ind_regex for ind_regex in self._iso2_unindexed if self.iso2_regexes[ind_regex].search(spec_name)
+                ]
+                result_rows.sort()
+            else:
+                # ISO2 entries are regular expressions, names which can
+                # not be a plain code keep the original search semantic
+                result_rows = [
+                    ind_regex for ind_regex in self._iso2_searchable if self.iso2_regexes[ind_regex].search(spec_name)
+                ]
+        else:
+            result_rows = self._code_index[src_format].get(_case_key(spec_name), [])
+        return result_rows
 
     def pandas_convert(
         self,
-        series: pd.Series,
+        series: "pd.Series",
         src=None,
         to="ISO3",
         enforce_list=False,
         not_found="not found",
         exclude_prefix=None,
+        as_categorical=False,
+        n_jobs=None,
     ):
         r"""Convert names from a Pandas Series to another Pandas Series.
 
         Using this method is faster than using the convert method when dealing with
-        long Pandas Series. Depending on the size of the series, the performance increase
-        can be very significant. The longer the series, the more significant the
-        improvement. Note that if the series contains mostly unique values, more
-        memory will be used, compared to the convert method.
+        long Pandas Series. Only the unique values of the series are converted,
+        the result is then assembled from the integer codes of the series
+        (see pandas.factorize). Depending on the size of the series, the
+        performance increase can be very significant.
 
         Parameters
         ----------
@@ -667,11 +2215,22 @@ class CountryConverter:
             'China excluding Hong Kong' becomes 'China' prior to conversion
             Default: ['excl\\w.*', 'without', 'w/o'])
 
+        as_categorical : boolean, optional
+            If True, return the result as categorical Series (the categories
+            being the converted names). This requires a single result for
+            each name. Default: False
+
+        n_jobs : int, optional
+            Number of processes used for the conversion, see convert.
+
         Returns
         -------
         A Pandas Series containing list or str, depending on enforce_list
 
         """
+        import numpy as np
+        import pandas as pd
+
         if not isinstance(series, pd.Series):
             raise TypeError("Input must be a Pandas Series")
 
@@ -679,37 +2238,368 @@ class CountryConverter:
         if src == to:
             return series
 
-        # Get the unique values for mapping.
-        s_unique = series.unique()
+        stats = self._stats
+        if stats is not None:
+            start = time.perf_counter()
+
+        if not enforce_list and not as_categorical and _is_integer_series(series):
+            numeric_src = "ISOnumeric" if src is None else self._validate_input_para(src, self.valid_class)
+            if self._numeric_table(numeric_src) is not None:
+                result = self.numeric_convert(series, src=numeric_src, to=to, not_found=not_found)
+                if stats is not None:
+                    stats.count("pandas_convert_calls")
+                    stats.observe("pandas_convert", time.perf_counter() - start)
+                return result
+
+        # Integer codes into the unique values, only these get converted.
+        codes, uniques = pd.factorize(series)
+        uniques = list(uniques)
+        missing = codes < 0
+        if missing.any():
+            # missing values are converted like any other entry
+            codes[missing] = len(uniques)
+            uniques.append(series.iloc[int(missing.argmax())])
+
+        converted = self.convert(
+            names=uniques,
+            src=src,
+            to=to,
+            not_found=not_found,
+            enforce_list=True,
+            exclude_prefix=exclude_prefix,
+            n_jobs=n_jobs,
+        )
 
-        # Create a correspondence dictionary
-        mapping = pd.Series(
+        unique_values = np.empty(len(uniques), dtype=object)
+        for pos, (name, entry) in enumerate(zip(uniques, converted)):
+            if not enforce_list and len(entry) == 1:
+                entry = entry[0]
+                if pd.isna(entry):
+                    entry = name if not_found is None else not_found
+            unique_values[pos] = entry
+        unique_values = pd.Series(unique_values)
+
+        if as_categorical:
+            if unique_values.map(lambda entry: isinstance(entry, list)).any():
+                raise ValueError("Names with multiple matches can not be returned as categorical")
+            category_codes, categories = pd.factorize(unique_values)
+            result = pd.Series(
+                pd.Categorical.from_codes(category_codes.take(codes), categories),
+                index=series.index,
+                name=series.name,
+            )
+        else:
+            # integer entries give an integer Series (as Series.map)
+            result = pd.Series(unique_values.array.take(codes), index=series.index, name=series.name).infer_objects()
+
+        if stats is not None:
+            stats.count("pandas_convert_calls")
+            stats.observe("pandas_convert", time.perf_counter() - start)
+        return result
+
+    def numeric_convert(self, codes, src="ISOnumeric", to="ISO3", not_found="not found"):
+        """Convert integer codes of a numeric classification by direct lookup.
+
+        For classifications with unique, non-negative integer codes (e.g.
+        ISOnumeric, UNcode, FAOcode, GBDcode, GEOnumeric, DACcode), a table
+        mapping each code to its row is built at the first use. The codes
+        are then converted with numpy take, without converting them
+        to strings. pandas_convert uses this for integer Series.
+
+        Parameters
+        ----------
+        codes : numpy array or Pandas Series of integers
+            Codes of classification 'src', Series may use a nullable integer
+            type (missing values are not found)
+
+        src : str, optional
+            Numeric source classification, default: ISOnumeric
+
+        to : str, optional
+            Output classification, default: ISO3
+
+        not_found : str, optional
+            Fill in value for codes not found. If None, the codes are passed
+            through (as str, as in convert) and missing values are kept.
+            Default: 'not found'
+
+        Returns
+        -------
+        numpy object array or Pandas Series (same as codes, the dtype of the
+        Series is inferred as in pandas_convert)
+        """
+        import numpy as np
+        import pandas as pd
+
+        src = self._validate_input_para(src, self.valid_class)
+        to = self._validate_input_para(to, self.valid_class)
+        table = self._numeric_table(src)
+        if table is None:
+            raise ValueError(f"{src} does not consist of unique integer codes")
+
+        series = codes if hasattr(codes, "isna") else None
+        if series is not None:
+            missing = series.isna().to_numpy()
+            values = series.to_numpy(dtype=np.int64, na_value=-1) if missing.any() else series.to_numpy()
+        else:
+            values = np.asarray(codes)
+            missing = np.zeros(len(values), dtype=bool)
+        if values.dtype.kind not in "iu":
+            raise TypeError("Codes must be integers")
+
+        # the table holds the row + 1 of each code, 0 for codes not found
+        index = values
+        if len(values) and (values.min() < 0 or values.max() >= len(table)):
+            # out of the table (negative codes wrap around): address its last entry (0)
+            index = values.astype(np.uint64)
+            np.minimum(index, len(table) - 1, out=index)
+        slots = table.take(index)
+
+        outputs = self._output_view(to)
+        if not_found is None:
+            # classification 'to' without entry: pass the code through (as in convert)
+            row_codes = {key_rows[0]: int(key) for key, key_rows in self._code_index[src].items()}
+        outputs = [
+            (row_codes.get(row) if not_found is None else not_found) if _isna(output) else output
+            for row, output in enumerate(outputs)
+        ]
+        # Labels of the entries into outputs
+        if len(values) and all(isinstance(output, str) for output in [*outputs, not_found or ""]):
+            # the strings of all rows give the same result type as the strings of the rows in use
+            labels = slots.astype(np.intp)
+            outputs.insert(0, not_found or "")
+            not_found_label = 0
+        else:
+            # only the rows in use enter the result, as the unique values in pandas_convert
+            used_rows = np.flatnonzero(np.bincount(slots, minlength=len(outputs) + 1)[1:])
+            position = np.empty(len(outputs) + 1, dtype=np.intp)
+            position[used_rows + 1] = np.arange(len(used_rows))
+            position[0] = not_found_label = len(used_rows)
+            labels = position.take(slots)
+            outputs = [outputs[row] for row in used_rows]
+
+        not_found_pos = slots == 0
+        if not_found_pos.any():
+            subset = series[not_found_pos] if missing.any() else values[not_found_pos]
+            nf_labels, nf_codes = pd.factorize(subset)
+            for code in nf_codes:
+                log.warning(f"{code} not found in {src}")
+            if missing.any():
+                log.warning(f"{series[missing].iloc[0]} not found in {src}")
+            if not_found is None:
+                # codes not found are passed through as str (as in convert)
+                nf_labels[nf_labels < 0] = len(nf_codes)
+                labels[not_found_pos] = len(outputs) + nf_labels
+                outputs.extend(str(code) for code in nf_codes)
+                if missing.any():
+                    # missing values stay missing
+                    outputs.append(series[missing].iloc[0])
+            elif not_found_label == len(outputs):
+                outputs.append(not_found)
+
+        unique_values = np.empty(len(outputs), dtype=object)
+        unique_values[:] = outputs
+        if series is not None:
+            result = pd.Series(pd.Series(unique_values).array.take(labels), index=series.index, name=series.name)
+            return result.infer_objects()
+        return unique_values.take(labels)
+
+    def _numeric_table(self, src):
+        """Get the direct lookup table (code -> row + 1) of a numeric classification.
+
+        Returns
+        -------
+        numpy int array with the row + 1 of each code (0 for unused codes) and
+        a trailing 0, or None if the codes of src are not unique non-negative
+        integers (up to _MAX_DIRECT_CODE)
+        """
+        if src not in self._numeric_tables:
+            import numpy as np
+
+            table = None
+            code_rows = self._code_index[src]
+            if code_rows and all(key.isdigit() and len(rows) == 1 for key, rows in code_rows.items()):
+                max_code = max(int(key) for key in code_rows)
+                if max_code < _MAX_DIRECT_CODE:
+                    # the smallest integer type holding all rows keeps the table in the cache
+                    table = np.zeros(max_code + 2, dtype=np.min_scalar_type(len(self._columns[src])))
+                    for key, rows in code_rows.items():
+                        table[int(key)] = rows[0] + 1
+                    table.flags.writeable = False
+            self._numeric_tables[src] = table
+        return self._numeric_tables[src]
+
+    def arrow_convert(
+        self,
+        array,
+        src=None,
+        to="ISO3",
+        not_found="not found",
+        exclude_prefix=None,
+    ):
+        r"""Convert names given as dictionary encoded Apache Arrow array.
+
+        Only the dictionary (the distinct values) of the array is converted,
+        the indices of the array are reused unchanged for the result. Thus the
+        conversion does not depend on the number of rows. Arrays which are not
+        dictionary encoded are encoded first.
+
+        Parameters
+        ----------
+        array : pyarrow.Array or pyarrow.ChunkedArray
+            Countries in 'src' classification to convert to 'to'
+            classification, preferably dictionary encoded. The dictionaries
+            of the chunks of a ChunkedArray are unified before the conversion.
+
+        src : str, optional
+            Source classification, see convert.
+
+        to : str, optional
+            Output classification (valid index of the country_data file),
+            default: ISO3
+
+        not_found : str, optional
+            Fill in value for none found entries. If None, keep the input value
+            (default: 'not found')
+
+        exclude_prefix : list of valid regex strings
+            See convert. Default: ['excl\\w.*', 'without', 'w/o'])
+
+        Returns
+        -------
+        pyarrow.DictionaryArray or pyarrow.ChunkedArray (as the input) with the
+        converted names as dictionary. Different names converting to the same
+        entry (e.g. 'DE' and 'Germany') result in duplicated dictionary
+        values. Missing values (also missing entries in the 'to'
+        classification) are null. The dictionary is of string type if the
+        converted entries are not of the same type.
+
+        """
+        import pyarrow as pa
+
+        if isinstance(array, pa.ChunkedArray):
+            if not pa.types.is_dictionary(array.type):
+                array = array.dictionary_encode()
+            array = array.unify_dictionaries()
+            dictionary = array.chunk(0).dictionary if array.num_chunks else pa.array([], type=array.type.value_type)
+            dictionary = self._convert_arrow_dictionary(dictionary, src, to, not_found, exclude_prefix)
+            return pa.chunked_array(
+                [pa.DictionaryArray.from_arrays(chunk.indices, dictionary) for chunk in array.chunks],
+                type=pa.dictionary(array.type.index_type, dictionary.type),
+            )
+
+        if not pa.types.is_dictionary(array.type):
+            array = array.dictionary_encode()
+        dictionary = self._convert_arrow_dictionary(array.dictionary, src, to, not_found, exclude_prefix)
+        return pa.DictionaryArray.from_arrays(array.indices, dictionary)
+
+    def distributed_convert(
+        self,
+        series,
+        src=None,
+        to="ISO3",
+        enforce_list=False,
+        not_found="not found",
+        exclude_prefix=None,
+    ):
+        r"""Convert names in a partitioned (Dask or Modin) Series.
+
+        The distinct values of the whole series are computed and converted
+        once. The resulting mapping (a small pandas Series) is then applied to
+        each partition, without shipping the CountryConverter to the workers.
+
+        Parameters
+        ----------
+        series : dask.dataframe.Series, modin.pandas.Series or pandas Series
+            Countries in 'src' classification to convert to 'to'
+            classification.
+
+        src, to, enforce_list, not_found, exclude_prefix:
+            See pandas_convert
+
+        Returns
+        -------
+        Series of the same type as the input (lazy for Dask)
+
+        """
+        import pandas as pd
+
+        if hasattr(series, "map_partitions"):
+            # dask: one task computes the distinct values, the mapping is a
+            # single node of the graph shared by all partitions
+            import dask
+
+            uniques = series.drop_duplicates().compute()
+            mapping = self._distinct_mapping(uniques.to_numpy(), src, to, enforce_list, not_found, exclude_prefix)
+            return series.map_partitions(
+                _apply_mapping,
+                dask.delayed(mapping, pure=True),
+                meta=pd.Series(dtype=object, name=series.name),
+            )
+
+        # modin (and pandas) series: map with the mapping of the distinct values
+        mapping = self._distinct_mapping(series.unique(), src, to, enforce_list, not_found, exclude_prefix)
+        return series.map(mapping)
+
+    def _distinct_mapping(self, uniques, src, to, enforce_list, not_found, exclude_prefix):
+        """Get a pandas Series mapping the distinct names (index) to their conversion."""
+        import pandas as pd
+
+        uniques = pd.Index(uniques)
+        converted = self.pandas_convert(
+            pd.Series(uniques, dtype=object),
+            src=src,
+            to=to,
+            enforce_list=enforce_list,
+            not_found=not_found,
+            exclude_prefix=exclude_prefix,
+        )
+        return pd.Series(converted.to_numpy(), index=uniques, dtype=object)
+
+    def _convert_arrow_dictionary(self, dictionary, src, to, not_found, exclude_prefix):
+        """Convert the values of the dictionary of an Arrow array (see arrow_convert)."""
+        import pyarrow as pa
+
+        names = dictionary.to_pylist()
+        converted = iter(
             self.convert(
-                names=s_unique,
+                [name for name in names if name is not None],
                 src=src,
                 to=to,
+                enforce_list=True,
                 not_found=not_found,
-                enforce_list=enforce_list,
                 exclude_prefix=exclude_prefix,
-            ),
-            index=s_unique,
-        ).to_dict()
+            )
+        )
+        values = []
+        for name in names:
+            if name is None:
+                values.append(None)
+                continue
+            entry = next(converted)
+            if len(entry) > 1:
+                raise ValueError(f"{name} has multiple matches, which can not be part of a dictionary array")
+            values.append(None if _isna(entry[0]) else entry[0])
 
-        return series.map(mapping).fillna(series if not_found is None else not_found)
+        try:
+            return pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.array([None if value is None else str(value) for value in values], type=pa.string())
 
     @property
     def valid_class(self):
         """Valid strings for the converter."""
-        return list(self.data.columns)
+        return list(self._columns)
 
     @property
     def valid_country_classifications(self):
         """All classifications available for countries without any aggregation."""
-        return [
-            cname
-            for cname in self.data.columns
-            if not (self.data[cname].dropna().duplicated().any() or cname == "obsolete")
-        ]
+        classifications = []
+        for cname, values in self._columns.items():
+            defined = [value for value in values if not _isna(value)]
+            if cname != "obsolete" and len(set(defined)) == len(defined):
+                classifications.append(cname)
+        return classifications
 
     def get_correspondence_dict(self, classA, classB, restrict=None, replace_numeric=True, replace_nan=None):
         """Return a correspondence between classification A and B as dict.
@@ -746,7 +2636,67 @@ class CountryConverter:
             keys: based on classA
             items: list of corresponding entries in classB or None
 
+        Note
+        ----
+        The correspondences are cached per instance. Changes of the data done
+        in place (cc.data.loc[...] = ...) are not reflected, assign the data
+        (cc.data = df) to reset the cache.
+
         """
+        entry = self._correspondence(classA, classB, restrict, replace_numeric, replace_nan)
+        # copies, the cached table must not be altered
+        return {key: list(values) for key, values in entry["dict"].items()}
+
+    def get_correspondence_codes(self, classA, classB, restrict=None, replace_numeric=True, replace_nan=None):
+        """Return a correspondence between classification A and B as index arrays.
+
+        Same correspondence as get_correspondence_dict (see there for the
+        parameters), given as integer codes into the distinct entries.
+
+        Returns
+        -------
+        namedtuple CorrespondenceCodes with
+            classes_a: list
+                entries of classA (sorted, the keys of get_correspondence_dict)
+            classes_b: list
+                distinct entries of classB
+            codes_a, codes_b: read-only numpy int arrays
+                each position i gives one correspondence
+                classes_a[codes_a[i]] - classes_b[codes_b[i]]
+
+        """
+        entry = self._correspondence(classA, classB, restrict, replace_numeric, replace_nan)
+        if "codes" not in entry:
+            import pandas as pd
+
+            pairs = entry["pairs"].dropna(subset=[classA])
+            codes_a, classes_a = pd.factorize(pairs[classA], sort=True)
+            codes_b, classes_b = _factorize_with_na(pairs[classB])
+            codes_a.flags.writeable = False
+            codes_b.flags.writeable = False
+            entry["codes"] = CorrespondenceCodes(list(classes_a), list(classes_b), codes_a, codes_b)
+        codes = entry["codes"]
+        return codes._replace(classes_a=list(codes.classes_a), classes_b=list(codes.classes_b))
+
+    def _correspondence(self, classA, classB, restrict, replace_numeric, replace_nan):
+        """Get the (cached) correspondence table of classA and classB.
+
+        The tables are kept in a least recently used cache of the instance,
+        keyed by the parameters (restrict by a hash of its content).
+
+        Returns
+        -------
+        dict with
+            'pairs': DataFrame with the distinct pairs of (classA, classB)
+            'dict': the correspondence dict (see get_correspondence_dict)
+        """
+        key = (classA, classB, replace_numeric, replace_nan, _restrict_key(restrict))
+        with self._correspondence_lock:
+            entry = self._correspondence_cache.get(key)
+            if entry is not None:
+                self._correspondence_cache.move_to_end(key)
+                return entry
+
         if restrict is None:
             df_corr = self.data.loc[:, [classA, classB]].copy()
         else:
@@ -761,12 +2711,68 @@ class CountryConverter:
                 df_corr.loc[~df_corr[classB].isna(), classB] = classB
                 df_corr.loc[df_corr[classB].isna(), classB] = None
             if df_corr[classA].dtype.kind in "bifc":
+                df_corr = df_corr.astype("object")
                 df_corr.loc[~df_corr[classA].isna(), classA] = classA
                 df_corr.loc[df_corr[classA].isna(), classA] = None
 
-        result = df_corr.groupby(classA).agg(lambda x: list(x.unique())).to_dict()[classB]
-
-        return result
+        # distinct pairs in order of appearance: the same as the unique
+        # entries of classB for each group of classA
+        pairs = df_corr.drop_duplicates().reset_index(drop=True)
+        entry = {"pairs": pairs, "dict": pairs.groupby(classA, sort=True)[classB].agg(list).to_dict()}
+
+        with self._correspondence_lock:
+            self._correspondence_cache[key] = entry
+            while len(self._correspondence_cache) > _CORRESPONDENCE_CACHE_SIZE:
+                self._correspondence_cache.popitem(last=False)
+        return entry
+
+    def _regex_rows(self, name, stats=None):
+        """Get the rows with a regular expression matching name (using the resolution store)."""
+        if self._resolution_store is None:
+            return self._regex_matcher.match(name, stats)
+        rows = self._resolution_store.get(name)
+        if rows is None:
+            rows = self._regex_matcher.match(name, stats)
+            self._resolution_store.put(name, rows)
+        elif stats is not None:
+            stats.count("store_hits")
+        return rows
+
+    def _build_code_indexes(self):
+        """Build the hash indexes used for exact code lookups in convert.
+
+        For each classification, the entries are normalized to the key used
+        for matching (string representation up to the first '.', case folded)
+        and mapped to the rows (positions in data) containing them.
+
+        ISO2 entries are given as regular expressions in the country data
+        file. Entries consisting of (anchored) plain two character codes are
+        indexed by each of the codes (upper case), all others are kept for a
+        regular expression search in '_iso2_unindexed'. Empty entries (no
+        ISO2 code available) are not matched at all.
+        """
+        self._code_index = {}
+        for col, values in self._columns.items():
+            col_index = {}
+            for row, value in enumerate(values):
+                if _isna(value):
+                    continue
+                col_index.setdefault(_case_key(str(value).partition(".")[0]), []).append(row)
+            self._code_index[col] = col_index
+
+        self._iso2_index = {}
+        self._iso2_unindexed = []
+        self._iso2_searchable = []
+        for row, entry in enumerate(self._columns["ISO2"]):
+            if entry == "":
+                continue
+            self._iso2_searchable.append(row)
+            codes = [_ISO2_CODE.fullmatch(alternative) for alternative in entry.split("|")]
+            if all(codes):
+                for code in codes:
+                    self._iso2_index.setdefault(code.group(1).upper(), []).append(row)
+            else:
+                self._iso2_unindexed.append(row)
 
     def _validate_input_para(self, para, column_names):
         """Convert the input classification para to the correct df column name.
@@ -827,6 +2833,45 @@ class CountryConverter:
         return src_format
 
 
+def _is_integer_series(series):
+    """Check if a Pandas Series holds integers (numpy or nullable integer dtype)."""
+    return getattr(series.dtype, "kind", None) in ("i", "u")
+
+
+def _init_worker(coco):
+    """Initialize a process converting names for CountryConverter._convert_parallel."""
+    global _worker_converter
+    _worker_converter = coco
+
+
+def _resolve_chunk(names, src, exclude_prefix):
+    """Resolve names in a worker process (see CountryConverter._resolve_name)."""
+    return [_worker_converter._resolve_name(name, src, exclude_prefix) for name in names]
+
+
+def _restrict_key(restrict):
+    """Hash of a restrict vector (see CountryConverter.get_correspondence_dict)."""
+    if restrict is None:
+        return None
+    import pandas as pd
+
+    if not isinstance(restrict, pd.Series):
+        restrict = pd.Series(list(restrict))
+    return hashlib.sha256(pd.util.hash_pandas_object(restrict).to_numpy().tobytes()).hexdigest()
+
+
+def _apply_mapping(part, mapping):
+    """Convert a partition with the mapping of CountryConverter.distributed_convert."""
+    import pandas as pd
+
+    return pd.Series(
+        mapping.to_numpy().take(mapping.index.get_indexer(part)),
+        index=part.index,
+        name=part.name,
+        dtype=object,
+    )
+
+
 def _parse_arg(valid_classifications):
     """Command line parser for coco.
 
@@ -920,8 +2965,44 @@ def _parse_arg(valid_classifications):
         ),
     )
 
+    parser.add_argument(
+        "-I",
+        "--input",
+        help=(
+            "Streaming mode: read the names from this file ('-' for stdin) "
+            "instead of the command line and write the input rows together "
+            "with the converted names to stdout, chunk by chunk."
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=["lines", "csv", "tsv"],
+        help=(
+            "Format of the input in streaming mode: one name per line or "
+            "comma/tab separated data (default: based on the file extension, "
+            "otherwise lines)"
+        ),
+    )
+    parser.add_argument(
+        "-c",
+        "--column",
+        default="1",
+        help=("Column with the names in csv/tsv input, given as header name or number starting at 1 (default: 1)"),
+    )
+    parser.add_argument(
+        "--no_header",
+        action="store_true",
+        help=("Flag for csv/tsv input without a header row"),
+    )
+    parser.add_argument(
+        "--chunk_size",
+        type=int,
+        default=10000,
+        help=("Number of rows converted at once in streaming mode (default: 10000)"),
+    )
+
     args = parser.parse_args()
-    if not args.names:
+    if not args.names and not args.input:
         parser.print_help()
 
     return args
@@ -929,8 +3010,8 @@ def _parse_arg(valid_classifications):
 
 def cli_output(conv_names, sep):
     """Provide cli_output - helper function."""
-    pd.options.display.max_rows = len(str(conv_names))
-    if type(conv_names) is pd.DataFrame:
+    if _is_dataframe(conv_names):
+        sys.modules["pandas"].options.display.max_rows = len(str(conv_names))
         if len(conv_names.columns) == 1:
             conv_names = conv_names.iloc[:, 0].tolist()
         elif len(conv_names.columns) == 2:
@@ -940,25 +3021,115 @@ def cli_output(conv_names, sep):
     print(sep.join([str(etr) for etr in conv_names] if isinstance(conv_names, list) else [str(conv_names)]))
 
 
+def _stream_convert(
+    coco,
+    infile,
+    outfile,
+    src=None,
+    to="name_short",
+    not_found="not found",
+    sep=" ",
+    input_format="lines",
+    column="1",
+    header=True,
+    chunk_size=10000,
+):
+    """Convert names read from infile and write them to outfile, chunk by chunk.
+
+    Helper for the streaming mode of the command line interface. For 'lines'
+    input, the converted name is written for each line. For 'csv'/'tsv'
+    input, each row is written with the converted names of the given column
+    (header name or number starting at 1) appended. Multiple matches are
+    joined by sep. Only chunk_size rows and the conversions of the distinct
+    names seen recently are kept in memory.
+    """
+    if input_format == "lines":
+        reader = (line.rstrip("\r\n") for line in infile)
+        writer = None
+        col_pos = 0
+    else:
+        delimiter = "\t" if input_format == "tsv" else ","
+        reader = csv.reader(infile, delimiter=delimiter)
+        writer = csv.writer(outfile, delimiter=delimiter, lineterminator="\n")
+        header_row = next(reader, None) if header else None
+        if header_row is not None and column in header_row:
+            col_pos = header_row.index(column)
+        else:
+            try:
+                col_pos = int(column) - 1
+            except ValueError as err:
+                raise KeyError(f"Column {column} not found in the input") from err
+        if header_row is not None:
+            writer.writerow([*header_row, to])
+
+    converted = {}
+    while True:
+        chunk = list(itertools.islice(reader, chunk_size))
+        if not chunk:
+            break
+        names = [row if writer is None else (row[col_pos] if col_pos < len(row) else "") for row in chunk]
+        chunk_names = [name for name in dict.fromkeys(names) if name != ""]
+        new_names = [name for name in chunk_names if name not in converted]
+        if len(converted) + len(new_names) > _STREAM_CACHE_SIZE:
+            # keep only the conversions needed for this chunk
+            converted = {name: converted[name] for name in chunk_names if name in converted}
+        if new_names:
+            results = coco.convert(new_names, src=src, to=to, enforce_list=True, not_found=not_found)
+            for name, result in zip(new_names, results):
+                converted[name] = sep.join(str(entry) for entry in result)
+        for row, name in zip(chunk, names):
+            conv_name = converted.get(name, "")
+            if writer is None:
+                outfile.write(conv_name + "\n")
+            else:
+                writer.writerow([*row, conv_name])
+        outfile.flush()
+
+
 def main():
     """Use for command line call."""
-    args = _parse_arg(CountryConverter().valid_class)
+    args = _parse_arg(shared_converter().valid_class)
 
     args.output_sep = args.output_sep or " "
     args.src = args.src or None
     args.not_found = args.not_found if args.not_found != "None" else None
     args.to = args.to if args.to else "name_short"
 
-    coco = CountryConverter(
+    coco = shared_converter(
         additional_data=args.additional_data,
         include_obsolete=args.include_obsolete,
         only_UNmember=args.UNmember_only,
     )
 
+    if args.input:
+        input_format = args.format
+        if input_format is None:
+            extension = os.path.splitext(args.input)[1].lower()
+            input_format = extension[1:] if extension in [".csv", ".tsv"] else "lines"
+        with contextlib.ExitStack() as stack:
+            if args.input == "-":
+                names_file = sys.stdin
+            else:
+                names_file = stack.enter_context(open(args.input, encoding="utf-8", newline=""))
+            _stream_convert(
+                coco,
+                names_file,
+                sys.stdout,
+                src=args.src,
+                to=args.to,
+                not_found=args.not_found,
+                sep=args.output_sep,
+                input_format=input_format,
+                column=args.column,
+                header=not args.no_header,
+                chunk_size=args.chunk_size,
+            )
+        sys.exit()
+
     if len(args.names) == 1:
         name = args.names[0]
 
-        if name in coco.data.columns:
+        if name in coco.valid_class:
             res = coco.get_correspondence_dict(name, args.to)
             for k, v in res.items():
                 if len(res.keys()) > 1:
@@ -0,0 +1,123 @@
+"""Polars integration of the country converter.
+
+Importing this module registers the namespace 'coco' for Polars expressions
+and series:
+
+    import polars as pl
+    import country_converter.polars_namespace  # noqa: F401
+
+    lf.with_columns(pl.col("country").coco.convert(to="ISO3"))
+
+The distinct values of each batch are converted by a CountryConverter and
+mapped to the rows with Series.replace_strict, thus the conversion works in
+LazyFrame pipelines without collecting the data into pandas.
+"""
+
+import polars as pl
+
+from country_converter.country_converter import _isna, shared_converter
+
+
+def _batch_converter(src, to, not_found, exclude_prefix, coco, return_dtype):
+    """Get the function converting a batch (Series) of names.
+
+    The conversions of all distinct names seen so far are kept, thus each
+    name is converted only once per expression.
+    """
+    converted = {}
+
+    def convert_batch(series):
+        names = series.drop_nulls().unique().to_list()
+        new_names = [name for name in names if name not in converted]
+        if new_names:
+            results = (coco or shared_converter()).convert(
+                [str(name) for name in new_names],
+                src=src,
+                to=to,
+                enforce_list=True,
+                not_found=not_found,
+                exclude_prefix=exclude_prefix,
+            )
+            for name, entry in zip(new_names, results):
+                if len(entry) > 1:
+                    raise ValueError(f"{name} has multiple matches, which can not be returned in a Polars column")
+                value = None if _isna(entry[0]) else entry[0]
+                if return_dtype == pl.String:
+                    value = None if value is None else str(value)
+                elif isinstance(value, str):
+                    # fill in values for not found names do not fit numeric columns
+                    value = None
+                converted[name] = value
+
+        return series.replace_strict(
+            names,
+            [converted[name] for name in names],
+            default=None,
+            return_dtype=return_dtype,
+        )
+
+    return convert_batch
+
+
+@pl.api.register_expr_namespace("coco")
+class CocoExprNamespace:
+    """Country conversion of Polars expressions (namespace 'coco')."""
+
+    def __init__(self, expr):
+        self._expr = expr
+
+    def convert(
+        self,
+        src=None,
+        to="ISO3",
+        not_found="not found",
+        exclude_prefix=None,
+        coco=None,
+        return_dtype=pl.String,
+    ):
+        """Convert the names of the expression, see CountryConverter.convert.
+
+        Parameters
+        ----------
+        src, to, not_found, exclude_prefix:
+            See CountryConverter.convert
+
+        coco : CountryConverter, optional
+            Instance used for the conversion. If None (default), the bare
+            CountryConverter (see shared_converter) is used.
+
+        return_dtype : Polars data type, optional
+            Data type of the result, default: String. For numeric types (e.g.
+            pl.Int64 for UNcode), not found names become null.
+
+        Returns
+        -------
+        Polars expression
+            Names with multiple matches raise a ValueError when the
+            expression is evaluated, missing values stay null.
+        """
+        return self._expr.map_batches(
+            _batch_converter(src, to, not_found, exclude_prefix, coco, return_dtype),
+            return_dtype=return_dtype,
+            is_elementwise=True,
+        )
+
+
+@pl.api.register_series_namespace("coco")
+class CocoSeriesNamespace:
+    """Country conversion of Polars series (namespace 'coco')."""
+
+    def __init__(self, series):
+        self._series = series
+
+    def convert(
+        self,
+        src=None,
+        to="ISO3",
+        not_found="not found",
+        exclude_prefix=None,
+        coco=None,
+        return_dtype=pl.String,
+    ):
+        """Convert the names of the series, see CocoExprNamespace.convert."""
+        return _batch_converter(src, to, not_found, exclude_prefix, coco, return_dtype)(self._series)
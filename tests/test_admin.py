@@ -1,7 +1,9 @@
 """Testing admin stuff."""
 
+import json
 import os
 import re
+import subprocess
 import sys
 
 import country_converter as coco
@@ -29,3 +31,53 @@ def test_version_consistency():
     assert coco.__version__ == version_changelog, (
         f"Version module({coco.__version__}) - do not match CHANGELOG version ({version_changelog})"
     )
+
+
+def test_benchmarks(tmp_path):
+    """Test the benchmark script runs and writes comparable results."""
+    script = os.path.join(TESTPATH, "..", "benchmarks", "run_benchmarks.py")
+    result_file = tmp_path / "results.json"
+    subprocess.run(
+        [sys.executable, script, "--scale", "0.001", "--repeat", "1", "-k", "agg_conc", "-o", str(result_file)],
+        check=True,
+    )
+    with open(result_file) as rf:
+        results = json.load(rf)
+    assert set(results["benchmarks"]) == {"agg_conc_full", "agg_conc_dict"}
+    assert results["benchmarks"]["agg_conc_full"]["peak_memory"] > 0
+    assert results["metadata"]["versions"]["country_converter"] == coco.__version__
+
+
+def test_benchmarks_unsupported(monkeypatch):
+    """Test that benchmarks which can not run are reported without aborting the others."""
+    sys.path.insert(0, os.path.join(TESTPATH, "..", "benchmarks"))
+    try:
+        import run_benchmarks
+    finally:
+        sys.path.pop(0)
+
+    def unsupported():
+        raise AttributeError("no such feature")
+
+    monkeypatch.setattr(
+        run_benchmarks,
+        "_workloads",
+        lambda scale: [
+            ("bench_unsupported", unsupported),
+            ("bench_failing", lambda: ({}, lambda: coco.convert("Austria", src="no_classification"))),
+            ("bench_ok", lambda: ({}, lambda: coco.convert("Austria"))),
+        ],
+    )
+    results = run_benchmarks.run_benchmarks(repeat=1, select="bench")["benchmarks"]
+    assert results["bench_unsupported"] == {"skipped": "AttributeError: no such feature"}
+    assert "error" in results["bench_failing"]
+    assert results["bench_ok"]["wall_time"]["runs"]
+    assert "bench_ok" in run_benchmarks.compare({"benchmarks": results}, {"benchmarks": results})
+
+
+def test_bundled_data_up_to_date():
+    """Test the prebuilt module of the bundled data matches country_data.tsv."""
+    from country_converter import _bundle
+
+    with open(_bundle.BUNDLED_MODULE_FILE, encoding="utf-8") as bf:
+        assert bf.read() == _bundle.module_source(), "Run 'python -m country_converter._bundle' to update it"
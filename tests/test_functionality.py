@@ -1,8 +1,15 @@
 """Testing the country_converter functionality."""
 
 import collections
+import concurrent.futures
+import contextlib
+import copy
+import io
 import logging
 import os
+import pickle
+import sqlite3
+import subprocess
 import sys
 import warnings
 from collections import OrderedDict
@@ -108,6 +115,156 @@ def test_alternative_names(get_regex_test_data):
         )
 
 
+def test_regex_matcher(get_regex_test_data):
+    """Test the combined regex matcher gives the same rows as searching all regexes."""
+    converter = coco.CountryConverter(include_obsolete=True)
+    names = [
+        *get_regex_test_data.data.name_test,
+        *converter.data.name_official,
+        "Türkiye",
+        "\u0130stanbul",
+        "KOREA, REP.",
+    ]
+    for name in names:
+        expected = [row for row, regex in enumerate(converter.regexes) if regex.search(name)]
+        assert converter._regex_matcher.match(name) == expected, f"Mismatch for {name}"
+
+
+def test_regex_multiple_matches(caplog):
+    """Test multiple regex matches are returned and reported."""
+    cc = coco.CountryConverter()
+    result = cc.convert("Sweden and Norway", src="regex", to="ISO3")
+    assert result == ["NOR", "SWE"]
+    assert "More than one regular expression match for Sweden and Norway" in caplog.text
+
+
+def test_conversion_cache():
+    """Test the LRU cache of conversions."""
+    cc = coco.CountryConverter(cache_size=2)
+    names = ["Korea, Rep.", "Viet Nam", "Korea, Rep.", "xyz"]
+    assert cc.convert(names, to="ISO3") == ["KOR", "VNM", "KOR", "not found"]
+    assert cc.cache_info().hits == 1
+    assert cc.cache_info().misses == 3
+    assert cc.cache_info().currsize == 2
+
+    # different parameters are cached separately, results can not be altered
+    assert cc.convert("xyz", to="ISO3", not_found=None) == "xyz"
+    result = cc.convert("Korea, Rep.", to="ISO3", enforce_list=True)
+    result[0].append("PRK")
+    assert cc.convert("Korea, Rep.", to="ISO3", enforce_list=True) == [["KOR"]]
+
+    cc.cache_clear()
+    assert cc.cache_info().currsize == 0
+    assert cc.cache_info().hits == 0
+    assert coco.CountryConverter().cache_info().maxsize == 0
+
+
+def test_conversion_stats():
+    """Test the opt-in statistics of conversions."""
+    assert coco.CountryConverter().stats() == {"enabled": False, "counters": {}, "stages": {}}
+
+    cc = coco.CountryConverter(cache_size=10, collect_stats=True)
+    assert cc.convert(["Korea, Rep.", "DE", "xyz", "Korea, Rep.", "Sweden and Norway"], to="ISO3")[:3] == [
+        "KOR",
+        "DEU",
+        "not found",
+    ]
+    cc.convert("USA", src="ISO3", to="ISO2")
+    cc.pandas_convert(pd.Series(["Austria", "Austria"]))
+    stats = cc.stats()
+    assert stats["enabled"]
+    counters = stats["counters"]
+    assert counters["convert_calls"] == 3
+    assert counters["pandas_convert_calls"] == 1
+    assert counters["names"] == 7
+    assert counters["cache_hits"] == 1
+    assert counters["resolved"] == 6
+    assert counters["not_found"] == 1
+    assert counters["multiple_matches"] == 1
+    assert counters["regex_evaluations"] >= 3
+    assert stats["stages"]["convert"]["count"] == 3
+    assert stats["stages"]["lookup"]["count"] == 3
+    assert stats["stages"]["regex"]["count"] == 3
+    assert stats["stages"]["detect"]["count"] == 5
+    for stage in stats["stages"].values():
+        assert sum(count for _, count in stage["buckets"]) == stage["count"]
+        assert stage["total"] >= 0
+
+    cc.stats_clear()
+    assert cc.stats() == {"enabled": True, "counters": {}, "stages": {}}
+
+
+def test_pickle():
+    """Test pickling converters (compact state, caches start empty)."""
+    cc = coco.CountryConverter(cache_size=10, collect_stats=True)
+    cc.convert(["Korea, Rep.", "Viet Nam"], to="ISO3")
+    assert cc.EU.shape[0] > 0
+    restored = pickle.loads(pickle.dumps(cc))
+    assert restored.convert(["Korea, Rep.", "Viet Nam", "DE"], to="ISO3") == ["KOR", "VNM", "DEU"]
+    assert restored.cache_info().maxsize == 10
+    assert restored.stats()["counters"]["convert_calls"] == 1
+    assert_frame_equal(restored.EU, cc.EU)
+
+    custom = coco.CountryConverter(additional_data=pd.read_csv(custom_data, sep="\t"))
+    restored = pickle.loads(pickle.dumps(custom))
+    assert restored.convert("virtlando", to="name_short") == "Wirtland"
+    assert_frame_equal(restored.data, custom.data)
+
+    cc.data = cc.data[cc.data.ISO3 != "AUT"]
+    restored = copy.deepcopy(cc)
+    assert restored.convert("Austria", to="ISO3") == "not found"
+    assert len(restored.data) == len(cc.data)
+
+
+def _attached_convert(path, names):
+    """Convert names with the converter attached from path (in a worker process)."""
+    return coco.CountryConverter.attach(path).convert(names, to="name_short")
+
+
+def test_share_attach(tmp_path):
+    """Test sharing a converter with worker processes through a memory mapped file."""
+    custom = coco.CountryConverter(additional_data=pd.read_csv(custom_data, sep="\t"))
+    path = custom.share(tmp_path / "coco.bin")
+    names = ["virtlando", "Korea, Rep.", "DE"]
+    attached = coco.CountryConverter.attach(path)
+    assert attached.convert(names, to="name_short") == ["Wirtland", "South Korea", "Germany"]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(_attached_convert, [path] * 2, [names] * 2))
+    assert results == [["Wirtland", "South Korea", "Germany"]] * 2
+
+    # the table and the indexes are read in place from the file, not copied
+    assert isinstance(attached._columns["ISOnumeric"], coco.country_converter._SharedColumn)
+    assert isinstance(attached._code_index["ISO3"], coco.country_converter._SharedIndex)
+    for col, values in custom._columns.items():
+        assert list(attached._columns[col]) == pytest.approx(values, nan_ok=True), col
+        assert dict(attached._code_index[col].items()) == custom._code_index[col], col
+    assert attached.convert(["Austria", "276", "xyz"], to="ISO2") == ["AT", "DE", "not found"]
+    assert attached.pandas_convert(pd.Series([40, 276]), src="ISOnumeric", to="ISO3").tolist() == ["AUT", "DEU"]
+    pd.testing.assert_frame_equal(attached.data, custom.data)
+    restored = pickle.loads(pickle.dumps(attached))
+    assert type(restored._columns["ISO3"]) is list
+    assert restored.convert(names, to="name_short") == ["Wirtland", "South Korea", "Germany"]
+
+    default_path = coco.CountryConverter().share(tmp_path / "default.bin")
+    default = coco.CountryConverter.attach(default_path)
+    assert default._data_sources[0] == coco.country_converter.COUNTRY_DATA_FILE
+    assert default.convert("Wirtland") == "not found"
+
+    (tmp_path / "other.pkl").write_bytes(pickle.dumps({"no": "converter"}))
+    with pytest.raises(TypeError):
+        coco.CountryConverter.attach(tmp_path / "other.pkl")
+
+
+def test_parallel_conversion(monkeypatch):
+    """Test the conversion of names in a process pool."""
+    monkeypatch.setattr(coco.country_converter, "_MIN_NAMES_PER_JOB", 2)
+    cc = coco.CountryConverter(additional_data=custom_data)
+    names = ["Congo", "Sweden and Norway", "xyz", "DE", "Korea, Rep.", "Congo", "Viet Nam", "276", "wirtland"]
+    expected = cc.convert(names, to="name_short", not_found=None)
+    assert cc.convert(names, to="name_short", not_found=None, n_jobs=2) == expected
+    assert cc.convert(names, to="ISO3", enforce_list=True, n_jobs=-1) == cc.convert(names, to="ISO3", enforce_list=True)
+
+
 def test_toISO2_conversion():
     """Test conversion to ISO2 country codes."""
     converter = coco.CountryConverter()
@@ -124,6 +281,38 @@ def test_toISO2_conversion():
     assert "TR" == converter.convert("TUR", src="ISO3", to="ISO2")
 
 
+def test_exact_code_lookup():
+    """Test the hash index based lookup of exact codes."""
+    cc = coco.CountryConverter()
+    assert "Germany" == cc.convert("deu", src="ISO3", to="name_short")
+    assert "Germany" == cc.convert("276", src="UNcode", to="name_short")
+    assert "AUT" == cc.convert(40, to="ISO3")
+    assert "BRA" == cc.convert("21", src="FAOcode", to="ISO3")
+    assert cc.convert("WA", src="EXIO3", to="ISO3") == cc.data[cc.data.EXIO3 == "WA"].ISO3.tolist()
+    # missing entries must not be matched by their string representation
+    assert "not found" == cc.convert("nan", src="OECD", to="ISO3")
+    assert "not found" == cc.convert("<NA>", src="UNcode", to="ISO3")
+    # case insensitive as the regular expressions (re.IGNORECASE)
+    assert "IND" == cc.convert("\u0130ndia", src="name_short", to="ISO3")
+    assert "SWE" == cc.convert("\u017fweden", src="name_short", to="ISO3")
+    assert "KEN" == cc.convert("\u212aENYA", src="name_short", to="ISO3")
+    for row in cc.data.itertuples():
+        assert row.name_short == cc.convert(row.ISO3, src="ISO3", to="name_short")
+        assert row.name_short == cc.convert(int(row.ISOnumeric), src="ISOnumeric", to="name_short")
+
+
+def test_iso2_index_lookup():
+    """Test ISO2 lookups, including codes given as regular expression."""
+    cc = coco.CountryConverter(include_obsolete=True)
+    assert "AUT" == cc.convert("AT", to="ISO3")
+    assert "AUT" == cc.convert("at", src="ISO2", to="ISO3")
+    assert "GRC" == cc.convert("EL", to="ISO3")
+    assert "GBR" == cc.convert("uk", to="ISO3")
+    assert "not found" == cc.convert("XY", to="ISO3")
+    # names which can not be a ISO2 code are still searched by the regexes
+    assert "AUT" == cc.convert("AT.", src="ISO2", to="ISO3")
+
+
 def test_additional_country_file():
     """Test loading additional country data from file."""
     converter_basic = coco.CountryConverter()
@@ -151,6 +340,200 @@ def test_additional_country_data():
     assert pd.isna(converter_extended.convert("XXX", src="ISO3", to="continent"))
 
 
+def test_validated_data_files(tmp_path, monkeypatch, caplog):
+    """Test that data files validated before are not checked for duplicates again."""
+    monkeypatch.setattr(coco.country_converter, "_VALIDATED_HASHES", set())
+    checked = []
+    test_table = coco.country_converter._test_table_for_unique_names
+    monkeypatch.setattr(
+        coco.country_converter,
+        "_test_table_for_unique_names",
+        lambda table, *args, **kwargs: checked.append(table) or test_table(table, *args, **kwargs),
+    )
+    with open(custom_data, encoding="utf-8") as cf:
+        content = cf.read()
+    add_file = tmp_path / "additional.tsv"
+    add_file.write_text(content, encoding="utf-8")
+    duplicated_file = tmp_path / "duplicated.tsv"
+    lines = content.splitlines()
+    duplicated_file.write_text("\n".join([*lines, lines[-1]]) + "\n", encoding="utf-8")
+
+    coco.CountryConverter(include_obsolete=True, additional_data=add_file)
+    assert len(checked) == 3
+    checked.clear()
+    # only the merged data is checked
+    cc = coco.CountryConverter(include_obsolete=True, additional_data=add_file)
+    assert len(checked) == 1
+    assert cc.convert("wirtland", to="name_short") == "Wirtland"
+    coco.CountryConverter(include_obsolete=True, additional_data=add_file, strict_validation=True)
+    assert len(checked) == 4
+
+    for _ in range(2):
+        caplog.clear()
+        coco.CountryConverter(include_obsolete=True, additional_data=duplicated_file)
+        assert "Duplicated values in column name_short of" in caplog.text
+
+
+def test_snapshot(tmp_path, caplog):
+    """Test the binary snapshot of the country data."""
+    add_file = tmp_path / "additional.tsv"
+    with open(custom_data, encoding="utf-8") as cf:
+        add_file.write_text(cf.read(), encoding="utf-8")
+    snapshot_dir = tmp_path / "snapshots"
+
+    fresh = coco.CountryConverter(additional_data=str(add_file), snapshot_dir=snapshot_dir)
+    snapshots = list(snapshot_dir.iterdir())
+    assert len(snapshots) == 1
+
+    caplog.clear()
+    cached = coco.CountryConverter(additional_data=str(add_file), snapshot_dir=snapshot_dir)
+    assert "Duplicated values in column name_short of merged data" in caplog.text
+    assert list(snapshot_dir.iterdir()) == snapshots
+    assert_frame_equal(fresh.data, cached.data)
+    names = ["Congo", "DE", "276", "Korea, Rep.", "EL"]
+    assert fresh.convert(names, to="FAOcode") == cached.convert(names, to="FAOcode")
+    assert cached.convert("Congo") == "COD"
+
+    # changes in any data file invalidate the snapshot
+    with open(add_file, "a", encoding="utf-8") as af:
+        af.write("\n")
+    coco.CountryConverter(additional_data=str(add_file), snapshot_dir=snapshot_dir)
+    coco.CountryConverter(additional_data=str(add_file), snapshot_dir=snapshot_dir, include_obsolete=True)
+    assert len(list(snapshot_dir.iterdir())) == 3
+
+    # broken snapshots are ignored
+    for snapshot in snapshot_dir.iterdir():
+        snapshot.write_bytes(b"broken")
+    assert coco.CountryConverter(additional_data=str(add_file), snapshot_dir=snapshot_dir).convert("Congo") == "COD"
+
+
+def test_bundled_data(tmp_path, monkeypatch):
+    """Test the prebuilt state of the bundled data."""
+    from country_converter import _bundled_data
+
+    cc = coco.CountryConverter()
+    assert cc._columns is _bundled_data.STATE["columns"]
+    data_copy = tmp_path / "country_data.tsv"
+    with open(coco.country_converter.COUNTRY_DATA_FILE, "rb") as df:
+        data_copy.write_bytes(df.read())
+    parsed = coco.CountryConverter(country_data=str(data_copy))
+    assert parsed._columns is not _bundled_data.STATE["columns"]
+    assert_frame_equal(cc.data, parsed.data)
+    names = ["Congo", "DE", "276", "Korea, Rep.", "EL", "Sweden and Norway"]
+    for to in ["ISO3", "ISO2", "UNcode", "name_short"]:
+        assert cc.convert(names, to=to) == parsed.convert(names, to=to)
+
+    # an outdated module is not used
+    monkeypatch.setattr(_bundled_data, "DATA_HASH", "outdated")
+    assert coco.CountryConverter()._columns is not _bundled_data.STATE["columns"]
+
+
+def test_snapshot_env(tmp_path, monkeypatch):
+    """Test the snapshot directory given by the environment."""
+    monkeypatch.setenv("COCO_SNAPSHOT_DIR", str(tmp_path))
+    coco.CountryConverter()
+    # the bundled data with default parameters is prebuilt (see _bundle)
+    assert len(list(tmp_path.iterdir())) == 0
+    coco.CountryConverter(include_obsolete=True)
+    assert len(list(tmp_path.iterdir())) == 1
+    coco.CountryConverter(include_obsolete=True, snapshot_dir=False)
+    coco.CountryConverter(additional_data=pd.read_csv(custom_data, sep="\t"))
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_resolution_store(tmp_path, monkeypatch, caplog):
+    """Test the persistent store of regex resolutions."""
+    store_file = tmp_path / "resolutions.sqlite"
+    names = ["Korea, Rep.", "Sweden and Norway", "xyz country"]
+    cc = coco.CountryConverter(resolution_store=store_file)
+    expected = cc.convert(names, to="ISO3")
+    assert expected == ["KOR", ["NOR", "SWE"], "not found"]
+    cc._resolution_store.close()
+
+    # a new instance uses the stored rows instead of searching the regexes
+    monkeypatch.setattr(coco.country_converter._RegexMatcher, "match", lambda self, name, stats=None: [])
+    warm = coco.CountryConverter(resolution_store=store_file)
+    assert warm.convert(names, to="ISO3") == expected
+
+    # other data gives another fingerprint, thus other entries
+    extended = coco.CountryConverter(additional_data=custom_data, resolution_store=store_file)
+    assert extended._resolution_store.fingerprint != warm._resolution_store.fingerprint
+    assert extended.convert(names, to="ISO3") == ["not found"] * 3
+
+    monkeypatch.undo()
+    # entries are visible to other instances (processes) at once, without closing the store
+    other_names = ["Rep. of Korea", "Kingdom of Sweden"]
+    shared_file = tmp_path / "shared.sqlite"
+    writer = coco.CountryConverter(resolution_store=shared_file)
+    assert writer.convert(other_names, to="ISO3") == ["KOR", "SWE"]
+    reader = coco.CountryConverter(resolution_store=shared_file)
+    assert all(reader._resolution_store.get(name) is not None for name in other_names)
+
+    # a writer holding the lock of the database delays others, failures are reported as warning
+    monkeypatch.setattr(coco.country_converter._ResolutionStore, "_TIMEOUT", 0.1)
+    blocked = coco.CountryConverter(resolution_store=shared_file)
+    with contextlib.closing(sqlite3.connect(shared_file)) as locking:
+        locking.execute("BEGIN IMMEDIATE")
+        with caplog.at_level(logging.WARNING):
+            assert blocked.convert("Republic of Austria", to="ISO3") == "AUT"
+        locking.rollback()
+    assert "Could not write to the resolution store" in caplog.text
+
+    monkeypatch.setenv("COCO_RESOLUTION_STORE", str(tmp_path / "env.sqlite"))
+    assert coco.CountryConverter()._resolution_store.store_file == str(tmp_path / "env.sqlite")
+    assert coco.CountryConverter(resolution_store=False)._resolution_store is None
+
+
+def test_conversion_without_pandas():
+    """Test that importing coco and converting names does not import pandas."""
+    code = (
+        "import sys\n"
+        "import country_converter as coco\n"
+        "assert coco.convert(['DE', 'Germany', '276'], to='ISO3') == ['DEU'] * 3\n"
+        "assert coco.CountryConverter().valid_country_classifications\n"
+        "assert 'pandas' not in sys.modules, 'pandas imported'\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=False)
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize(
+    "data_para",
+    [{}, {"include_obsolete": True}, {"only_UNmember": True}, {"additional_data": custom_data}],
+)
+def test_country_table(data_para):
+    """Test that the table used for conversions corresponds to the data."""
+    cc = coco.CountryConverter(**data_para)
+    assert list(cc._columns) == cc.data.columns.tolist()
+    for col, values in cc._columns.items():
+        expected = cc.data[col].tolist()
+        assert len(values) == len(expected)
+        for value, exp in zip(values, expected):
+            assert (pd.isna(value) and pd.isna(exp)) or value == exp, col
+
+
+def test_data_setter():
+    """Test that setting the data rebuilds the lookups."""
+    cc = coco.CountryConverter()
+    assert cc.convert("Congo") == "COG"
+    assert cc.ISO3 is cc.ISO3
+    assert "WIR" not in cc.ISO3.ISO3.tolist()
+    cc.data = pd.concat([cc.data, pd.read_csv(custom_data, sep="\t")]).drop_duplicates("name_short", keep="last")
+    assert cc.convert("Congo") == "COD"
+    assert cc.convert("wirtland", to="name_short") == "Wirtland"
+    assert "ISO3as" in dir(cc)
+    assert cc.ISO3.columns.tolist() == ["name_short", "ISO3"]
+    assert "WIR" in cc.ISO3.ISO3.tolist()
+
+    # the output entries (cleaned ISO2 codes, integers) follow the data
+    assert cc.convert("Greece", to="ISO2") == "GR"
+    assert cc.ISO3as("ISO2").set_index("ISO3").loc["GRC", "ISO2"] == "GR"
+    cc.data = cc.data.assign(ISO2=cc.data.ISO2.replace("^GR$|^EL$", "^EL$|^GR$"), UNcode=cc.data.UNcode + 1)
+    assert cc.convert("Greece", to="ISO2") == "EL"
+    assert cc.ISO3as("ISO2").set_index("ISO3").loc["GRC", "ISO2"] == "EL"
+    assert cc.convert("Austria", to="UNcode") == 41
+
+
 def test_UNmember():
     """Test filtering to UN member countries only."""
     cc = coco.CountryConverter(only_UNmember=True)
@@ -419,6 +802,49 @@ def test_build_agg_conc_exio():
     assert agg_dict_full_exio["AT"] == "EU"
 
 
+@pytest.mark.parametrize("kind", ["csr", "index"])
+def test_apply_concordance(kind):
+    """Test the csr/index concordances of agg_conc and apply_concordance."""
+    if kind == "csr":
+        pytest.importorskip("scipy")
+    full = coco.agg_conc("EXIO3", ["continent"], as_dataframe="full")
+    conc = coco.agg_conc("EXIO3", ["continent"], as_dataframe=kind)
+    assert conc.original == list(full.index)
+    assert conc.aggregated == list(full.columns)
+    if kind == "csr":
+        assert (conc.concordance.toarray() == full.to_numpy()).all()
+    else:
+        assert (full.to_numpy()[np.arange(len(conc.original)), conc.concordance] == 1).all()
+
+    rng = np.random.default_rng(1)
+    data = rng.random((len(conc.original), len(conc.original)))
+    dense = full.to_numpy()
+    np.testing.assert_allclose(coco.apply_concordance(data, conc), dense.T @ data)
+    np.testing.assert_allclose(coco.apply_concordance(data, conc, axis=1), data @ dense)
+    np.testing.assert_allclose(coco.apply_concordance(data, conc, axis="both"), dense.T @ data @ dense)
+
+    df = pd.DataFrame(data[:, :3], index=conc.original).iloc[::-1]
+    aggregated = coco.apply_concordance(df, conc)
+    assert list(aggregated.index) == conc.aggregated
+    np.testing.assert_allclose(aggregated.to_numpy(), dense.T @ data[:, :3])
+    subset = coco.apply_concordance(df.loc[["AT", "DE"]], conc)
+    assert subset.loc["Europe", 0] == pytest.approx(
+        data[conc.original.index("AT"), 0] + data[conc.original.index("DE"), 0]
+    )
+    assert subset.loc["Asia", 0] == 0
+
+    # integers and booleans are summed up as integers by both kinds of concordances
+    for int_data in [rng.integers(0, 100, size=(len(conc.original), 3)), data[:, :3] > 0.5]:
+        summed = coco.apply_concordance(int_data, conc)
+        assert summed.dtype == np.int64
+        np.testing.assert_array_equal(summed, dense.T.astype(np.int64) @ int_data.astype(np.int64))
+
+    with pytest.raises(ValueError):
+        coco.apply_concordance(data[1:], conc)
+    with pytest.raises(ValueError):
+        coco.apply_concordance(df.rename(index={"AT": "xxx"}), conc)
+
+
 def test_match():
     """Test country name matching functionality."""
     match_these = ["norway", "united_states", "china", "taiwan"]
@@ -445,6 +871,26 @@ def test_match():
     assert matching_dict["abc"] == "not_found"
 
 
+def test_match_indexed():
+    """Test match with a given converter and DataFrame output."""
+    custom = coco.CountryConverter(additional_data=custom_data)
+    list_b = ["Kingdom of Norway", "Wirtland", "Norway", "USA"]
+    matching_dict = coco.match(["norway", "virtlando", "xxx", "norway"], list_b, coco=custom)
+    assert matching_dict == {
+        "norway": ["Kingdom of Norway", "Norway"],
+        "virtlando": "Wirtland",
+        "xxx": "not_found",
+    }
+    matching_df = coco.match(["norway", "xxx", "usa"], list_b, as_dataframe=True)
+    assert matching_df.columns.tolist() == ["name_a", "name_b"]
+    assert matching_df.to_numpy().tolist() == [
+        ["norway", "Kingdom of Norway"],
+        ["norway", "Norway"],
+        ["xxx", "not_found"],
+        ["usa", "USA"],
+    ]
+
+
 def test_regex_warnings(caplog):
     """Test regex pattern warnings are logged correctly."""
     # for rec in caplog.records:
@@ -477,6 +923,43 @@ def test_wrapper_convert():
     assert "AT" == coco.convert("40", to="ISO2")
 
 
+def test_shared_converter():
+    """Test the CountryConverter instances shared by the module level functions."""
+    coco.clear_shared_converters()
+    default = coco.shared_converter()
+    assert default is coco.shared_converter()
+    assert default is coco.shared_converter(country_data=coco.country_converter.COUNTRY_DATA_FILE)
+    assert default is not coco.shared_converter(include_obsolete=True)
+    assert coco.shared_converter(additional_data=custom_data) is coco.shared_converter(additional_data=[custom_data])
+
+    add_data = pd.DataFrame.from_dict(
+        {
+            "name_short": ["xxx"],
+            "name_official": ["xxx country"],
+            "regex": ["xxx country"],
+            "ISO2": ["XX"],
+            "ISO3": ["XXX"],
+        }
+    )
+    assert coco.shared_converter(additional_data=add_data) is not coco.shared_converter(additional_data=add_data)
+
+    assert coco.convert("Congo", additional_data=custom_data) == "COD"
+    assert coco.convert("Congo") == "COG"
+
+    coco.clear_shared_converters()
+    assert default is not coco.shared_converter()
+
+
+def test_shared_converter_threads():
+    """Test that concurrent first calls build only one shared instance."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    coco.clear_shared_converters()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        instances = list(executor.map(lambda _: coco.shared_converter(only_UNmember=True), range(8)))
+    assert all(inst is instances[0] for inst in instances)
+
+
 def test_convert_wrong_classification():
     """Test error handling for invalid classification."""
     with pytest.raises(KeyError) as _:
@@ -598,6 +1081,47 @@ def test_full_cli(capsys):
     sys.argv = _sysargv
 
 
+def test_streaming_cli(capsys, monkeypatch, tmp_path):
+    """Test the streaming mode of the command line interface."""
+    in_file = tmp_path / "names.csv"
+    in_file.write_text('id,country\n1,Germany\n2,"Korea, Rep."\n3,xyz\n4,Sweden and Norway\n5,Germany\n')
+    monkeypatch.setattr(sys, "argv", ["coco", "-I", str(in_file), "-c", "country", "-t", "ISO3", "--chunk_size", "2"])
+    with pytest.raises(SystemExit):
+        coco.main()
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == [
+        "id,country,ISO3",
+        "1,Germany,DEU",
+        '2,"Korea, Rep.",KOR',
+        "3,xyz,not found",
+        "4,Sweden and Norway,NOR SWE",
+        "5,Germany,DEU",
+    ]
+
+    monkeypatch.setattr(sys, "stdin", io.StringIO("AT\n\nFrance\n"))
+    monkeypatch.setattr(sys, "argv", ["coco", "--input", "-", "--to", "ISO2"])
+    with pytest.raises(SystemExit):
+        coco.main()
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == ["AT", "", "FR"]
+
+    monkeypatch.setattr(sys, "stdin", io.StringIO("x\tAT\ny\tUSA\n"))
+    monkeypatch.setattr(sys, "argv", ["coco", "-I", "-", "--format", "tsv", "--no_header", "-c", "2", "-n", "None"])
+    with pytest.raises(SystemExit):
+        coco.main()
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == ["x\tAT\tAustria", "y\tUSA\tUnited States"]
+
+    # names converted in earlier chunks are still written when the cache is full
+    monkeypatch.setattr(coco.country_converter, "_STREAM_CACHE_SIZE", 3)
+    monkeypatch.setattr(sys, "stdin", io.StringIO("DE\nFR\nUS\nDE\nAT\nIT\nFR\n"))
+    monkeypatch.setattr(sys, "argv", ["coco", "-I", "-", "-t", "ISO3", "--chunk_size", "3"])
+    with pytest.raises(SystemExit):
+        coco.main()
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == ["DEU", "FRA", "USA", "DEU", "AUT", "ITA", "FRA"]
+
+
 def test_ISO_number_codes():
     """Test ISO 3166 numeric."""
     cc = coco.CountryConverter()
@@ -794,6 +1318,155 @@ def test_pandas_convert_options():
     assert_series_equal(convert_exclude_prefix, pandas_exclude_prefix)
 
 
+def test_pandas_convert_categorical():
+    """Test pandas_convert returning a categorical Series."""
+    test_series = pd.read_csv(f"{TESTPATH}/test_series_data.csv", header=0)
+    cc = coco.CountryConverter()
+
+    plain = cc.pandas_convert(test_series.data, to="ISO3")
+    categorical = cc.pandas_convert(test_series.data, to="ISO3", as_categorical=True)
+
+    assert isinstance(categorical.dtype, pd.CategoricalDtype)
+    assert categorical.cat.categories.is_unique
+    assert_series_equal(plain, categorical.astype(plain.dtype))
+
+    with pytest.raises(ValueError):
+        cc.pandas_convert(test_series.data, to="ISO3", enforce_list=True, as_categorical=True)
+
+
+def test_pandas_convert_missing_values():
+    """Test pandas_convert with missing values and repeated names."""
+    cc = coco.CountryConverter()
+    series = pd.Series(["AT", None, "Germany", "AT", "xxxx", None], index=list("abcdef"), name="cntry")
+
+    converted = cc.pandas_convert(series, to="ISO3", not_found="nope")
+    assert converted.tolist() == ["AUT", "nope", "DEU", "AUT", "nope", "nope"]
+    assert converted.index.tolist() == list("abcdef")
+    assert converted.name == "cntry"
+
+    assert cc.pandas_convert(series, to="FAOcode", not_found=None).tolist()[2:5] == [79, 11, "xxxx"]
+    assert cc.pandas_convert(series.iloc[:0], to="ISO3").empty
+    # numeric classifications give integer Series if all names are found
+    assert cc.pandas_convert(pd.Series(["DE", "FR"]), to="UNcode").dtype == np.int64
+
+
+def test_numeric_convert():
+    """Test the direct lookup of numeric codes and pandas_convert of integer series."""
+    cc = coco.CountryConverter()
+    codes = np.array([40, 276, 40, 9999, -4])
+    assert cc.numeric_convert(codes).tolist() == ["AUT", "DEU", "AUT", "not found", "not found"]
+    assert cc.numeric_convert(codes, src="UNcode", to="name_short", not_found=None).tolist() == [
+        "Austria",
+        "Germany",
+        "Austria",
+        "9999",
+        "-4",
+    ]
+    assert cc.numeric_convert(codes[:2], to="EU").tolist() == ["EU", "EU"]
+    assert cc.numeric_convert(np.array([756]), to="EU", not_found=None).tolist() == [756]
+    with pytest.raises(ValueError):
+        cc.numeric_convert(codes, src="ISO3")
+    with pytest.raises(TypeError):
+        cc.numeric_convert(np.array([40.0]))
+
+    series = pd.Series([40, 276, 9999, 40] * 3, index=list("abcdefghijkl"), name="cntry")
+    for para in [{}, {"src": "UNcode", "to": "name_short"}, {"to": "OECD", "not_found": None}]:
+        assert_series_equal(cc.pandas_convert(series, **para), cc.pandas_convert(series.astype(object), **para))
+    nullable = series.astype("Int64")
+    nullable.iloc[1] = pd.NA
+    assert cc.pandas_convert(nullable, to="ISO3").tolist()[:3] == ["AUT", "not found", "not found"]
+    # missing values are kept with not_found=None
+    passed = cc.pandas_convert(nullable, to="ISO3", not_found=None)
+    assert passed.iloc[0] == "AUT" and pd.isna(passed.iloc[1]) and passed.iloc[2] == "9999"
+    assert cc.pandas_convert(nullable.iloc[:0], to="ISO3").dtype == object
+    assert cc.pandas_convert(pd.Series([276, 250]), to="UNcode").tolist() == [276, 250]
+    assert cc.pandas_convert(pd.Series([276, 250]), to="UNcode").dtype == np.int64
+
+
+@pytest.mark.parametrize("scheduler", ["threads", "processes"])
+def test_distributed_convert(scheduler):
+    """Test the conversion of Dask series with one mapping of the distinct names."""
+    dd = pytest.importorskip("dask.dataframe")
+    cc = coco.CountryConverter()
+    series = pd.Series(["AT", None, "Germany", "xxxx", "Sweden and Norway", "DE"] * 4, name="cntry")
+    expected = cc.pandas_convert(series, to="ISO3", not_found=None)
+
+    converted = cc.distributed_convert(dd.from_pandas(series, npartitions=3), to="ISO3", not_found=None)
+    assert converted.compute(scheduler=scheduler).tolist() == expected.tolist()
+    assert cc.distributed_convert(series, to="ISO3", not_found=None).tolist() == expected.tolist()
+
+
+def test_arrow_convert():
+    """Test the conversion of dictionary encoded Arrow arrays."""
+    pa = pytest.importorskip("pyarrow")
+    cc = coco.CountryConverter()
+    array = pa.array(["AT", None, "Germany", "AT", "xxxx", "Kosovo"]).dictionary_encode()
+
+    converted = cc.arrow_convert(array, to="ISO3", not_found="nope")
+    assert pa.types.is_dictionary(converted.type)
+    assert converted.indices.equals(array.indices)
+    assert converted.to_pylist() == ["AUT", None, "DEU", "AUT", "nope", "XKX"]
+    # missing entries become null, mixed types strings
+    assert cc.arrow_convert(array, to="UNcode").to_pylist() == ["40", None, "276", "40", "not found", None]
+    assert cc.arrow_convert(array, to="UNcode", not_found=None).dictionary.type == pa.string()
+    assert cc.arrow_convert(pa.array(["AT", "DE"]), to="UNcode").to_pylist() == [40, 276]
+
+    chunked = pa.chunked_array(
+        [pa.array(["AT", "DE"]).dictionary_encode(), pa.array(["DE", None, "FR"]).dictionary_encode()]
+    )
+    assert cc.arrow_convert(chunked, to="ISO2").to_pylist() == ["AT", "DE", "DE", None, "FR"]
+
+    with pytest.raises(ValueError):
+        cc.arrow_convert(pa.array(["Sweden and Norway"]), src="regex")
+
+
+def test_polars_namespace():
+    """Test the coco namespace of Polars expressions and series."""
+    pl = pytest.importorskip("polars")
+    pytest.importorskip("country_converter.polars_namespace")
+    lf = pl.LazyFrame({"country": ["AT", None, "Germany", "xxxx", "Kosovo", "AT"]})
+    result = lf.select(
+        pl.col("country").coco.convert(to="ISO3").alias("iso3"),
+        pl.col("country").coco.convert(to="UNcode", return_dtype=pl.Int64).alias("un"),
+        pl.col("country").coco.convert(src="regex", to="name_short", not_found=None).alias("name"),
+    ).collect()
+    assert result["iso3"].to_list() == ["AUT", None, "DEU", "not found", "XKX", "AUT"]
+    assert result["un"].to_list() == [40, None, 276, None, None, 40]
+    assert result["un"].dtype == pl.Int64
+    assert result["name"].to_list()[2:4] == ["Germany", "xxxx"]
+
+    custom = coco.CountryConverter(additional_data=custom_data)
+    assert pl.Series(["Congo", "AT"]).coco.convert(to="ISO2", coco=custom).to_list() == ["CD", "AT"]
+    with pytest.raises(ValueError):
+        pl.Series(["Sweden and Norway"]).coco.convert(src="regex")
+
+
+def test_get_correspondence_cache():
+    """Test the cached correspondences and get_correspondence_codes."""
+    cc = coco.CountryConverter()
+    corr = cc.get_correspondence_dict("EXIO1", "continent")
+    corr["AT"].append("altered")
+    del corr["DE"]
+    assert cc.get_correspondence_dict("EXIO1", "continent")["AT"] == ["Europe"]
+    assert "DE" in cc.get_correspondence_dict("EXIO1", "continent")
+
+    early = cc.get_correspondence_dict("ISO3", "OECD", restrict=cc.data.OECD < 1970)
+    later = cc.get_correspondence_dict("ISO3", "OECD", restrict=cc.data.OECD >= 1970)
+    assert "AUT" in early and "AUT" not in later
+    assert "AUS" in later and "AUS" not in early
+
+    codes = cc.get_correspondence_codes("EXIO1", "continent")
+    assert codes.classes_a == list(cc.get_correspondence_dict("EXIO1", "continent"))
+    pairs = {}
+    for code_a, code_b in zip(codes.codes_a, codes.codes_b):
+        pairs.setdefault(codes.classes_a[code_a], []).append(codes.classes_b[code_b])
+    assert pairs == cc.get_correspondence_dict("EXIO1", "continent")
+    assert not codes.codes_a.flags.writeable
+
+    cc.data = cc.data[cc.data.ISO3 != "AUT"]
+    assert "AT" not in cc.get_correspondence_dict("EXIO1", "continent")
+
+
 def test_CC41_output():
     """Test CC41 classification outputs."""
     cc = coco.CountryConverter()